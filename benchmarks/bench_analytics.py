@@ -0,0 +1,90 @@
+"""
+Benchmark: numeric analytics over sorted columns vs. the pure-Python path.
+
+The pure-Python path is what the statistics endpoints did per request before
+the dataset store: parse every raw record into a model, collect the known
+values into a list and aggregate it with sum/len (plus a sort for the median
+and percentiles). The column path reads the sorted column built once at
+ingest by the dataset store.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_analytics
+"""
+
+import math
+import random
+import statistics
+import timeit
+
+from src.models.people import Person
+from src.services.column_analytics import histogram, percentile, summarize
+from src.services.dataset_store import ResourceTable
+
+SIZES = (82, 1_000, 10_000)
+PERCENTILES = (25, 50, 75, 90, 99)
+
+
+def make_people(count: int) -> list[dict]:
+    """Synthetic raw SWAPI people, about 10% with unknown height."""
+    rng = random.Random(count)
+    return [
+        {
+            "id": i,
+            "name": f"Person {i}",
+            "height": "unknown" if rng.random() < 0.1 else str(rng.randint(60, 260)),
+            "mass": str(rng.randint(20, 200)),
+            "gender": "male",
+            "films": [],
+            "url": f"https://swapi.dev/api/people/{i}/",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def pure_python(records: list[dict]) -> dict:
+    """Summary, percentiles and a 10-bin histogram computed from raw records."""
+    people = [Person.from_swapi(data, data["id"]) for data in records]
+    heights = sorted(p.height for p in people if p.height is not None)
+    mean = sum(heights) / len(heights)
+    low, high = heights[0], heights[-1]
+    width = (high - low) / 10
+    counts = [0] * 10
+    for value in heights:
+        counts[min(int((value - low) / width), 9)] += 1
+    return {
+        "mean": mean,
+        "median": statistics.median(heights),
+        "stddev": math.sqrt(sum((h - mean) ** 2 for h in heights) / len(heights)),
+        "percentiles": statistics.quantiles(heights, n=100, method="inclusive"),
+        "histogram": counts,
+    }
+
+
+def columnar(table: ResourceTable) -> dict:
+    """Same figures from the sorted column of the dataset store."""
+    values = table.column("height").values
+    return {
+        "summary": summarize(values),
+        "percentiles": [percentile(values, q) for q in PERCENTILES],
+        "histogram": histogram(values, 10),
+    }
+
+
+def main() -> None:
+    print(f"{'records':>8} {'pure python':>14} {'column':>12} {'speedup':>9}")
+    for size in SIZES:
+        records = make_people(size)
+        table = ResourceTable("people", records)
+        number = max(1, 20_000 // size)
+
+        python_time = timeit.timeit(lambda r=records: pure_python(r), number=number) / number
+        column_time = timeit.timeit(lambda t=table: columnar(t), number=number) / number
+        print(
+            f"{size:>8} {python_time * 1e3:>11.3f} ms {column_time * 1e3:>9.3f} ms "
+            f"{python_time / column_time:>8.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
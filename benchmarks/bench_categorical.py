@@ -0,0 +1,147 @@
+"""
+Benchmark: dictionary-encoded categorical columns and interned values.
+
+Matching: the row scan is what the list endpoints did for their categorical
+query parameters (`manufacturer`, `starship_class`, ...) before the dataset
+store: lowercase every row's value and test it. The column path is
+`ResourceTable.match`, which tests each distinct value once and combines
+the row bitmaps; the column itself is built once per snapshot and not timed.
+
+Memory: what the dataset store retains for 4,000 people decoded from JSON
+(so every string is its own object, as in a SWAPI response). Before: the
+crawled records plus their models, as the store kept them before dictionary
+encoding. After: a `ResourceTable`, which keeps interned copies of the
+records (shared with the models) plus its categorical codes and bitmaps,
+while the crawled records are released.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_categorical
+"""
+
+import gc
+import json
+import random
+import timeit
+import tracemalloc
+
+from src.models.people import Person
+from src.models.starships import Starship
+from src.services.dataset_store import CATEGORICAL_FIELDS, ResourceTable
+
+SIZES = (36, 2_000)
+MEMORY_SIZE = 4_000
+MANUFACTURERS = [
+    "Incom Corporation",
+    "Kuat Drive Yards",
+    "Sienar Fleet Systems",
+    "Corellian Engineering Corporation",
+    "Cygnus Spaceworks",
+]
+CLASSES = ["Starfighter", "Star Destroyer", "Light freighter", "Corvette", "Transport"]
+COLORS = ["blue", "brown", "yellow", "black", "red", "hazel", "unknown"]
+
+
+def make_starships(count: int) -> list[dict]:
+    """Synthetic raw SWAPI starships over a few manufacturers and classes."""
+    rng = random.Random(count)
+    return [
+        {
+            "id": i,
+            "name": f"Starship {i}",
+            "model": f"Model {i % 50}",
+            "manufacturer": rng.choice(MANUFACTURERS),
+            "starship_class": rng.choice(CLASSES),
+            "url": f"https://swapi.dev/api/starships/{i}/",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def make_people(count: int) -> str:
+    """Synthetic SWAPI people as a JSON document, like a SWAPI response."""
+    rng = random.Random(count)
+    people = [
+        {
+            "id": i,
+            "name": f"Person {i}",
+            "hair_color": rng.choice(COLORS),
+            "skin_color": rng.choice(COLORS),
+            "eye_color": rng.choice(COLORS),
+            "gender": rng.choice(["male", "female", "n/a"]),
+            "url": f"https://swapi.dev/api/people/{i}/",
+        }
+        for i in range(1, count + 1)
+    ]
+    return json.dumps(people)
+
+
+def row_scan(ships: list[Starship], manufacturer: str, starship_class: str) -> list[int]:
+    """Partial, case-insensitive match of every row, as the endpoints did."""
+    return [
+        s.id
+        for s in ships
+        if manufacturer.lower() in s.manufacturer.lower()
+        and starship_class.lower() in s.starship_class.lower()
+    ]
+
+
+def column_match(table: ResourceTable, manufacturer: str, starship_class: str) -> list[int]:
+    """The same match on the dictionary-encoded columns."""
+    rows = table.match("manufacturer", manufacturer, partial=True)
+    rows &= table.match("starship_class", starship_class, partial=True)
+    row_ids = table.row_ids()
+    return [row_ids[row] for row in table.rows_of(rows)]
+
+
+def before(document: str) -> tuple[dict[int, dict], list[Person]]:
+    """Crawled records and their models, without interning or categorical columns."""
+    records = {data["id"]: data for data in json.loads(document)}
+    return records, [Person.from_swapi(data, data["id"]) for data in records.values()]
+
+
+def after(document: str) -> ResourceTable:
+    """The dataset store table, with every categorical column built."""
+    table = ResourceTable("people", json.loads(document))
+    for field in CATEGORICAL_FIELDS["people"]:
+        table.categorical(field)
+    return table
+
+
+def retained(build, document: str) -> int:
+    """Bytes still allocated once `build` returns (temporaries released)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build(document)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    print(f"{'starships':>9} {'row scan':>12} {'column':>12} {'speedup':>9}")
+    for size in SIZES:
+        table = ResourceTable("starships", make_starships(size))
+        ships = list(table.models.values())
+        # Columns are built once per snapshot, not per request
+        column_match(table, "corp", "star")
+        number = max(1, 20_000 // size)
+
+        scan_time = timeit.timeit(lambda s=ships: row_scan(s, "corp", "star"), number=number)
+        column_time = timeit.timeit(lambda t=table: column_match(t, "corp", "star"), number=number)
+        print(
+            f"{size:>9} {scan_time / number * 1e3:>9.3f} ms {column_time / number * 1e3:>9.3f} ms "
+            f"{scan_time / column_time:>8.1f}x"
+        )
+
+    document = make_people(MEMORY_SIZE)
+    old, new = retained(before, document), retained(after, document)
+    print()
+    print(f"{MEMORY_SIZE} people from JSON: {'before':>10} {'after':>10} {'saved':>8}")
+    print(f"{'retained':<21} {old / 1e6:>7.2f} MB {new / 1e6:>7.2f} MB {(old - new) / old:>8.1%}")
+
+
+if __name__ == "__main__":
+    main()
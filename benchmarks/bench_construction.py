@@ -0,0 +1,69 @@
+"""
+Benchmark: cost of building response models, per 1,000 objects.
+
+Compares, for list summaries of people and starships:
+
+- from_swapi: parsing raw SWAPI records with full validation (what the
+  relation and search endpoints did per request)
+- validated __init__ and model_construct: building the same objects from
+  ready values
+- from_model: the path used by the endpoints, validating the values read
+  from the models stored at ingest
+
+plus the response model check FastAPI runs on what the endpoint returns
+(instances of the response model pass through without revalidation).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_construction
+"""
+
+import timeit
+
+from pydantic import BaseModel, TypeAdapter
+
+from benchmarks.bench_projection import make_records
+from src.models.people import PersonSummary
+from src.models.starships import StarshipSummary
+from src.services.dataset_store import ResourceTable
+
+COUNT = 1_000
+NUMBER = 20
+
+
+def measure(func) -> float:
+    """Latency of `func` in milliseconds (best of 5 runs, to reduce noise)."""
+    return min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1e3
+
+
+def bench(resource: str, cls: type[BaseModel]) -> dict[str, float]:
+    """Timings of each construction path for one resource."""
+    table = ResourceTable(resource, make_records(resource, COUNT))
+    models = list(table.models.values())
+    records = list(table.records.items())
+    values = [dict(cls.from_model(model).__dict__) for model in models]
+    summaries = [cls.from_model(model) for model in models]
+    adapter = TypeAdapter(list[cls])
+
+    return {
+        "from_swapi (raw records)": measure(lambda: [cls.from_swapi(d, i) for i, d in records]),
+        "validated __init__": measure(lambda: [cls(**v) for v in values]),
+        "model_construct": measure(lambda: [cls.model_construct(**v) for v in values]),
+        "from_model": measure(lambda: [cls.from_model(m) for m in models]),
+        "response model check": measure(lambda: adapter.validate_python(summaries)),
+    }
+
+
+def main() -> None:
+    print(f"{'resource':<10} {'path':<24} {'ms / 1000':>10} {'vs from_model':>14}")
+    for resource, cls in (("people", PersonSummary), ("starships", StarshipSummary)):
+        timings = bench(resource, cls)
+        for path, elapsed in timings.items():
+            print(
+                f"{resource:<10} {path:<24} {elapsed:>10.3f} "
+                f"{elapsed / timings['from_model']:>13.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark: sparse fieldsets (`?fields=`) vs. full responses.
+
+The full path is what an endpoint does without `fields`: the stored model
+(or its list summary) goes through the response model, which validates and
+serializes every field. The projected path reads only the selected
+attributes of the stored model and serializes them directly.
+
+Reports the payload size and the serialization latency of a detail response
+and of a 100-item list page for a few typical projections.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_projection
+"""
+
+import random
+import timeit
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from src.models.base import PaginatedResponse
+from src.models.people import Person, PersonSummary
+from src.models.starships import Starship, StarshipSummary
+from src.services.dataset_store import ResourceTable
+from src.services.projection import parse_fields, project
+from src.utils.pagination import paginate
+
+BASE = "https://swapi.dev/api"
+PAGE_SIZE = 100
+
+
+def make_records(resource: str, count: int) -> list[dict]:
+    """Synthetic raw SWAPI records with realistic relation lists and timestamps."""
+    rng = random.Random(count)
+    records = []
+    for i in range(1, count + 1):
+        data = {
+            "id": i,
+            "name": f"{resource.title()} {i}",
+            "films": [f"{BASE}/films/{f}/" for f in rng.sample(range(1, 7), 3)],
+            "created": "2014-12-09T13:50:51.644000Z",
+            "edited": "2014-12-20T21:17:56.891000Z",
+            "url": f"{BASE}/{resource}/{i}/",
+        }
+        if resource == "people":
+            data.update(
+                height=str(rng.randint(60, 260)),
+                mass=str(rng.randint(20, 200)),
+                hair_color="brown",
+                skin_color="fair",
+                eye_color="blue",
+                birth_year="19BBY",
+                gender="male",
+                homeworld=f"{BASE}/planets/1/",
+                starships=[f"{BASE}/starships/{s}/" for s in rng.sample(range(1, 40), 2)],
+            )
+        else:
+            data.update(
+                model="T-65 X-wing",
+                manufacturer="Incom Corporation",
+                cost_in_credits=str(rng.randint(10_000, 1_000_000)),
+                length="12.5",
+                max_atmosphering_speed="1050",
+                crew="1",
+                passengers="0",
+                cargo_capacity="110",
+                consumables="1 week",
+                hyperdrive_rating="1.0",
+                MGLT="100",
+                starship_class="Starfighter",
+                pilots=[f"{BASE}/people/{p}/" for p in rng.sample(range(1, 80), 2)],
+            )
+        records.append(data)
+    return records
+
+
+CASES = [
+    ("people", Person, PersonSummary, "name,height"),
+    ("people", Person, PersonSummary, "name,mass,film_ids"),
+    ("starships", Starship, StarshipSummary, "name,cost_in_credits"),
+]
+
+
+def measure(func, number: int) -> float:
+    """Mean latency of `func` in microseconds."""
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+def main() -> None:
+    print(
+        f"{'case':<50} {'full bytes':>10} {'proj bytes':>10} {'full us':>9} {'proj us':>9} "
+        f"{'speedup':>8}"
+    )
+    for resource, model_cls, summary_cls, fields in CASES:
+        table = ResourceTable(resource, make_records(resource, 1_000))
+        models = list(table.models.values())
+        projection = parse_fields(resource, fields)
+
+        # Detail: response model validation + full serialization vs projection
+        detail = TypeAdapter(model_cls)
+        model = models[0]
+
+        def full_detail(m=model, adapter=detail):
+            return adapter.dump_json(adapter.validate_python(m))
+
+        def projected_detail(m=model, p=projection):
+            return to_json(project(m, p))
+
+        # List page: summaries of a page vs projections of a page
+        page = TypeAdapter(PaginatedResponse[summary_cls])
+
+        def full_page(ms=models, adapter=page, convert=summary_cls.from_model):
+            result = paginate(ms, page_size=PAGE_SIZE, to_item=convert)
+            return adapter.dump_json(adapter.validate_python(result))
+
+        def projected_page(ms=models, p=projection):
+            return to_json(paginate(ms, page_size=PAGE_SIZE, to_item=lambda m: project(m, p)))
+
+        for label, full, projected, number in (
+            ("detail", full_detail, projected_detail, 5_000),
+            (f"page of {PAGE_SIZE}", full_page, projected_page, 200),
+        ):
+            full_time = measure(full, number)
+            projected_time = measure(projected, number)
+            print(
+                f"{f'{resource} {label} ?fields={fields}':<50} {len(full()):>10} "
+                f"{len(projected()):>10} {full_time:>9.1f} {projected_time:>9.1f} "
+                f"{full_time / projected_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
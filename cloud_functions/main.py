@@ -26,6 +26,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 # Imports do projeto (necessários para runtime)
 # isort: off
+from src.models import normalization  # noqa: E402  # type: ignore
 from src.services.cache_service import CacheService  # noqa: E402  # type: ignore
 from src.services.swapi_client import SWAPIClient  # noqa: E402  # type: ignore
 # isort: on
@@ -734,8 +735,8 @@ async def handle_rankings(request: Request, swapi: SWAPIClient) -> tuple:
 
         with_height = []
         for p in all_people:
-            try:
-                height = int(p.get("height", "0").replace(",", ""))
+            height = normalization.parse_int(p.get("height"))
+            if height is not None:
                 with_height.append(
                     {
                         "id": extract_id(p.get("url", "")),
@@ -744,8 +745,6 @@ async def handle_rankings(request: Request, swapi: SWAPIClient) -> tuple:
                         "gender": p.get("gender"),
                     }
                 )
-            except (ValueError, TypeError):
-                continue
 
         sorted_list = sorted(with_height, key=lambda x: x["height"], reverse=True)
         return make_response(sorted_list[:limit])
@@ -754,23 +753,20 @@ async def handle_rankings(request: Request, swapi: SWAPIClient) -> tuple:
     if len(path_parts) >= 2 and path_parts[1] == "heaviest":
         all_people = await swapi.get_all_people()
 
+        # Massa desconhecida fica de fora (não vira 0)
         with_mass = []
         for p in all_people:
-            try:
-                mass_str = p.get("mass", "0").replace(",", "").replace("unknown", "0")
-                mass = int(float(mass_str))
-                if mass > 0:
-                    with_mass.append(
-                        {
-                            "id": extract_id(p.get("url", "")),
-                            "name": p.get("name"),
-                            "mass": mass,
-                            "height": p.get("height"),
-                            "gender": p.get("gender"),
-                        }
-                    )
-            except (ValueError, TypeError):
-                continue
+            mass = normalization.parse_number(p.get("mass"))
+            if mass is not None:
+                with_mass.append(
+                    {
+                        "id": extract_id(p.get("url", "")),
+                        "name": p.get("name"),
+                        "mass": mass,
+                        "height": normalization.parse_int(p.get("height")),
+                        "gender": p.get("gender"),
+                    }
+                )
 
         sorted_list = sorted(with_mass, key=lambda x: x["mass"], reverse=True)
         return make_response(sorted_list[:limit])
@@ -800,8 +796,8 @@ async def handle_rankings(request: Request, swapi: SWAPIClient) -> tuple:
 
         with_speed = []
         for s in all_starships:
-            try:
-                mglt = int(s.get("MGLT", "0"))
+            mglt = normalization.parse_int(s.get("MGLT"))
+            if mglt is not None:
                 with_speed.append(
                     {
                         "id": extract_id(s.get("url", "")),
@@ -810,8 +806,6 @@ async def handle_rankings(request: Request, swapi: SWAPIClient) -> tuple:
                         "mglt": mglt,
                     }
                 )
-            except (ValueError, TypeError):
-                continue
 
         sorted_list = sorted(with_speed, key=lambda x: x["mglt"], reverse=True)
         return make_response(sorted_list[:limit])
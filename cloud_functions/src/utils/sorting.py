@@ -3,6 +3,7 @@
 from typing import Any, Callable, TypeVar
 
 from src.models.base import SortOrder
+from src.models.normalization import parse_birth_year
 
 T = TypeVar("T")
 
@@ -56,7 +57,13 @@ PEOPLE_SORT_KEYS: dict[str, Callable] = {
     "name": lambda p: p.name.lower() if hasattr(p, "name") else p.get("name", "").lower(),
     "height": lambda p: p.height if hasattr(p, "height") else p.get("height"),
     "mass": lambda p: p.mass if hasattr(p, "mass") else p.get("mass"),
-    "birth_year": lambda p: (p.birth_year if hasattr(p, "birth_year") else p.get("birth_year", "")),
+    # In-universe order ("41.9BBY" before "19BBY"), not the string order; models carry
+    # the year parsed at ingest
+    "birth_year": lambda p: (
+        p.birth_year_aby
+        if hasattr(p, "birth_year_aby")
+        else parse_birth_year(p.birth_year if hasattr(p, "birth_year") else p.get("birth_year"))
+    ),
 }
 
 STARSHIP_SORT_KEYS: dict[str, Callable] = {
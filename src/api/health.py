@@ -2,15 +2,20 @@
 
 from fastapi import APIRouter
 
+from src.dependencies import get_dataset_store
+
 router = APIRouter(tags=["Health"])
 
 
 @router.get("/health")
 async def health_check() -> dict:
     """Health check endpoint for load balancers and monitoring."""
+    changes = get_dataset_store().last_changes
     return {
         "status": "healthy",
         "service": "starwars-api",
+        # Records added, updated and removed by the last dataset refresh (None before the first)
+        "last_changes": None if changes is None else changes.counts(),
     }
 
 
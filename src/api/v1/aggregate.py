@@ -0,0 +1,123 @@
+"""Group-by aggregation API endpoints."""
+
+from fastapi import APIRouter, HTTPException, Query
+
+from src.dependencies import get_dataset_store
+from src.models.analytics import AggregateGroup, AggregateResult
+from src.services.aggregation import (
+    Aggregate,
+    AggregationError,
+    aggregate,
+    group_rows,
+    parse_aggregate,
+)
+from src.services.dataset_store import (
+    CATEGORICAL_FIELDS,
+    NUMERIC_FIELDS,
+    RELATED_RESOURCES,
+    DatasetStore,
+)
+from src.services.query_filter import FILTER_DESCRIPTION, FilterError, compile_filter
+from src.services.swapi_client import SWAPIError
+
+router = APIRouter()
+
+
+def compute_aggregation(
+    store: DatasetStore,
+    resource: str,
+    group_by: list[str],
+    aggregates: list[Aggregate],
+    filter_expr: str | None,
+) -> AggregateResult:
+    """Hash the (filtered) rows of a resource into groups and aggregate each group."""
+    table = store.table(resource)
+    if filter_expr:
+        rows = table.rows_of(compile_filter(resource, filter_expr).execute(table))
+    else:
+        rows = list(range(len(table)))
+
+    row_ids = table.row_ids()
+    labels = []
+    for key in group_by:
+        labels_by_id = store.group_labels(resource, key)
+        labels.append([labels_by_id[entity_id] for entity_id in row_ids])
+    groups = group_rows(labels, rows)
+
+    vectors = {a.field: table.vector(a.field) for a in aggregates if a.field is not None}
+    ordered = sorted(groups.items(), key=lambda item: (-len(item[1]), item[0]))
+    return AggregateResult(
+        resource=resource,
+        group_by=group_by,
+        aggregates=[a.name for a in aggregates],
+        filter=filter_expr,
+        total=len(ordered),
+        groups=[
+            AggregateGroup(
+                group=dict(zip(group_by, key, strict=True)),
+                values=aggregate(members, vectors, aggregates),
+            )
+            for key, members in ordered
+        ],
+    )
+
+
+@router.get(
+    "/{resource}",
+    response_model=AggregateResult,
+    summary="Group-by aggregation",
+    description=(
+        "Group the entities of a resource by one or more categorical fields or related "
+        "resources and aggregate each group, e.g. average height by gender "
+        "(`/aggregate/people?group_by=gender&agg=avg:height`) or population by climate "
+        "(`/aggregate/planets?group_by=climate&agg=sum:population`). Multi-valued fields "
+        "(climate, terrain, ...) count an entity in each of its values. Aggregates: `count`, "
+        "`count|sum|avg|min|max:<field>` and `p<0-100>:<field>`; unknown values are skipped. "
+        "Results are cached until the dataset changes."
+    ),
+)
+async def get_aggregation(
+    resource: str,
+    group_by: list[str] = Query(
+        [], description="Categorical fields or related resources (none: a single group)"
+    ),
+    agg: list[str] = Query(["count"], description="Aggregates, e.g. count, avg:height, p90:mass"),
+    filter_expr: str | None = Query(None, alias="filter", description=FILTER_DESCRIPTION),
+) -> AggregateResult:
+    """Aggregate a resource per group."""
+    if resource not in NUMERIC_FIELDS:
+        raise HTTPException(status_code=404, detail=f"Unknown resource: {resource}")
+
+    group_by = list(dict.fromkeys(group_by))
+    dependencies = {resource}
+    for key in group_by:
+        if key in RELATED_RESOURCES[resource]:
+            dependencies.add(key)
+        elif key not in CATEGORICAL_FIELDS[resource]:
+            groupable = sorted(CATEGORICAL_FIELDS[resource]) + sorted(RELATED_RESOURCES[resource])
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid group_by for {resource}. Use: {', '.join(groupable)}",
+            )
+
+    try:
+        aggregates = list(
+            dict.fromkeys(parse_aggregate(spec, NUMERIC_FIELDS[resource]) for spec in agg)
+        )
+        if filter_expr:
+            compile_filter(resource, filter_expr)
+    except (AggregationError, FilterError) as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+    store = get_dataset_store()
+
+    try:
+        await store.ensure_loaded()
+    except SWAPIError as e:
+        raise HTTPException(status_code=e.status_code or 500, detail=e.message)
+
+    return store.views.get(
+        ("aggregate", resource, tuple(group_by), tuple(aggregates), filter_expr or None),
+        dependencies,
+        lambda: compute_aggregation(store, resource, group_by, aggregates, filter_expr),
+    )
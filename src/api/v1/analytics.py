@@ -0,0 +1,162 @@
+"""Numeric analytics API endpoints."""
+
+from fastapi import APIRouter, HTTPException, Query
+
+from src.dependencies import get_dataset_store
+from src.models.analytics import (
+    ColumnAnalytics,
+    CorrelationGroup,
+    CorrelationMatrix,
+    HistogramBin,
+)
+from src.services.column_analytics import histogram, pairwise, percentile, summarize
+from src.services.dataset_store import (
+    CATEGORICAL_FIELDS,
+    NUMERIC_FIELDS,
+    RELATED_RESOURCES,
+    DatasetStore,
+)
+from src.services.swapi_client import SWAPIError
+
+router = APIRouter()
+
+
+def compute_correlation(
+    store: DatasetStore, resource: str, fields: list[str], group_by: str | None
+) -> CorrelationMatrix:
+    """Compute correlation/covariance matrices, optionally per group."""
+    table = store.table(resource)
+    vectors = [table.vector(field) for field in fields]
+
+    groups: dict[str | None, list[int]] = {None: list(range(len(table)))}
+    if group_by:
+        groups = {}
+        labels = store.group_labels(resource, group_by)
+        for row, entity_id in enumerate(table.row_ids()):
+            for label in labels[entity_id]:
+                groups.setdefault(label, []).append(row)
+
+    def _matrix(values: list[list]) -> dict[str, dict]:
+        return {a: dict(zip(fields, values[i], strict=True)) for i, a in enumerate(fields)}
+
+    result = []
+    for label, rows in sorted(groups.items(), key=lambda item: (-len(item[1]), item[0] or "")):
+        stats = pairwise(vectors, rows)
+        result.append(
+            CorrelationGroup(
+                group=label,
+                count=len(rows),
+                correlation=_matrix(stats.correlation),
+                covariance=_matrix(stats.covariance),
+                pairs=_matrix(stats.counts),
+            )
+        )
+    return CorrelationMatrix(resource=resource, fields=fields, group_by=group_by, groups=result)
+
+
+@router.get(
+    "/{resource}/correlation",
+    response_model=CorrelationMatrix,
+    summary="Correlation matrix",
+    description=(
+        "Get the Pearson correlation and covariance between numeric fields of a resource "
+        "(e.g. starship length vs cost, or people height vs mass grouped by species). Each pair "
+        "uses the entities where both values are known. `group_by` accepts a categorical field "
+        "or a related resource. Results are cached until the dataset changes."
+    ),
+)
+async def get_correlation_matrix(
+    resource: str,
+    fields: list[str] | None = Query(None, description="Numeric fields (default: all)"),
+    group_by: str | None = Query(None, description="Categorical field or related resource"),
+) -> CorrelationMatrix:
+    """Get the correlation matrix of numeric fields."""
+    if resource not in NUMERIC_FIELDS:
+        raise HTTPException(status_code=404, detail=f"Unknown resource: {resource}")
+    fields = list(dict.fromkeys(fields or NUMERIC_FIELDS[resource]))
+    invalid = [field for field in fields if field not in NUMERIC_FIELDS[resource]]
+    if invalid or len(fields) < 2:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Select at least two of: {', '.join(NUMERIC_FIELDS[resource])}",
+        )
+    dependencies = {resource}
+    if group_by in RELATED_RESOURCES[resource]:
+        dependencies.add(group_by)
+    elif group_by is not None and group_by not in CATEGORICAL_FIELDS[resource]:
+        groupable = sorted(CATEGORICAL_FIELDS[resource]) + sorted(RELATED_RESOURCES[resource])
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid group_by for {resource}. Use: {', '.join(groupable)}",
+        )
+
+    store = get_dataset_store()
+
+    try:
+        await store.ensure_loaded()
+    except SWAPIError as e:
+        raise HTTPException(status_code=e.status_code or 500, detail=e.message)
+
+    return store.views.get(
+        ("correlation", resource, tuple(fields), group_by),
+        dependencies,
+        lambda: compute_correlation(store, resource, fields, group_by),
+    )
+
+
+@router.get(
+    "/{resource}/{field}",
+    response_model=ColumnAnalytics,
+    summary="Numeric field analytics",
+    description=(
+        "Get min/max/mean/median/standard deviation, percentiles and a histogram of a numeric "
+        "field. Unknown values are excluded and counted as missing. Available fields: "
+        + "; ".join(
+            f"{resource}: {', '.join(fields)}" for resource, fields in NUMERIC_FIELDS.items()
+        )
+    ),
+)
+async def get_field_analytics(
+    resource: str,
+    field: str,
+    bins: int = Query(10, ge=1, le=100, description="Number of histogram bins"),
+    start: float | None = Query(None, description="Histogram lower bound (default: minimum)"),
+    end: float | None = Query(None, description="Histogram upper bound (default: maximum)"),
+    percentiles: list[float] = Query(
+        [25, 50, 75, 90, 99], description="Percentiles to compute (0-100)"
+    ),
+) -> ColumnAnalytics:
+    """Get the distribution of a numeric field."""
+    if resource not in NUMERIC_FIELDS:
+        raise HTTPException(status_code=404, detail=f"Unknown resource: {resource}")
+    if field not in NUMERIC_FIELDS[resource]:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid field for {resource}. Use: {', '.join(NUMERIC_FIELDS[resource])}",
+        )
+    if any(not 0 <= q <= 100 for q in percentiles):
+        raise HTTPException(status_code=400, detail="Percentiles must be between 0 and 100")
+
+    store = get_dataset_store()
+
+    try:
+        await store.ensure_loaded()
+    except SWAPIError as e:
+        raise HTTPException(status_code=e.status_code or 500, detail=e.message)
+
+    table = store.table(resource)
+    values = table.column(field).values
+    summary = store.views.get(("analytics", resource, field), [resource], lambda: summarize(values))
+    try:
+        buckets = histogram(values, bins, start, end)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return ColumnAnalytics(
+        resource=resource,
+        field=field,
+        missing=len(table) - summary.count,
+        **summary._asdict(),
+        percentiles={f"p{q:g}": percentile(values, q) for q in percentiles},
+        histogram=[HistogramBin(**bucket._asdict()) for bucket in buckets],
+    )
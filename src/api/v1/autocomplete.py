@@ -0,0 +1,44 @@
+"""Autocomplete API endpoints."""
+
+from fastapi import APIRouter, HTTPException, Query
+
+from src.dependencies import get_dataset_store
+from src.models.autocomplete import AutocompleteSuggestion
+from src.services.dataset_store import RESOURCE_MODELS
+from src.services.swapi_client import SWAPIError
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_model=list[AutocompleteSuggestion],
+    summary="Autocomplete names",
+    description=(
+        "Prefix suggestions across character, planet, starship, vehicle, species and film "
+        "names, most popular first. Any word of a name can be completed."
+    ),
+)
+async def autocomplete(
+    q: str = Query(..., min_length=1, description="Typed prefix"),
+    types: list[str] | None = Query(
+        None, description=f"Resources to suggest ({', '.join(RESOURCE_MODELS)})"
+    ),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions"),
+) -> list[AutocompleteSuggestion]:
+    """Autocomplete names from the precomputed prefix index."""
+    if types:
+        unknown = [t for t in types if t not in RESOURCE_MODELS]
+        if unknown:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown resource type(s): {', '.join(unknown)}"
+            )
+
+    store = get_dataset_store()
+
+    try:
+        await store.ensure_loaded()
+        suggestions = store.autocomplete.complete(q, resources=types, limit=limit)
+        return [AutocompleteSuggestion(**s._asdict()) for s in suggestions]
+    except SWAPIError as e:
+        raise HTTPException(status_code=e.status_code or 500, detail=e.message)
@@ -0,0 +1,163 @@
+"""Batch API endpoint: many GET requests in one round trip."""
+
+import asyncio
+import json
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from fastapi import APIRouter, HTTPException, Request
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.types import Message, Scope
+
+from src.models.batch import BatchRequest, BatchResponse, BatchResult
+
+router = APIRouter()
+
+# Most sub-requests accepted in one batch
+MAX_BATCH_REQUESTS = 20
+
+# Request headers that describe the body of the batch itself, not of its sub-requests
+_BODY_HEADERS = frozenset({b"content-length", b"content-type", b"transfer-encoding"})
+
+
+def _normalized(path: str) -> tuple[str, str]:
+    """
+    Path and query string of a sub-request, with parameters ordered by name.
+
+    The order of repeated parameters (`ids=2&ids=1`) is kept, since it can
+    be meaningful; only the order between different names is normalized.
+    """
+    url = urlsplit(path)
+    params = sorted(parse_qsl(url.query, keep_blank_values=True), key=lambda param: param[0])
+    return url.path, urlencode(params)
+
+
+def _rejected(path: str, batch_path: str) -> str | None:
+    """Why a sub-request path cannot be executed, if it cannot."""
+    if not path.startswith("/") or path.startswith("//"):
+        return "Path must be absolute, e.g. /api/v1/people"
+    if urlsplit(path).path.rstrip("/") == batch_path.rstrip("/"):
+        return "Batches cannot be nested"
+    return None
+
+
+async def _dispatch(request: Request, path: str, query: str) -> tuple[int, Any]:
+    """
+    Run a GET request through the app's router, in-process.
+
+    The sub-request skips the middleware stack (tracking and security headers
+    apply to the batch as a whole; the batch charges the rate limit for its
+    sub-requests up front) but keeps the app's exception handlers, so errors
+    produce the same responses as over HTTP.
+    """
+    parent = request.scope
+    scope: Scope = {
+        **{key: value for key, value in parent.items() if key not in {"router", "endpoint"}},
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": [(k, v) for k, v in parent["headers"] if k not in _BODY_HEADERS],
+        "path_params": {},
+        "state": dict(parent.get("state", {})),
+    }
+    done = asyncio.Event()
+    requested = False
+
+    async def receive() -> Message:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    status = 500
+    content_type = ""
+    chunks: list[bytes] = []
+
+    async def send(message: Message) -> None:
+        nonlocal status, content_type
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            headers = dict(message.get("headers", []))
+            content_type = headers.get(b"content-type", b"").decode("latin-1")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app.router(scope, receive, send)
+    except StarletteHTTPException as e:
+        # Raised by the router itself (unknown path, wrong method), outside any route
+        return e.status_code, {"detail": e.detail}
+    except Exception:
+        return 500, {"detail": "An unexpected error occurred"}
+    finally:
+        done.set()
+
+    body = b"".join(chunks)
+    if not body:
+        return status, None
+    if "json" in content_type:
+        return status, json.loads(body)
+    return status, body.decode("utf-8", errors="replace")
+
+
+@router.post(
+    "",
+    response_model=BatchResponse,
+    summary="Batch requests",
+    description=(
+        f"Run up to {MAX_BATCH_REQUESTS} GET requests of this API in one round trip. "
+        "Sub-requests run concurrently in-process and each result carries its own status "
+        "code, so one failing request does not fail the batch. Identical requests "
+        "(same path and parameters, in any order) are executed once per batch and share "
+        "the result. Each executed sub-request counts against the rate limit; a batch "
+        "that does not fit in the remaining budget is rejected with 429."
+    ),
+)
+async def run_batch(batch: BatchRequest, request: Request) -> BatchResponse:
+    """Execute many GET sub-requests concurrently."""
+    if not batch.requests:
+        raise HTTPException(status_code=400, detail="The batch is empty")
+    if len(batch.requests) > MAX_BATCH_REQUESTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{len(batch.requests)} requests given; a batch holds at most "
+            f"{MAX_BATCH_REQUESTS}",
+        )
+
+    # Per-batch cache: one execution per distinct request
+    keys = list(
+        dict.fromkeys(
+            _normalized(item.path)
+            for item in batch.requests
+            if _rejected(item.path, request.url.path) is None
+        )
+    )
+
+    # Every executed sub-request counts against the client's rate limit
+    limiter = getattr(request.state, "rate_limiter", None)
+    if limiter is not None:
+        hits = sum(not limiter.is_exempt(path) for path, _ in keys)
+        if not limiter.consume(limiter.client_ip(request), hits):
+            raise HTTPException(
+                status_code=429,
+                detail=f"Rate limit exceeded: the batch needs {hits} more requests. "
+                "Try again in 1 minute.",
+                headers=limiter.limit_headers(),
+            )
+
+    tasks = {key: asyncio.create_task(_dispatch(request, *key)) for key in keys}
+    await asyncio.gather(*tasks.values())
+
+    results = []
+    for item in batch.requests:
+        reason = _rejected(item.path, request.url.path)
+        if reason is None:
+            status, body = tasks[_normalized(item.path)].result()
+        else:
+            status, body = 400, {"detail": reason}
+        results.append(BatchResult(id=item.id, path=item.path, status=status, body=body))
+
+    return BatchResponse(count=len(results), executed=len(tasks), results=results)
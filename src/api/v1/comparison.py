@@ -1,16 +1,53 @@
 """Comparison API endpoints."""
 
+from collections.abc import Iterator
+
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
 
-from src.dependencies import get_swapi_client
+from src.dependencies import get_dataset_store
 from src.models.people import Person
 from src.models.planets import Planet
+from src.models.species import Species
 from src.models.starships import Starship
-from src.models.statistics import ComparisonResult
+from src.models.statistics import ComparisonMatrix, ComparisonResult
+from src.models.vehicles import Vehicle
+from src.services.comparison import FieldComparison, compare_field, pairwise
+from src.services.dataset_store import (
+    INTERVAL_FIELDS,
+    NUMERIC_FIELDS,
+    DatasetStore,
+    display_name,
+)
+from src.services.query_filter import FILTER_DESCRIPTION, FilterError, compile_filter
 from src.services.swapi_client import SWAPIError
 
 router = APIRouter()
 
+# Largest comparison matrix, and the size above which it is streamed
+MAX_MATRIX_ENTITIES = 500
+STREAM_THRESHOLD = 50
+
+
+async def _loaded() -> DatasetStore:
+    store = get_dataset_store()
+    try:
+        await store.ensure_loaded()
+    except SWAPIError as e:
+        raise HTTPException(status_code=e.status_code or 500, detail=e.message)
+    return store
+
+
+async def _compared(resource: str, ids: list[int], label: str) -> list[BaseModel]:
+    """Models of the IDs to compare, resolved in-process (unknown IDs are skipped)."""
+    table = (await _loaded()).table(resource)
+    models = [model for entity_id in ids if (model := table.get(entity_id)) is not None]
+    if len(models) < 2:
+        raise HTTPException(status_code=400, detail=f"Need at least 2 valid {label} IDs to compare")
+    return models
+
 
 @router.get(
     "/characters",
@@ -22,43 +59,30 @@ async def compare_characters(
     ids: list[int] = Query(..., min_length=2, max_length=5, description="Character IDs to compare"),
 ) -> ComparisonResult:
     """Compare multiple characters."""
-    swapi = get_swapi_client()
+    people: list[Person] = await _compared("people", ids, "character")  # type: ignore[assignment]
 
-    try:
-        people_data = await swapi.get_multiple_by_ids("people", ids)
-
-        if len(people_data) < 2:
-            raise HTTPException(
-                status_code=400, detail="Need at least 2 valid character IDs to compare"
-            )
-
-        people = [Person.from_swapi(data, data["id"]) for data in people_data]
-
-        entities = []
-        for p in people:
-            entities.append(
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "height": p.height,
-                    "mass": p.mass,
-                    "hair_color": p.hair_color,
-                    "eye_color": p.eye_color,
-                    "birth_year": p.birth_year,
-                    "gender": p.gender,
-                    "films_count": len(p.film_ids),
-                    "starships_count": len(p.starship_ids),
-                }
-            )
-
-        return ComparisonResult(
-            entity_type="characters",
-            entities=entities,
-            comparison_fields=["height", "mass", "films_count", "starships_count"],
+    entities = []
+    for p in people:
+        entities.append(
+            {
+                "id": p.id,
+                "name": p.name,
+                "height": p.height,
+                "mass": p.mass,
+                "hair_color": p.hair_color,
+                "eye_color": p.eye_color,
+                "birth_year": p.birth_year,
+                "gender": p.gender,
+                "films_count": len(p.film_ids),
+                "starships_count": len(p.starship_ids),
+            }
         )
 
-    except SWAPIError as e:
-        raise HTTPException(status_code=e.status_code or 500, detail=e.message)
+    return ComparisonResult(
+        entity_type="characters",
+        entities=entities,
+        comparison_fields=["height", "mass", "films_count", "starships_count"],
+    )
 
 
 @router.get(
@@ -71,51 +95,38 @@ async def compare_starships(
     ids: list[int] = Query(..., min_length=2, max_length=5, description="Starship IDs to compare"),
 ) -> ComparisonResult:
     """Compare multiple starships."""
-    swapi = get_swapi_client()
+    starships: list[Starship] = await _compared("starships", ids, "starship")  # type: ignore[assignment]
 
-    try:
-        starships_data = await swapi.get_multiple_by_ids("starships", ids)
-
-        if len(starships_data) < 2:
-            raise HTTPException(
-                status_code=400, detail="Need at least 2 valid starship IDs to compare"
-            )
-
-        starships = [Starship.from_swapi(data, data["id"]) for data in starships_data]
-
-        entities = []
-        for s in starships:
-            entities.append(
-                {
-                    "id": s.id,
-                    "name": s.name,
-                    "model": s.model,
-                    "manufacturer": s.manufacturer,
-                    "starship_class": s.starship_class,
-                    "cost_in_credits": s.cost_in_credits,
-                    "length": s.length,
-                    "crew": s.crew,
-                    "passengers": s.passengers,
-                    "hyperdrive_rating": s.hyperdrive_rating,
-                    "mglt": s.mglt,
-                    "cargo_capacity": s.cargo_capacity,
-                }
-            )
-
-        return ComparisonResult(
-            entity_type="starships",
-            entities=entities,
-            comparison_fields=[
-                "cost_in_credits",
-                "length",
-                "hyperdrive_rating",
-                "mglt",
-                "cargo_capacity",
-            ],
+    entities = []
+    for s in starships:
+        entities.append(
+            {
+                "id": s.id,
+                "name": s.name,
+                "model": s.model,
+                "manufacturer": s.manufacturer,
+                "starship_class": s.starship_class,
+                "cost_in_credits": s.cost_in_credits,
+                "length": s.length,
+                "crew": s.crew,
+                "passengers": s.passengers,
+                "hyperdrive_rating": s.hyperdrive_rating,
+                "mglt": s.mglt,
+                "cargo_capacity": s.cargo_capacity,
+            }
         )
 
-    except SWAPIError as e:
-        raise HTTPException(status_code=e.status_code or 500, detail=e.message)
+    return ComparisonResult(
+        entity_type="starships",
+        entities=entities,
+        comparison_fields=[
+            "cost_in_credits",
+            "length",
+            "hyperdrive_rating",
+            "mglt",
+            "cargo_capacity",
+        ],
+    )
 
 
 @router.get(
@@ -128,42 +139,244 @@ async def compare_planets(
     ids: list[int] = Query(..., min_length=2, max_length=5, description="Planet IDs to compare"),
 ) -> ComparisonResult:
     """Compare multiple planets."""
-    swapi = get_swapi_client()
+    planets: list[Planet] = await _compared("planets", ids, "planet")  # type: ignore[assignment]
+
+    entities = []
+    for p in planets:
+        entities.append(
+            {
+                "id": p.id,
+                "name": p.name,
+                "diameter": p.diameter,
+                "rotation_period": p.rotation_period,
+                "orbital_period": p.orbital_period,
+                "gravity": p.gravity,
+                "population": p.population,
+                "climate": p.climate,
+                "terrain": p.terrain,
+                "surface_water": p.surface_water,
+                "residents_count": len(p.resident_ids),
+                "films_count": len(p.film_ids),
+            }
+        )
+
+    return ComparisonResult(
+        entity_type="planets",
+        entities=entities,
+        comparison_fields=["diameter", "population", "surface_water", "residents_count"],
+    )
+
+
+@router.get(
+    "/vehicles",
+    response_model=ComparisonResult,
+    summary="Compare vehicles",
+    description="Compare multiple vehicles side by side.",
+)
+async def compare_vehicles(
+    ids: list[int] = Query(..., min_length=2, max_length=5, description="Vehicle IDs to compare"),
+) -> ComparisonResult:
+    """Compare multiple vehicles."""
+    vehicles: list[Vehicle] = await _compared("vehicles", ids, "vehicle")  # type: ignore[assignment]
+
+    entities = []
+    for v in vehicles:
+        entities.append(
+            {
+                "id": v.id,
+                "name": v.name,
+                "model": v.model,
+                "manufacturer": v.manufacturer,
+                "vehicle_class": v.vehicle_class,
+                "cost_in_credits": v.cost_in_credits,
+                "length": v.length,
+                "crew": v.crew,
+                "passengers": v.passengers,
+                "max_atmosphering_speed": v.max_atmosphering_speed,
+                "cargo_capacity": v.cargo_capacity,
+            }
+        )
+
+    return ComparisonResult(
+        entity_type="vehicles",
+        entities=entities,
+        comparison_fields=[
+            "cost_in_credits",
+            "length",
+            "max_atmosphering_speed",
+            "cargo_capacity",
+        ],
+    )
+
+
+@router.get(
+    "/species",
+    response_model=ComparisonResult,
+    summary="Compare species",
+    description="Compare multiple species side by side.",
+)
+async def compare_species(
+    ids: list[int] = Query(..., min_length=2, max_length=5, description="Species IDs to compare"),
+) -> ComparisonResult:
+    """Compare multiple species."""
+    species: list[Species] = await _compared("species", ids, "species")  # type: ignore[assignment]
+
+    entities = []
+    for s in species:
+        entities.append(
+            {
+                "id": s.id,
+                "name": s.name,
+                "classification": s.classification,
+                "designation": s.designation,
+                "average_height": s.average_height,
+                "average_lifespan": s.average_lifespan,
+                "language": s.language,
+                "people_count": len(s.people_ids),
+                "films_count": len(s.film_ids),
+            }
+        )
+
+    return ComparisonResult(
+        entity_type="species",
+        entities=entities,
+        comparison_fields=["average_height", "average_lifespan", "people_count"],
+    )
+
+
+def _rounded(value: float | None) -> float | None:
+    return None if value is None or value != value else round(value, 4)
+
+
+def _matrix_chunks(
+    resource: str,
+    ids: list[int],
+    names: list[str],
+    columns: dict[str, list[float]],
+    comparisons: list[FieldComparison],
+    with_pairwise: bool,
+) -> Iterator[bytes]:
+    """The comparison matrix as JSON, one entity (and its pairwise row) per chunk."""
+    header = {
+        "resource": resource,
+        "fields": list(columns),
+        "count": len(ids),
+        "summary": {
+            c.field: {
+                "better": c.better,
+                "count": c.count,
+                "min": None if c.min_id is None else {"id": c.min_id, "value": c.min},
+                "max": None if c.max_id is None else {"id": c.max_id, "value": c.max},
+                "mean": _rounded(c.mean),
+                "winner": c.winner_id,
+            }
+            for c in comparisons
+        },
+    }
+    yield to_json(header)[:-1] + b',"entities":['
+
+    for i, entity_id in enumerate(ids):
+        entity = {
+            "id": entity_id,
+            "name": names[i],
+            "values": {field: _rounded(values[i]) for field, values in columns.items()},
+            "ranks": {c.field: c.ranks[i] for c in comparisons},
+        }
+        if with_pairwise:
+            rows = {
+                field: pairwise(values, i, field not in INTERVAL_FIELDS)
+                for field, values in columns.items()
+            }
+            entity["difference"] = {
+                field: [_rounded(d) for d in differences]
+                for field, (differences, _) in rows.items()
+            }
+            entity["ratio"] = {
+                field: [_rounded(r) for r in ratios] for field, (_, ratios) in rows.items()
+            }
+        yield (b"," if i else b"") + to_json(entity)
+
+    yield b"]}"
+
+
+@router.get(
+    "/{resource}/matrix",
+    response_model=ComparisonMatrix,
+    summary="Comparison matrix",
+    description=(
+        f"Compare up to {MAX_MATRIX_ENTITIES} entities of any resource at once: the given "
+        "`ids`, a whole filtered set (`filter`), or the filtered subset of the ids. For each "
+        "numeric field, returns min, max, mean, the winner (lowest cost and hyperdrive "
+        "rating, highest value elsewhere) and each entity's rank; with `pairwise` (default), "
+        "each entity also gets its differences and ratios against every other entity, in "
+        "entity order. Birth years (`birth_year_aby`) are signed years: compared only on "
+        "request, without winner, ranks or ratios. Values are read from the column store "
+        "in one pass per field; "
+        f"matrices of more than {STREAM_THRESHOLD} entities are streamed entity by entity."
+    ),
+)
+async def get_comparison_matrix(
+    resource: str,
+    ids: list[int] = Query(
+        [], max_length=MAX_MATRIX_ENTITIES, description="Entity IDs, in comparison order"
+    ),
+    filter_expr: str | None = Query(None, alias="filter", description=FILTER_DESCRIPTION),
+    fields: list[str] = Query(
+        [], description="Numeric fields to compare (default: all but birth_year_aby)"
+    ),
+    with_pairwise: bool = Query(
+        True, alias="pairwise", description="Include pairwise differences and ratios"
+    ),
+) -> Response:
+    """Pairwise comparison matrix of many entities."""
+    if resource not in NUMERIC_FIELDS:
+        raise HTTPException(status_code=404, detail=f"Unknown resource: {resource}")
+    if not ids and not filter_expr:
+        raise HTTPException(status_code=400, detail="Give the ids to compare or a filter")
+
+    selected = list(dict.fromkeys(fields)) or [
+        field for field in NUMERIC_FIELDS[resource] if field not in INTERVAL_FIELDS
+    ]
+    invalid = [field for field in selected if field not in NUMERIC_FIELDS[resource]]
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid fields for {resource}: {', '.join(invalid)}. "
+            f"Use: {', '.join(NUMERIC_FIELDS[resource])}",
+        )
+
+    store = await _loaded()
+    table = store.table(resource)
 
     try:
-        planets_data = await swapi.get_multiple_by_ids("planets", ids)
-
-        if len(planets_data) < 2:
-            raise HTTPException(
-                status_code=400, detail="Need at least 2 valid planet IDs to compare"
-            )
-
-        planets = [Planet.from_swapi(data, data["id"]) for data in planets_data]
-
-        entities = []
-        for p in planets:
-            entities.append(
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "diameter": p.diameter,
-                    "rotation_period": p.rotation_period,
-                    "orbital_period": p.orbital_period,
-                    "gravity": p.gravity,
-                    "population": p.population,
-                    "climate": p.climate,
-                    "terrain": p.terrain,
-                    "surface_water": p.surface_water,
-                    "residents_count": len(p.resident_ids),
-                    "films_count": len(p.film_ids),
-                }
-            )
-
-        return ComparisonResult(
-            entity_type="planets",
-            entities=entities,
-            comparison_fields=["diameter", "population", "surface_water", "residents_count"],
+        matched = compile_filter(resource, filter_expr).execute(table) if filter_expr else None
+    except FilterError as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+    if ids:
+        candidates = [row for row in map(table.row, dict.fromkeys(ids)) if row is not None]
+        rows = [row for row in candidates if matched is None or matched >> row & 1]
+    else:
+        rows = sorted(table.rows_of(matched or 0), key=table.row_ids().__getitem__)
+
+    if len(rows) < 2:
+        raise HTTPException(status_code=400, detail="Need at least 2 entities to compare")
+    if len(rows) > MAX_MATRIX_ENTITIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{len(rows)} entities match; compare at most {MAX_MATRIX_ENTITIES}",
         )
 
-    except SWAPIError as e:
-        raise HTTPException(status_code=e.status_code or 500, detail=e.message)
+    row_ids = table.row_ids()
+    entity_ids = [row_ids[row] for row in rows]
+    names = [display_name(table.models[entity_id]) for entity_id in entity_ids]
+    columns = {}
+    for field in selected:
+        vector = table.vector(field)
+        columns[field] = [vector[row] for row in rows]
+    comparisons = [compare_field(field, entity_ids, values) for field, values in columns.items()]
+
+    chunks = _matrix_chunks(resource, entity_ids, names, columns, comparisons, with_pairwise)
+    if len(rows) > STREAM_THRESHOLD:
+        return StreamingResponse(chunks, media_type="application/json")
+    return Response(b"".join(chunks), media_type="application/json")
@@ -1,15 +1,39 @@
 """Films API endpoints."""
 
+from functools import partial
+
 from fastapi import APIRouter, HTTPException, Query
 
-from src.dependencies import get_swapi_client
+from src.dependencies import get_dataset_store
 from src.models.base import PaginatedResponse, SortOrder
-from src.models.films import Film, FilmSummary
+from src.models.films import Film, FilmMember, FilmSetResult, FilmSummary
 from src.models.people import PersonSummary
 from src.models.planets import PlanetSummary
 from src.models.starships import StarshipSummary
+from src.services.dataset_store import RELATED_RESOURCES, SET_OPERATORS, display_name
+from src.services.expansion import (
+    EXPAND_DESCRIPTION,
+    ExpansionError,
+    expand,
+    expand_page,
+    parse_expand,
+)
+from src.services.projection import (
+    FIELDS_DESCRIPTION,
+    ProjectionError,
+    parse_fields,
+    project,
+    respond,
+)
+from src.services.query_filter import (
+    FACETS_DESCRIPTION,
+    FILTER_DESCRIPTION,
+    FilterError,
+    count_facets,
+    select_rows,
+)
 from src.services.swapi_client import SWAPIError
-from src.utils.pagination import paginate
+from src.utils.pagination import CURSOR_DESCRIPTION, CursorError, paginate, paginate_cursor
 from src.utils.sorting import FILM_SORT_KEYS, sort_items
 
 router = APIRouter()
@@ -28,17 +52,47 @@ async def list_films(
         "episode_id", description="Field to sort by (title, episode_id, release_date)"
     ),
     sort_order: SortOrder = Query(SortOrder.ASC, description="Sort order"),
+    filter_expr: str | None = Query(None, alias="filter", description=FILTER_DESCRIPTION),
+    facets: str | None = Query(None, description=FACETS_DESCRIPTION),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    expand_expr: str | None = Query(None, alias="expand", description=EXPAND_DESCRIPTION),
 ) -> PaginatedResponse[FilmSummary]:
     """List all films with sorting."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        all_films_data = await swapi.get_all_films()
+        projection = parse_fields("films", fields) if fields else None
+        expansion = parse_expand("films", expand_expr) if expand_expr else ()
+        to_item = (
+            FilmSummary.from_model if projection is None else partial(project, fields=projection)
+        )
+
+        await store.ensure_loaded()
 
-        # Convert to Film models
-        films = [
-            Film.from_swapi(data, data.get("id", i + 1)) for i, data in enumerate(all_films_data)
-        ]
+        # Filter expression, resolved on the table indexes
+        table = store.table("films")
+        rows = select_rows(table, filter_expr)
+        films = table.models_of(rows)
+
+        # Facet counts over the match bitmap, intersected with the value index bitmaps
+        facet_counts = count_facets(table, rows, facets)
+
+        # Keyset pagination, read from the table's pre-sorted index
+        if cursor is not None:
+            paginated = paginate_cursor(
+                table,
+                films,
+                cursor,
+                to_item,
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                key_mapper=FILM_SORT_KEYS,
+                version=store.resource_versions["films"],
+                facets=facet_counts,
+            )
+            return respond(expand_page(store, "films", paginated, expansion), projection, expansion)
 
         # Sort
         sorted_films = sort_items(
@@ -48,24 +102,92 @@ async def list_films(
             key_mapper=FILM_SORT_KEYS,
         )
 
-        # Convert to summaries
-        summaries = [
-            FilmSummary(
-                id=f.id,
-                episode_id=f.episode_id,
-                title=f.title,
-                director=f.director,
-                release_date=f.release_date,
-                characters_count=len(f.character_ids),
-            )
-            for f in sorted_films
-        ]
+        # Paginate, converting only the items of the page
+        paginated = paginate(
+            sorted_films, page=page, page_size=page_size, facets=facet_counts, to_item=to_item
+        )
+        return respond(expand_page(store, "films", paginated, expansion), projection, expansion)
+
+    except (CursorError, FilterError, ExpansionError, ProjectionError) as e:
+        raise HTTPException(status_code=400, detail=e.message)
+    except SWAPIError as e:
+        raise HTTPException(status_code=e.status_code or 500, detail=e.message)
+
+
+def _film_ids(value: str) -> list[int]:
+    """Parse a comma separated list of film IDs."""
+    try:
+        return list(dict.fromkeys(int(part) for part in value.split(",") if part.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid film IDs: {value}")
+
+
+@router.get(
+    "/sets/{resource}",
+    response_model=FilmSetResult,
+    summary="Set queries over films",
+    description=(
+        "Entities of a resource by the films they appear in, e.g. characters in every film "
+        "of the original trilogy (`/films/sets/people?all=1,2,3`), planets in Episode I but "
+        "not in Episode II (`/films/sets/planets?all=4&none=5`) or starships in any prequel "
+        "(`/films/sets/starships?any=4,5,6`). `exactly` matches entities appearing in those "
+        "films and no other. Operators are combined with AND. Film membership is encoded "
+        "as a bitmask per entity at ingest, so each query is a few bitwise operations over "
+        "all entities at once."
+    ),
+)
+async def get_film_set(
+    resource: str,
+    all_films: str | None = Query(None, alias="all", description="Film IDs, all required"),
+    any_films: str | None = Query(None, alias="any", description="Film IDs, at least one"),
+    no_films: str | None = Query(None, alias="none", description="Film IDs, none allowed"),
+    exactly: str | None = Query(None, description="Film IDs, exactly these and no other"),
+) -> FilmSetResult:
+    """Entities matching a set expression over their films."""
+    if resource == "films" or resource not in RELATED_RESOURCES["films"]:
+        raise HTTPException(status_code=404, detail=f"Unknown resource: {resource}")
 
-        return paginate(summaries, page=page, page_size=page_size)
+    query = {
+        operator: _film_ids(value)
+        for operator, value in zip(
+            SET_OPERATORS, (all_films, any_films, no_films, exactly), strict=True
+        )
+        if value is not None
+    }
+
+    store = get_dataset_store()
 
+    try:
+        await store.ensure_loaded()
     except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
+    table = store.table(resource)
+    membership = store.membership(resource, "films")
+    unknown = [
+        film_id for ids in query.values() for film_id in ids if film_id not in membership.domain
+    ]
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown film IDs: {', '.join(map(str, unknown))}"
+        )
+
+    rows = table.all_rows()
+    for operator, film_ids in query.items():
+        rows &= membership.select(operator, membership.mask(film_ids))
+
+    results = [
+        FilmMember(
+            id=entity_id,
+            name=display_name(table.models[entity_id]),
+            film_ids=membership.targets(membership.masks[row]),
+        )
+        for row, entity_id in sorted(
+            zip(table.rows_of(rows), table.ids_of(rows), strict=True), key=lambda item: item[1]
+        )
+    ]
+    return FilmSetResult(resource=resource, query=query, total=len(results), results=results)
+
 
 @router.get(
     "/{film_id}",
@@ -73,16 +195,28 @@ async def list_films(
     summary="Get film by ID",
     description="Get detailed information about a specific film.",
 )
-async def get_film(film_id: int) -> Film:
+async def get_film(
+    film_id: int,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    expand_expr: str | None = Query(None, alias="expand", description=EXPAND_DESCRIPTION),
+) -> Film:
     """Get a single film by ID."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        data = await swapi.get_film(film_id)
-        return Film.from_swapi(data, film_id)
-    except SWAPIError as e:
-        if e.status_code == 404:
+        projection = parse_fields("films", fields) if fields else None
+        expansion = parse_expand("films", expand_expr) if expand_expr else ()
+
+        await store.ensure_loaded()
+        film = store.table("films").get(film_id)
+        if film is None:
             raise HTTPException(status_code=404, detail=f"Film with ID {film_id} not found")
+
+        item = film if projection is None else project(film, projection)
+        return respond(expand(store, "films", [item], expansion)[0], projection, expansion)
+    except (ExpansionError, ProjectionError) as e:
+        raise HTTPException(status_code=400, detail=e.message)
+    except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
 
@@ -94,20 +228,16 @@ async def get_film(film_id: int) -> Film:
 )
 async def get_film_characters(film_id: int) -> list[PersonSummary]:
     """Get all characters in a film."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        film_data = await swapi.get_film(film_id)
-        film = Film.from_swapi(film_data, film_id)
-
-        if not film.character_ids:
-            return []
+        await store.ensure_loaded()
+        if store.table("films").get(film_id) is None:
+            raise HTTPException(status_code=404, detail=f"Film with ID {film_id} not found")
 
-        people_data = await swapi.get_multiple_by_ids("people", film.character_ids)
-        return [PersonSummary.from_swapi(data, data.get("id", 0)) for data in people_data]
+        people = store.related_models("films", film_id, "people")
+        return [PersonSummary.from_model(model) for model in people]
     except SWAPIError as e:
-        if e.status_code == 404:
-            raise HTTPException(status_code=404, detail=f"Film with ID {film_id} not found")
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
 
@@ -119,20 +249,16 @@ async def get_film_characters(film_id: int) -> list[PersonSummary]:
 )
 async def get_film_planets(film_id: int) -> list[PlanetSummary]:
     """Get all planets in a film."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        film_data = await swapi.get_film(film_id)
-        film = Film.from_swapi(film_data, film_id)
-
-        if not film.planet_ids:
-            return []
+        await store.ensure_loaded()
+        if store.table("films").get(film_id) is None:
+            raise HTTPException(status_code=404, detail=f"Film with ID {film_id} not found")
 
-        planets_data = await swapi.get_multiple_by_ids("planets", film.planet_ids)
-        return [PlanetSummary.from_swapi(data, data.get("id", 0)) for data in planets_data]
+        planets = store.related_models("films", film_id, "planets")
+        return [PlanetSummary.from_model(model) for model in planets]
     except SWAPIError as e:
-        if e.status_code == 404:
-            raise HTTPException(status_code=404, detail=f"Film with ID {film_id} not found")
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
 
@@ -144,18 +270,14 @@ async def get_film_planets(film_id: int) -> list[PlanetSummary]:
 )
 async def get_film_starships(film_id: int) -> list[StarshipSummary]:
     """Get all starships in a film."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        film_data = await swapi.get_film(film_id)
-        film = Film.from_swapi(film_data, film_id)
-
-        if not film.starship_ids:
-            return []
+        await store.ensure_loaded()
+        if store.table("films").get(film_id) is None:
+            raise HTTPException(status_code=404, detail=f"Film with ID {film_id} not found")
 
-        starships_data = await swapi.get_multiple_by_ids("starships", film.starship_ids)
-        return [StarshipSummary.from_swapi(data, data.get("id", 0)) for data in starships_data]
+        starships = store.related_models("films", film_id, "starships")
+        return [StarshipSummary.from_model(model) for model in starships]
     except SWAPIError as e:
-        if e.status_code == 404:
-            raise HTTPException(status_code=404, detail=f"Film with ID {film_id} not found")
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
@@ -0,0 +1,230 @@
+"""Character graph API endpoints."""
+
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Query
+
+from src.dependencies import get_dataset_store
+from src.models.graph import (
+    CentralityRanking,
+    CentralityScore,
+    CoAppearance,
+    CoAppearanceResult,
+    GraphComponent,
+    GraphComponents,
+    GraphNode,
+    GraphPath,
+    PathStep,
+)
+from src.services.dataset_store import DatasetStore, display_name
+from src.services.graph import (
+    CENTRALITY_METRICS,
+    EXPENSIVE_METRICS,
+    GRAPH_LINKS,
+    CharacterGraph,
+    GraphError,
+    parse_via,
+)
+from src.services.swapi_client import SWAPIError
+
+router = APIRouter()
+
+VIA_DESCRIPTION = f"Resources linking characters: {', '.join(GRAPH_LINKS)} (default: all)"
+
+
+def build_graph(store: DatasetStore, via: tuple[str, ...]) -> CharacterGraph:
+    """Character graph over the given link resources."""
+    return CharacterGraph(
+        store.table("people").models,
+        {resource: store.relations.adjacency("people", resource) for resource in via},
+        {
+            resource: {
+                entity_id: display_name(model)
+                for entity_id, model in store.table(resource).models.items()
+            }
+            for resource in via
+        },
+    )
+
+
+async def load_graph(via: list[str]) -> CharacterGraph:
+    """Get the (materialized) character graph of a query."""
+    try:
+        links = parse_via(via)
+    except GraphError as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+    store = get_dataset_store()
+
+    try:
+        await store.ensure_loaded()
+    except SWAPIError as e:
+        raise HTTPException(status_code=e.status_code or 500, detail=e.message)
+
+    return store.views.get(("graph", links), {"people", *links}, lambda: build_graph(store, links))
+
+
+def _row(graph: CharacterGraph, person_id: int) -> int:
+    row = graph.row(person_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"Person {person_id} not found")
+    return row
+
+
+def _node(graph: CharacterGraph, row: int) -> GraphNode:
+    return GraphNode(id=graph.ids[row], name=graph.names[row])
+
+
+def _shared(graph: CharacterGraph, a: int, b: int) -> dict[str, list[GraphNode]]:
+    return {
+        resource: [GraphNode(id=entity_id, name=name) for entity_id, name in entities]
+        for resource, entities in graph.shared(a, b).items()
+    }
+
+
+@router.get(
+    "/people/{person_id}/co-appearances",
+    response_model=CoAppearanceResult,
+    summary="Co-appearances",
+    description=(
+        "Characters linked to a character, weighted by the number of films, starships, "
+        "vehicles and homeworlds they share (`?via=films` for film co-appearances only)."
+    ),
+)
+async def get_coappearances(
+    person_id: int,
+    via: list[str] = Query([], description=VIA_DESCRIPTION),
+    limit: int = Query(20, ge=1, le=100, description="Number of results"),
+) -> CoAppearanceResult:
+    """Characters sharing something with a character."""
+    graph = await load_graph(via)
+    row = _row(graph, person_id)
+    edges = graph.coappearances(row)
+
+    return CoAppearanceResult(
+        id=person_id,
+        name=graph.names[row],
+        via=list(graph.via),
+        total=len(edges),
+        results=[
+            CoAppearance(
+                id=graph.ids[other],
+                name=graph.names[other],
+                weight=weight,
+                shared=_shared(graph, row, other),
+            )
+            for other, weight in edges[:limit]
+        ],
+    )
+
+
+@router.get(
+    "/path/{source_id}/{target_id}",
+    response_model=GraphPath,
+    summary="Shortest connection",
+    description=(
+        "Shortest chain of characters connecting two characters, with the films, starships, "
+        "vehicles or homeworlds shared at each hop, e.g. Luke to Jabba "
+        "(`/graph/path/1/16?via=films`)."
+    ),
+)
+async def get_path(
+    source_id: int,
+    target_id: int,
+    via: list[str] = Query([], description=VIA_DESCRIPTION),
+) -> GraphPath:
+    """Shortest path between two characters."""
+    graph = await load_graph(via)
+    source, target = _row(graph, source_id), _row(graph, target_id)
+    path = graph.shortest_path(source, target) or []
+
+    return GraphPath(
+        source=_node(graph, source),
+        target=_node(graph, target),
+        via=list(graph.via),
+        connected=bool(path),
+        length=len(path) - 1 if path else None,
+        steps=[
+            PathStep(
+                source=_node(graph, a),
+                target=_node(graph, b),
+                shared=_shared(graph, a, b),
+            )
+            for a, b in zip(path[:-1], path[1:], strict=True)
+        ],
+    )
+
+
+@router.get(
+    "/centrality",
+    response_model=CentralityRanking,
+    summary="Centrality ranking",
+    description=(
+        "Most connected characters by `degree` (distinct characters linked to), `strength` "
+        "(shared entities), `closeness` or `betweenness` (how many shortest connections "
+        "between other characters go through them). Closeness and betweenness traverse the "
+        "graph from every character, so they are computed in a worker thread; all metrics "
+        "are cached until the dataset changes."
+    ),
+)
+async def get_centrality(
+    metric: str = Query("degree", description=f"One of: {', '.join(CENTRALITY_METRICS)}"),
+    via: list[str] = Query([], description=VIA_DESCRIPTION),
+    limit: int = Query(10, ge=1, le=100, description="Number of results"),
+) -> CentralityRanking:
+    """Rank characters by centrality."""
+    if metric not in CENTRALITY_METRICS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid metric: {metric}. Use: {', '.join(CENTRALITY_METRICS)}",
+        )
+    graph = await load_graph(via)
+
+    if metric in EXPENSIVE_METRICS:
+        scores = await asyncio.to_thread(graph.centrality, metric)
+    else:
+        scores = graph.centrality(metric)
+
+    ranked = sorted(range(len(graph)), key=lambda row: (-scores[row], graph.ids[row]))
+    return CentralityRanking(
+        metric=metric,
+        via=list(graph.via),
+        nodes=len(graph),
+        edges=graph.edge_count,
+        results=[
+            CentralityScore(
+                rank=rank,
+                id=graph.ids[row],
+                name=graph.names[row],
+                score=round(scores[row], 4),
+            )
+            for rank, row in enumerate(ranked[:limit], start=1)
+        ],
+    )
+
+
+@router.get(
+    "/components",
+    response_model=GraphComponents,
+    summary="Connected components",
+    description=(
+        "Groups of characters connected to each other, largest first. With `?via=starships` "
+        "the groups are crews sharing ships; characters without links form their own group."
+    ),
+)
+async def get_components(
+    via: list[str] = Query([], description=VIA_DESCRIPTION),
+    min_size: int = Query(1, ge=1, description="Smallest component to include"),
+) -> GraphComponents:
+    """Connected components of the character graph."""
+    graph = await load_graph(via)
+    components = [rows for rows in graph.components() if len(rows) >= min_size]
+
+    return GraphComponents(
+        via=list(graph.via),
+        total=len(components),
+        components=[
+            GraphComponent(size=len(rows), members=[_node(graph, row) for row in rows])
+            for rows in components
+        ],
+    )
@@ -1,14 +1,37 @@
 """People/Characters API endpoints."""
 
+from functools import partial
+
 from fastapi import APIRouter, HTTPException, Query
 
-from src.dependencies import get_swapi_client
+from src.dependencies import get_dataset_store
 from src.models.base import PaginatedResponse, SortOrder
 from src.models.films import FilmSummary
-from src.models.people import Person, PersonFilter, PersonSummary
+from src.models.people import Person, PersonSummary
 from src.models.starships import StarshipSummary
+from src.services.expansion import (
+    EXPAND_DESCRIPTION,
+    ExpansionError,
+    expand,
+    expand_page,
+    parse_expand,
+)
+from src.services.projection import (
+    FIELDS_DESCRIPTION,
+    ProjectionError,
+    parse_fields,
+    project,
+    respond,
+)
+from src.services.query_filter import (
+    FACETS_DESCRIPTION,
+    FILTER_DESCRIPTION,
+    FilterError,
+    count_facets,
+    select_rows,
+)
 from src.services.swapi_client import SWAPIError
-from src.utils.pagination import paginate
+from src.utils.pagination import CURSOR_DESCRIPTION, CursorError, paginate, paginate_cursor
 from src.utils.sorting import PEOPLE_SORT_KEYS, sort_items
 
 router = APIRouter()
@@ -25,33 +48,60 @@ async def list_people(
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
     sort_by: str | None = Query(None, description="Field to sort by (name, height, mass)"),
     sort_order: SortOrder = Query(SortOrder.ASC, description="Sort order"),
+    filter_expr: str | None = Query(None, alias="filter", description=FILTER_DESCRIPTION),
+    facets: str | None = Query(None, description=FACETS_DESCRIPTION),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    expand_expr: str | None = Query(None, alias="expand", description=EXPAND_DESCRIPTION),
     gender: str | None = Query(None, description="Filter by gender"),
     eye_color: str | None = Query(None, description="Filter by eye color"),
     min_height: int | None = Query(None, description="Minimum height in cm"),
     max_height: int | None = Query(None, description="Maximum height in cm"),
 ) -> PaginatedResponse[PersonSummary]:
     """List all characters with pagination, filtering, and sorting."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        # Fetch all people
-        all_people_data = await swapi.get_all_people()
-
-        # Convert to Person models for filtering
-        people = [Person.from_swapi(data, data["id"]) for data in all_people_data]
-
-        # Apply filters
-        person_filter = PersonFilter(
-            gender=gender,
-            eye_color=eye_color,
-            hair_color=None,
-            homeworld_id=None,
-            min_height=min_height,
-            max_height=max_height,
-            min_mass=None,
-            max_mass=None,
+        projection = parse_fields("people", fields) if fields else None
+        expansion = parse_expand("people", expand_expr) if expand_expr else ()
+        to_item = (
+            PersonSummary.from_model if projection is None else partial(project, fields=projection)
         )
-        filtered_people = [p for p in people if person_filter.apply(p)]
+
+        await store.ensure_loaded()
+
+        table = store.table("people")
+
+        # Categorical parameters, matched on the encoded columns
+        rows = table.match("gender", gender) & table.match("eye_color", eye_color)
+
+        # Numeric ranges, read from the sorted columns
+        rows &= table.within("height", min_height, max_height)
+
+        # Filter expression, resolved on the table indexes, within those rows
+        rows = select_rows(table, filter_expr, rows)
+        filtered_people = table.models_of(rows)
+
+        # Facet counts over the match bitmap, intersected with the value index bitmaps
+        facet_counts = count_facets(table, rows, facets)
+
+        # Keyset pagination, read from the table's pre-sorted index
+        if cursor is not None:
+            paginated = paginate_cursor(
+                table,
+                filtered_people,
+                cursor,
+                to_item,
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                key_mapper=PEOPLE_SORT_KEYS,
+                version=store.resource_versions["people"],
+                facets=facet_counts,
+            )
+            return respond(
+                expand_page(store, "people", paginated, expansion), projection, expansion
+            )
 
         # Sort
         sorted_people = sort_items(
@@ -61,22 +111,14 @@ async def list_people(
             key_mapper=PEOPLE_SORT_KEYS,
         )
 
-        # Convert to summaries
-        summaries = [
-            PersonSummary(
-                id=p.id,
-                name=p.name,
-                gender=p.gender,
-                birth_year=p.birth_year,
-                homeworld_id=p.homeworld_id,
-                films_count=len(p.film_ids),
-            )
-            for p in sorted_people
-        ]
-
-        # Paginate
-        return paginate(summaries, page=page, page_size=page_size)
+        # Paginate, converting only the items of the page
+        paginated = paginate(
+            sorted_people, page=page, page_size=page_size, facets=facet_counts, to_item=to_item
+        )
+        return respond(expand_page(store, "people", paginated, expansion), projection, expansion)
 
+    except (CursorError, FilterError, ExpansionError, ProjectionError) as e:
+        raise HTTPException(status_code=400, detail=e.message)
     except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
@@ -85,17 +127,20 @@ async def list_people(
     "/search",
     response_model=list[PersonSummary],
     summary="Search characters",
-    description="Search for characters by name.",
+    description="Search for characters by name, tolerating typos.",
 )
 async def search_people(
     q: str = Query(..., min_length=1, description="Search query"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
 ) -> list[PersonSummary]:
     """Search characters by name."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        results = await swapi.search_people(q)
-        return [PersonSummary.from_swapi(data, data["id"]) for data in results]
+        await store.ensure_loaded()
+        table = store.table("people")
+        hits = store.search.search(q, resources=["people"], limit=limit)
+        return [PersonSummary.from_model(table.models[hit.id]) for hit in hits]
     except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
@@ -106,26 +151,39 @@ async def search_people(
     summary="Get character by ID",
     description="Get detailed information about a specific character.",
 )
-async def get_person(person_id: int) -> Person:
+async def get_person(
+    person_id: int,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    expand_expr: str | None = Query(None, alias="expand", description=EXPAND_DESCRIPTION),
+) -> Person:
     """Get a single character by ID."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        data = await swapi.get_person(person_id)
-        person = Person.from_swapi(data, person_id)
-
-        # Optionally fetch homeworld name
-        if person.homeworld_id:
-            try:
-                planet_data = await swapi.get_planet(person.homeworld_id)
-                person.homeworld_name = planet_data.get("name")
-            except SWAPIError:
-                pass  # Keep homeworld_name as None
-
-        return person
-    except SWAPIError as e:
-        if e.status_code == 404:
+        projection = parse_fields("people", fields) if fields else None
+        expansion = parse_expand("people", expand_expr) if expand_expr else ()
+
+        await store.ensure_loaded()
+        person = store.table("people").get(person_id)
+        if person is None:
             raise HTTPException(status_code=404, detail=f"Character with ID {person_id} not found")
+
+        # Homeworld name is read from the stored planet, no extra request (not from the
+        # relation index, which also links every planet listing the person as a resident)
+        if projection is None or "homeworld_name" in projection:
+            homeworld = (
+                None
+                if person.homeworld_id is None
+                else store.table("planets").get(person.homeworld_id)
+            )
+            homeworld_name = homeworld.name if homeworld is not None else None
+            person = person.model_copy(update={"homeworld_name": homeworld_name})
+
+        item = person if projection is None else project(person, projection)
+        return respond(expand(store, "people", [item], expansion)[0], projection, expansion)
+    except (ExpansionError, ProjectionError) as e:
+        raise HTTPException(status_code=400, detail=e.message)
+    except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
 
@@ -137,20 +195,16 @@ async def get_person(person_id: int) -> Person:
 )
 async def get_person_films(person_id: int) -> list[FilmSummary]:
     """Get all films for a character."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        person_data = await swapi.get_person(person_id)
-        person = Person.from_swapi(person_data, person_id)
-
-        if not person.film_ids:
-            return []
+        await store.ensure_loaded()
+        if store.table("people").get(person_id) is None:
+            raise HTTPException(status_code=404, detail=f"Character with ID {person_id} not found")
 
-        films_data = await swapi.get_multiple_by_ids("films", person.film_ids)
-        return [FilmSummary.from_swapi(data, data.get("id", 0)) for data in films_data]
+        films = store.related_models("people", person_id, "films")
+        return [FilmSummary.from_model(model) for model in films]
     except SWAPIError as e:
-        if e.status_code == 404:
-            raise HTTPException(status_code=404, detail=f"Character with ID {person_id} not found")
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
 
@@ -162,18 +216,14 @@ async def get_person_films(person_id: int) -> list[FilmSummary]:
 )
 async def get_person_starships(person_id: int) -> list[StarshipSummary]:
     """Get all starships piloted by a character."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        person_data = await swapi.get_person(person_id)
-        person = Person.from_swapi(person_data, person_id)
-
-        if not person.starship_ids:
-            return []
+        await store.ensure_loaded()
+        if store.table("people").get(person_id) is None:
+            raise HTTPException(status_code=404, detail=f"Character with ID {person_id} not found")
 
-        starships_data = await swapi.get_multiple_by_ids("starships", person.starship_ids)
-        return [StarshipSummary.from_swapi(data, data.get("id", 0)) for data in starships_data]
+        starships = store.related_models("people", person_id, "starships")
+        return [StarshipSummary.from_model(model) for model in starships]
     except SWAPIError as e:
-        if e.status_code == 404:
-            raise HTTPException(status_code=404, detail=f"Character with ID {person_id} not found")
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
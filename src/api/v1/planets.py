@@ -1,14 +1,37 @@
 """Planets API endpoints."""
 
+from functools import partial
+
 from fastapi import APIRouter, HTTPException, Query
 
-from src.dependencies import get_swapi_client
+from src.dependencies import get_dataset_store
 from src.models.base import PaginatedResponse, SortOrder
 from src.models.films import FilmSummary
 from src.models.people import PersonSummary
-from src.models.planets import Planet, PlanetFilter, PlanetSummary
+from src.models.planets import Planet, PlanetSummary
+from src.services.expansion import (
+    EXPAND_DESCRIPTION,
+    ExpansionError,
+    expand,
+    expand_page,
+    parse_expand,
+)
+from src.services.projection import (
+    FIELDS_DESCRIPTION,
+    ProjectionError,
+    parse_fields,
+    project,
+    respond,
+)
+from src.services.query_filter import (
+    FACETS_DESCRIPTION,
+    FILTER_DESCRIPTION,
+    FilterError,
+    count_facets,
+    select_rows,
+)
 from src.services.swapi_client import SWAPIError
-from src.utils.pagination import paginate
+from src.utils.pagination import CURSOR_DESCRIPTION, CursorError, paginate, paginate_cursor
 from src.utils.sorting import PLANET_SORT_KEYS, sort_items
 
 router = APIRouter()
@@ -25,30 +48,61 @@ async def list_planets(
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
     sort_by: str | None = Query(None, description="Field to sort by (name, diameter, population)"),
     sort_order: SortOrder = Query(SortOrder.ASC, description="Sort order"),
+    filter_expr: str | None = Query(None, alias="filter", description=FILTER_DESCRIPTION),
+    facets: str | None = Query(None, description=FACETS_DESCRIPTION),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    expand_expr: str | None = Query(None, alias="expand", description=EXPAND_DESCRIPTION),
     climate: str | None = Query(None, description="Filter by climate (partial match)"),
     terrain: str | None = Query(None, description="Filter by terrain (partial match)"),
     min_population: int | None = Query(None, description="Minimum population"),
     max_population: int | None = Query(None, description="Maximum population"),
 ) -> PaginatedResponse[PlanetSummary]:
     """List all planets with filtering, sorting, and pagination."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        all_planets_data = await swapi.get_all_planets()
-
-        # Convert to Planet models
-        planets = [Planet.from_swapi(data, data["id"]) for data in all_planets_data]
-
-        # Apply filters
-        planet_filter = PlanetFilter(
-            climate=climate,
-            terrain=terrain,
-            min_population=min_population,
-            max_population=max_population,
-            min_diameter=None,
-            max_diameter=None,
+        projection = parse_fields("planets", fields) if fields else None
+        expansion = parse_expand("planets", expand_expr) if expand_expr else ()
+        to_item = (
+            PlanetSummary.from_model if projection is None else partial(project, fields=projection)
         )
-        filtered = [p for p in planets if planet_filter.apply(p)]
+
+        await store.ensure_loaded()
+
+        table = store.table("planets")
+
+        # Categorical parameters, matched on the encoded columns
+        rows = table.match("climate", climate, partial=True)
+        rows &= table.match("terrain", terrain, partial=True)
+
+        # Numeric ranges, read from the sorted columns
+        rows &= table.within("population", min_population, max_population)
+
+        # Filter expression, resolved on the table indexes, within those rows
+        rows = select_rows(table, filter_expr, rows)
+        filtered = table.models_of(rows)
+
+        # Facet counts over the match bitmap, intersected with the value index bitmaps
+        facet_counts = count_facets(table, rows, facets)
+
+        # Keyset pagination, read from the table's pre-sorted index
+        if cursor is not None:
+            paginated = paginate_cursor(
+                table,
+                filtered,
+                cursor,
+                to_item,
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                key_mapper=PLANET_SORT_KEYS,
+                version=store.resource_versions["planets"],
+                facets=facet_counts,
+            )
+            return respond(
+                expand_page(store, "planets", paginated, expansion), projection, expansion
+            )
 
         # Sort
         sorted_planets = sort_items(
@@ -58,20 +112,14 @@ async def list_planets(
             key_mapper=PLANET_SORT_KEYS,
         )
 
-        # Convert to summaries
-        summaries = [
-            PlanetSummary(
-                id=p.id,
-                name=p.name,
-                climate=p.climate,
-                terrain=p.terrain,
-                population=p.population,
-            )
-            for p in sorted_planets
-        ]
-
-        return paginate(summaries, page=page, page_size=page_size)
+        # Paginate, converting only the items of the page
+        paginated = paginate(
+            sorted_planets, page=page, page_size=page_size, facets=facet_counts, to_item=to_item
+        )
+        return respond(expand_page(store, "planets", paginated, expansion), projection, expansion)
 
+    except (CursorError, FilterError, ExpansionError, ProjectionError) as e:
+        raise HTTPException(status_code=400, detail=e.message)
     except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
@@ -80,17 +128,20 @@ async def list_planets(
     "/search",
     response_model=list[PlanetSummary],
     summary="Search planets",
-    description="Search for planets by name.",
+    description="Search for planets by name, tolerating typos.",
 )
 async def search_planets(
     q: str = Query(..., min_length=1, description="Search query"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
 ) -> list[PlanetSummary]:
     """Search planets by name."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        results = await swapi.search_planets(q)
-        return [PlanetSummary.from_swapi(data, data["id"]) for data in results]
+        await store.ensure_loaded()
+        table = store.table("planets")
+        hits = store.search.search(q, resources=["planets"], limit=limit)
+        return [PlanetSummary.from_model(table.models[hit.id]) for hit in hits]
     except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
@@ -101,16 +152,28 @@ async def search_planets(
     summary="Get planet by ID",
     description="Get detailed information about a specific planet.",
 )
-async def get_planet(planet_id: int) -> Planet:
+async def get_planet(
+    planet_id: int,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    expand_expr: str | None = Query(None, alias="expand", description=EXPAND_DESCRIPTION),
+) -> Planet:
     """Get a single planet by ID."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        data = await swapi.get_planet(planet_id)
-        return Planet.from_swapi(data, planet_id)
-    except SWAPIError as e:
-        if e.status_code == 404:
+        projection = parse_fields("planets", fields) if fields else None
+        expansion = parse_expand("planets", expand_expr) if expand_expr else ()
+
+        await store.ensure_loaded()
+        planet = store.table("planets").get(planet_id)
+        if planet is None:
             raise HTTPException(status_code=404, detail=f"Planet with ID {planet_id} not found")
+
+        item = planet if projection is None else project(planet, projection)
+        return respond(expand(store, "planets", [item], expansion)[0], projection, expansion)
+    except (ExpansionError, ProjectionError) as e:
+        raise HTTPException(status_code=400, detail=e.message)
+    except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
 
@@ -122,20 +185,16 @@ async def get_planet(planet_id: int) -> Planet:
 )
 async def get_planet_residents(planet_id: int) -> list[PersonSummary]:
     """Get all residents of a planet."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        planet_data = await swapi.get_planet(planet_id)
-        planet = Planet.from_swapi(planet_data, planet_id)
-
-        if not planet.resident_ids:
-            return []
+        await store.ensure_loaded()
+        if store.table("planets").get(planet_id) is None:
+            raise HTTPException(status_code=404, detail=f"Planet with ID {planet_id} not found")
 
-        people_data = await swapi.get_multiple_by_ids("people", planet.resident_ids)
-        return [PersonSummary.from_swapi(data, data.get("id", 0)) for data in people_data]
+        people = store.related_models("planets", planet_id, "people")
+        return [PersonSummary.from_model(model) for model in people]
     except SWAPIError as e:
-        if e.status_code == 404:
-            raise HTTPException(status_code=404, detail=f"Planet with ID {planet_id} not found")
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
 
@@ -147,18 +206,14 @@ async def get_planet_residents(planet_id: int) -> list[PersonSummary]:
 )
 async def get_planet_films(planet_id: int) -> list[FilmSummary]:
     """Get all films featuring a planet."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        planet_data = await swapi.get_planet(planet_id)
-        planet = Planet.from_swapi(planet_data, planet_id)
-
-        if not planet.film_ids:
-            return []
+        await store.ensure_loaded()
+        if store.table("planets").get(planet_id) is None:
+            raise HTTPException(status_code=404, detail=f"Planet with ID {planet_id} not found")
 
-        films_data = await swapi.get_multiple_by_ids("films", planet.film_ids)
-        return [FilmSummary.from_swapi(data, data.get("id", 0)) for data in films_data]
+        films = store.related_models("planets", planet_id, "films")
+        return [FilmSummary.from_model(model) for model in films]
     except SWAPIError as e:
-        if e.status_code == 404:
-            raise HTTPException(status_code=404, detail=f"Planet with ID {planet_id} not found")
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
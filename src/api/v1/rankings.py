@@ -5,44 +5,41 @@ Funcionalidades:
 - Top N personagens por altura/massa
 - Top N naves por velocidade/custo
 - Top N planetas por população
+- Posição/percentil de uma entidade em qualquer campo numérico
 - Timeline cronológica dos filmes
 """
 
-from fastapi import APIRouter, Depends, Query
+import heapq
 
-from src.dependencies import get_swapi_client
-from src.services.swapi_client import SWAPIClient
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from src.dependencies import get_dataset_store
+from src.models.base import SortOrder
+from src.services.dataset_store import NUMERIC_FIELDS, DatasetStore, display_name
+from src.services.swapi_client import SWAPIError
 
 router = APIRouter(prefix="/api/v1/rankings", tags=["Rankings"])
 
 
-def _parse_int(value: str | None) -> int | None:
-    """Parse string para int, tratando valores 'unknown'."""
-    if value is None or value == "unknown" or value == "n/a":
-        return None
+async def _loaded(store: DatasetStore) -> DatasetStore:
+    """Garante que o snapshot esteja carregado, convertendo erros da SWAPI em HTTP."""
     try:
-        # Remove vírgulas e espaços
-        clean = str(value).replace(",", "").replace(" ", "")
-        return int(float(clean))
-    except (ValueError, TypeError):
-        return None
-
+        return await store.ensure_loaded()
+    except SWAPIError as e:
+        raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
-def _parse_float(value: str | None) -> float | None:
-    """Parse string para float, tratando valores 'unknown'."""
-    if value is None or value == "unknown" or value == "n/a":
-        return None
-    try:
-        clean = str(value).replace(",", "").replace(" ", "")
-        return float(clean)
-    except (ValueError, TypeError):
-        return None
 
+def _top(
+    store: DatasetStore, resource: str, field: str, limit: int, columns: tuple[str, ...]
+) -> list[dict]:
+    """
+    Top N entidades por um campo numérico já normalizado na ingestão.
 
-def _extract_id(url: str) -> int:
-    """Extrai ID numérico de uma URL SWAPI."""
-    parts = url.rstrip("/").split("/")
-    return int(parts[-1])
+    Valores desconhecidos ficam de fora; empates mantêm a ordem da SWAPI.
+    """
+    models = (m for m in store.table(resource).models.values() if getattr(m, field) is not None)
+    top = heapq.nlargest(limit, models, key=lambda m: getattr(m, field))
+    return [{column: getattr(m, column) for column in columns} for m in top]
 
 
 @router.get(
@@ -52,27 +49,11 @@ def _extract_id(url: str) -> int:
 )
 async def get_tallest_characters(
     limit: int = Query(10, ge=1, le=50, description="Número de resultados"),
-    swapi: SWAPIClient = Depends(get_swapi_client),
+    store: DatasetStore = Depends(get_dataset_store),
 ) -> list[dict]:
     """Retorna os personagens mais altos."""
-    all_people = await swapi.get_all_people()
-
-    # Filtrar e ordenar por altura (trabalhando com dicts)
-    with_height = []
-    for p in all_people:
-        height = _parse_int(p.get("height"))
-        if height is not None:
-            with_height.append(
-                {
-                    "id": _extract_id(p.get("url", "")),
-                    "name": p.get("name"),
-                    "height": height,
-                    "gender": p.get("gender"),
-                }
-            )
-
-    sorted_by_height = sorted(with_height, key=lambda x: x["height"], reverse=True)
-    return sorted_by_height[:limit]
+    await _loaded(store)
+    return _top(store, "people", "height", limit, ("id", "name", "height", "gender"))
 
 
 @router.get(
@@ -82,28 +63,16 @@ async def get_tallest_characters(
 )
 async def get_most_appeared_characters(
     limit: int = Query(10, ge=1, le=50, description="Número de resultados"),
-    swapi: SWAPIClient = Depends(get_swapi_client),
+    store: DatasetStore = Depends(get_dataset_store),
 ) -> list[dict]:
     """Retorna os personagens com mais aparições em filmes."""
-    all_people = await swapi.get_all_people()
-
-    # Contar aparições em filmes
-    with_films = []
-    for p in all_people:
-        films = p.get("films", [])
-        film_count = len(films) if isinstance(films, list) else 0
-        if film_count > 0:
-            with_films.append(
-                {
-                    "id": _extract_id(p.get("url", "")),
-                    "name": p.get("name"),
-                    "films_count": film_count,
-                    "gender": p.get("gender"),
-                }
-            )
-
-    sorted_by_films = sorted(with_films, key=lambda x: x["films_count"], reverse=True)
-    return sorted_by_films[:limit]
+    await _loaded(store)
+    people = (p for p in store.table("people").models.values() if p.film_ids)
+    top = heapq.nlargest(limit, people, key=lambda p: len(p.film_ids))
+    return [
+        {"id": p.id, "name": p.name, "films_count": len(p.film_ids), "gender": p.gender}
+        for p in top
+    ]
 
 
 @router.get(
@@ -113,27 +82,11 @@ async def get_most_appeared_characters(
 )
 async def get_heaviest_characters(
     limit: int = Query(10, ge=1, le=50, description="Número de resultados"),
-    swapi: SWAPIClient = Depends(get_swapi_client),
+    store: DatasetStore = Depends(get_dataset_store),
 ) -> list[dict]:
     """Retorna os personagens mais pesados."""
-    all_people = await swapi.get_all_people()
-
-    # Filtrar e ordenar por massa
-    with_mass = []
-    for p in all_people:
-        mass = _parse_float(p.get("mass"))
-        if mass is not None:
-            with_mass.append(
-                {
-                    "id": _extract_id(p.get("url", "")),
-                    "name": p.get("name"),
-                    "mass": mass,
-                    "gender": p.get("gender"),
-                }
-            )
-
-    sorted_by_mass = sorted(with_mass, key=lambda x: x["mass"], reverse=True)
-    return sorted_by_mass[:limit]
+    await _loaded(store)
+    return _top(store, "people", "mass", limit, ("id", "name", "mass", "gender"))
 
 
 @router.get(
@@ -143,28 +96,13 @@ async def get_heaviest_characters(
 )
 async def get_fastest_starships(
     limit: int = Query(10, ge=1, le=50, description="Número de resultados"),
-    swapi: SWAPIClient = Depends(get_swapi_client),
+    store: DatasetStore = Depends(get_dataset_store),
 ) -> list[dict]:
     """Retorna as naves mais rápidas por MGLT."""
-    all_starships = await swapi.get_all_starships()
-
-    # Filtrar e ordenar por MGLT
-    with_speed = []
-    for s in all_starships:
-        mglt = _parse_int(s.get("MGLT"))
-        if mglt is not None:
-            with_speed.append(
-                {
-                    "id": _extract_id(s.get("url", "")),
-                    "name": s.get("name"),
-                    "model": s.get("model"),
-                    "mglt": mglt,
-                    "starship_class": s.get("starship_class"),
-                }
-            )
-
-    sorted_by_speed = sorted(with_speed, key=lambda x: x["mglt"], reverse=True)
-    return sorted_by_speed[:limit]
+    await _loaded(store)
+    return _top(
+        store, "starships", "mglt", limit, ("id", "name", "model", "mglt", "starship_class")
+    )
 
 
 @router.get(
@@ -174,28 +112,12 @@ async def get_fastest_starships(
 )
 async def get_most_expensive_starships(
     limit: int = Query(10, ge=1, le=50, description="Número de resultados"),
-    swapi: SWAPIClient = Depends(get_swapi_client),
+    store: DatasetStore = Depends(get_dataset_store),
 ) -> list[dict]:
     """Retorna as naves mais caras."""
-    all_starships = await swapi.get_all_starships()
-
-    # Filtrar e ordenar por custo
-    with_cost = []
-    for s in all_starships:
-        cost = _parse_int(s.get("cost_in_credits"))
-        if cost is not None:
-            with_cost.append(
-                {
-                    "id": _extract_id(s.get("url", "")),
-                    "name": s.get("name"),
-                    "model": s.get("model"),
-                    "cost_in_credits": cost,
-                    "manufacturer": s.get("manufacturer"),
-                }
-            )
-
-    sorted_by_cost = sorted(with_cost, key=lambda x: x["cost_in_credits"], reverse=True)
-    return sorted_by_cost[:limit]
+    await _loaded(store)
+    columns = ("id", "name", "model", "cost_in_credits", "manufacturer")
+    return _top(store, "starships", "cost_in_credits", limit, columns)
 
 
 @router.get(
@@ -205,28 +127,12 @@ async def get_most_expensive_starships(
 )
 async def get_largest_starships(
     limit: int = Query(10, ge=1, le=50, description="Número de resultados"),
-    swapi: SWAPIClient = Depends(get_swapi_client),
+    store: DatasetStore = Depends(get_dataset_store),
 ) -> list[dict]:
     """Retorna as maiores naves."""
-    all_starships = await swapi.get_all_starships()
-
-    # Filtrar e ordenar por comprimento
-    with_length = []
-    for s in all_starships:
-        length = _parse_float(s.get("length"))
-        if length is not None:
-            with_length.append(
-                {
-                    "id": _extract_id(s.get("url", "")),
-                    "name": s.get("name"),
-                    "model": s.get("model"),
-                    "length": length,
-                    "starship_class": s.get("starship_class"),
-                }
-            )
-
-    sorted_by_length = sorted(with_length, key=lambda x: x["length"], reverse=True)
-    return sorted_by_length[:limit]
+    await _loaded(store)
+    columns = ("id", "name", "model", "length", "starship_class")
+    return _top(store, "starships", "length", limit, columns)
 
 
 @router.get(
@@ -236,28 +142,12 @@ async def get_largest_starships(
 )
 async def get_most_populated_planets(
     limit: int = Query(10, ge=1, le=50, description="Número de resultados"),
-    swapi: SWAPIClient = Depends(get_swapi_client),
+    store: DatasetStore = Depends(get_dataset_store),
 ) -> list[dict]:
     """Retorna os planetas mais populosos."""
-    all_planets = await swapi.get_all_planets()
-
-    # Filtrar e ordenar por população
-    with_population = []
-    for p in all_planets:
-        population = _parse_int(p.get("population"))
-        if population is not None:
-            with_population.append(
-                {
-                    "id": _extract_id(p.get("url", "")),
-                    "name": p.get("name"),
-                    "population": population,
-                    "climate": p.get("climate"),
-                    "terrain": p.get("terrain"),
-                }
-            )
-
-    sorted_by_population = sorted(with_population, key=lambda x: x["population"], reverse=True)
-    return sorted_by_population[:limit]
+    await _loaded(store)
+    columns = ("id", "name", "population", "climate", "terrain")
+    return _top(store, "planets", "population", limit, columns)
 
 
 @router.get(
@@ -267,28 +157,12 @@ async def get_most_populated_planets(
 )
 async def get_largest_planets(
     limit: int = Query(10, ge=1, le=50, description="Número de resultados"),
-    swapi: SWAPIClient = Depends(get_swapi_client),
+    store: DatasetStore = Depends(get_dataset_store),
 ) -> list[dict]:
     """Retorna os maiores planetas."""
-    all_planets = await swapi.get_all_planets()
-
-    # Filtrar e ordenar por diâmetro
-    with_diameter = []
-    for p in all_planets:
-        diameter = _parse_int(p.get("diameter"))
-        if diameter is not None:
-            with_diameter.append(
-                {
-                    "id": _extract_id(p.get("url", "")),
-                    "name": p.get("name"),
-                    "diameter": diameter,
-                    "climate": p.get("climate"),
-                    "terrain": p.get("terrain"),
-                }
-            )
-
-    sorted_by_diameter = sorted(with_diameter, key=lambda x: x["diameter"], reverse=True)
-    return sorted_by_diameter[:limit]
+    await _loaded(store)
+    columns = ("id", "name", "diameter", "climate", "terrain")
+    return _top(store, "planets", "diameter", limit, columns)
 
 
 @router.get(
@@ -297,23 +171,102 @@ async def get_largest_planets(
     description="Retorna os filmes ordenados por número de personagens.",
 )
 async def get_films_by_character_count(
-    swapi: SWAPIClient = Depends(get_swapi_client),
+    store: DatasetStore = Depends(get_dataset_store),
 ) -> list[dict]:
     """Retorna filmes ordenados por número de personagens."""
-    all_films = await swapi.get_all_films()
-
-    films_data = []
-    for f in all_films:
-        films_data.append(
-            {
-                "id": _extract_id(f.get("url", "")),
-                "episode_id": f.get("episode_id"),
-                "title": f.get("title"),
-                "character_count": len(f.get("characters", [])),
-                "planet_count": len(f.get("planets", [])),
-                "starship_count": len(f.get("starships", [])),
-                "release_date": f.get("release_date"),
-            }
+    await _loaded(store)
+    films_data = [
+        {
+            "id": f.id,
+            "episode_id": f.episode_id,
+            "title": f.title,
+            "character_count": len(f.character_ids),
+            "planet_count": len(f.planet_ids),
+            "starship_count": len(f.starship_ids),
+            "release_date": f.release_date,
+        }
+        for f in store.table("films").models.values()
+    ]
+    return sorted(films_data, key=lambda x: x["character_count"], reverse=True)
+
+
+@router.get(
+    "/position/{resource}/{field}/{entity_id}",
+    summary="Posição e percentil de uma entidade",
+    description=(
+        "Retorna o rank, o percentil e os vizinhos de uma entidade em um campo numérico "
+        "(ex.: a Millennium Falcon é mais rápida que 87% das naves). "
+        "Campos disponíveis: "
+        + "; ".join(
+            f"{resource}: {', '.join(fields)}" for resource, fields in NUMERIC_FIELDS.items()
+        )
+    ),
+)
+async def get_entity_position(
+    resource: str,
+    field: str,
+    entity_id: int,
+    order: SortOrder = Query(SortOrder.DESC, description="desc: maior valor = rank 1"),
+    neighbors: int = Query(2, ge=0, le=10, description="Vizinhos de cada lado"),
+    store: DatasetStore = Depends(get_dataset_store),
+) -> dict:
+    """Retorna a posição de uma entidade usando a coluna ordenada (bisect, O(log n))."""
+    if resource not in NUMERIC_FIELDS:
+        raise HTTPException(status_code=404, detail=f"Recurso desconhecido: {resource}")
+    if field not in NUMERIC_FIELDS[resource]:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Campo inválido para {resource}. Use: {', '.join(NUMERIC_FIELDS[resource])}",
         )
 
-    return sorted(films_data, key=lambda x: x["character_count"], reverse=True)
+    await _loaded(store)
+    table = store.table(resource)
+    entity = table.get(entity_id)
+    if entity is None:
+        raise HTTPException(status_code=404, detail=f"Entidade {entity_id} não encontrada")
+
+    value = getattr(entity, field, None)
+    if value is None:
+        raise HTTPException(
+            status_code=404, detail=f"{display_name(entity)} não possui valor para '{field}'"
+        )
+
+    column = table.column(field)
+    total = len(column)
+    position = column.index_of(entity_id, float(value))
+    below = column.count_below(float(value))
+    above = column.count_above(float(value))
+
+    # "Melhor que" depende da direção do ranking
+    if order == SortOrder.DESC:
+        rank, beaten = above + 1, below
+        ahead = range(position + 1, min(total, position + 1 + neighbors))
+        behind = range(position - 1, max(-1, position - 1 - neighbors), -1)
+    else:
+        rank, beaten = below + 1, above
+        ahead = range(position - 1, max(-1, position - 1 - neighbors), -1)
+        behind = range(position + 1, min(total, position + 1 + neighbors))
+
+    def _neighbor(idx: int) -> dict:
+        neighbor_id = column.ids[idx]
+        return {
+            "id": neighbor_id,
+            "name": display_name(table.models[neighbor_id]),
+            field: column.values[idx],
+        }
+
+    return {
+        "resource": resource,
+        "field": field,
+        "id": entity_id,
+        "name": display_name(entity),
+        field: value,
+        "rank": rank,
+        "total": total,
+        "percentile": round(beaten / total * 100, 1),
+        "better_than": beaten,
+        "neighbors": {
+            "ahead": [_neighbor(i) for i in ahead],
+            "behind": [_neighbor(i) for i in behind],
+        },
+    }
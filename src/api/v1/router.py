@@ -2,10 +2,17 @@
 
 from fastapi import APIRouter
 
+from src.api.v1.aggregate import router as aggregate_router
+from src.api.v1.analytics import router as analytics_router
+from src.api.v1.autocomplete import router as autocomplete_router
+from src.api.v1.batch import router as batch_router
 from src.api.v1.comparison import router as comparison_router
 from src.api.v1.films import router as films_router
+from src.api.v1.graph import router as graph_router
 from src.api.v1.people import router as people_router
 from src.api.v1.planets import router as planets_router
+from src.api.v1.search import router as search_router
+from src.api.v1.similar import router as similar_router
 from src.api.v1.species import router as species_router
 from src.api.v1.starships import router as starships_router
 from src.api.v1.statistics import router as statistics_router
@@ -22,3 +29,10 @@ router.include_router(vehicles_router, prefix="/vehicles", tags=["Vehicles"])
 router.include_router(species_router, prefix="/species", tags=["Species"])
 router.include_router(statistics_router, prefix="/statistics", tags=["Statistics"])
 router.include_router(comparison_router, prefix="/compare", tags=["Comparison"])
+router.include_router(search_router, prefix="/search", tags=["Search"])
+router.include_router(autocomplete_router, prefix="/autocomplete", tags=["Search"])
+router.include_router(analytics_router, prefix="/analytics", tags=["Analytics"])
+router.include_router(aggregate_router, prefix="/aggregate", tags=["Analytics"])
+router.include_router(similar_router, prefix="/similar", tags=["Analytics"])
+router.include_router(graph_router, prefix="/graph", tags=["Graph"])
+router.include_router(batch_router, prefix="/batch", tags=["Batch"])
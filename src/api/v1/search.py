@@ -0,0 +1,45 @@
+"""Unified search API endpoints."""
+
+from fastapi import APIRouter, HTTPException, Query
+
+from src.dependencies import get_dataset_store
+from src.models.search import SearchResult
+from src.services.search_index import SEARCH_FIELDS
+from src.services.swapi_client import SWAPIError
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_model=list[SearchResult],
+    summary="Search all resources",
+    description=(
+        "Full-text search across characters, films, starships, vehicles, species and planets. "
+        "Matches names, models, classifications and titles, tolerates typos and ranks results "
+        "by relevance. Served from an in-process index, without calls to SWAPI."
+    ),
+)
+async def search(
+    q: str = Query(..., min_length=1, description="Search query"),
+    types: list[str] | None = Query(
+        None, description=f"Resources to search ({', '.join(SEARCH_FIELDS)})"
+    ),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+) -> list[SearchResult]:
+    """Search all resources."""
+    if types:
+        unknown = [t for t in types if t not in SEARCH_FIELDS]
+        if unknown:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown resource type(s): {', '.join(unknown)}"
+            )
+
+    store = get_dataset_store()
+
+    try:
+        await store.ensure_loaded()
+        hits = store.search.search(q, resources=types, limit=limit)
+        return [SearchResult(**hit._asdict()) for hit in hits]
+    except SWAPIError as e:
+        raise HTTPException(status_code=e.status_code or 500, detail=e.message)
@@ -0,0 +1,79 @@
+"""Similar entities API endpoints."""
+
+from fastapi import APIRouter, HTTPException, Query
+
+from src.dependencies import get_dataset_store
+from src.models.analytics import SimilarEntity, SimilarityResult
+from src.services.dataset_store import RESOURCE_MODELS, display_name
+from src.services.similarity import FeatureMatrix, SimilarityError, parse_features
+from src.services.swapi_client import SWAPIError
+
+router = APIRouter()
+
+
+@router.get(
+    "/{resource}/{entity_id}",
+    response_model=SimilarityResult,
+    summary="Similar entities",
+    description=(
+        "Find the entities most similar to one entity, e.g. the starships closest to the "
+        "X-wing (`/similar/starships/12`) or the characters physically closest to Luke "
+        "(`/similar/people/1?fields=height&fields=mass`). Numeric fields are scaled to [0, 1] "
+        "by their range (log scale for heavy-tailed ones such as cost or population) and "
+        "categorical fields match or not (Jaccard for multi-valued ones such as climate). "
+        "The distance is the mean over the features known for both entities; each result "
+        "shows the share contributed by every feature. Feature matrices are cached until "
+        "the dataset changes."
+    ),
+)
+async def get_similar(
+    resource: str,
+    entity_id: int,
+    fields: list[str] = Query(
+        [], description="Features to compare (default: all but birth_year_aby)"
+    ),
+    limit: int = Query(10, ge=1, le=50, description="Number of results"),
+) -> SimilarityResult:
+    """Nearest neighbours of an entity."""
+    if resource not in RESOURCE_MODELS:
+        raise HTTPException(status_code=404, detail=f"Unknown resource: {resource}")
+
+    store = get_dataset_store()
+
+    try:
+        await store.ensure_loaded()
+    except SWAPIError as e:
+        raise HTTPException(status_code=e.status_code or 500, detail=e.message)
+
+    table = store.table(resource)
+    entity = table.get(entity_id)
+    if entity is None:
+        raise HTTPException(status_code=404, detail=f"{resource} {entity_id} not found")
+
+    matrix: FeatureMatrix = store.views.get(
+        ("similarity", resource), {resource}, lambda: FeatureMatrix(table)
+    )
+    try:
+        features = parse_features(matrix, fields)
+    except SimilarityError as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+    return SimilarityResult(
+        resource=resource,
+        id=entity_id,
+        name=display_name(entity),
+        features=features,
+        results=[
+            SimilarEntity(
+                id=neighbor.id,
+                name=neighbor.name,
+                distance=round(neighbor.distance, 4),
+                similarity=round(1 - neighbor.distance, 4),
+                contributions={
+                    feature: None if share is None else round(share, 4)
+                    for feature, share in neighbor.contributions.items()
+                },
+            )
+            for neighbor in matrix.nearest(entity_id, features, limit)
+        ],
+    )
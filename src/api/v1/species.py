@@ -1,13 +1,36 @@
 """Species API endpoints."""
 
+from functools import partial
+
 from fastapi import APIRouter, HTTPException, Query
 
-from src.dependencies import get_swapi_client
+from src.dependencies import get_dataset_store
 from src.models.base import PaginatedResponse, SortOrder
 from src.models.people import PersonSummary
 from src.models.species import Species, SpeciesSummary
+from src.services.expansion import (
+    EXPAND_DESCRIPTION,
+    ExpansionError,
+    expand,
+    expand_page,
+    parse_expand,
+)
+from src.services.projection import (
+    FIELDS_DESCRIPTION,
+    ProjectionError,
+    parse_fields,
+    project,
+    respond,
+)
+from src.services.query_filter import (
+    FACETS_DESCRIPTION,
+    FILTER_DESCRIPTION,
+    FilterError,
+    count_facets,
+    select_rows,
+)
 from src.services.swapi_client import SWAPIError
-from src.utils.pagination import paginate
+from src.utils.pagination import CURSOR_DESCRIPTION, CursorError, paginate, paginate_cursor
 from src.utils.sorting import sort_items
 
 router = APIRouter()
@@ -24,44 +47,69 @@ async def list_species(
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
     sort_by: str | None = Query(None, description="Field to sort by (name, classification)"),
     sort_order: SortOrder = Query(SortOrder.ASC, description="Sort order"),
+    filter_expr: str | None = Query(None, alias="filter", description=FILTER_DESCRIPTION),
+    facets: str | None = Query(None, description=FACETS_DESCRIPTION),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    expand_expr: str | None = Query(None, alias="expand", description=EXPAND_DESCRIPTION),
     classification: str | None = Query(None, description="Filter by classification"),
     designation: str | None = Query(
         None, description="Filter by designation (sentient/non-sentient)"
     ),
 ) -> PaginatedResponse[SpeciesSummary]:
     """List all species with pagination."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        all_species_data = await swapi.get_all_species()
-
-        # Convert to Species models
-        species_list = [Species.from_swapi(data, data["id"]) for data in all_species_data]
-
-        # Apply filters
-        filtered = species_list
-        if classification:
-            filtered = [s for s in filtered if classification.lower() in s.classification.lower()]
-        if designation:
-            filtered = [s for s in filtered if designation.lower() in s.designation.lower()]
+        projection = parse_fields("species", fields) if fields else None
+        expansion = parse_expand("species", expand_expr) if expand_expr else ()
+        to_item = (
+            SpeciesSummary.from_model if projection is None else partial(project, fields=projection)
+        )
+
+        await store.ensure_loaded()
+
+        table = store.table("species")
+
+        # Categorical parameters, matched on the encoded columns
+        rows = table.match("classification", classification, partial=True)
+        rows &= table.match("designation", designation, partial=True)
+
+        # Filter expression, resolved on the table indexes, within those rows
+        rows = select_rows(table, filter_expr, rows)
+        filtered = table.models_of(rows)
+
+        # Facet counts over the match bitmap, intersected with the value index bitmaps
+        facet_counts = count_facets(table, rows, facets)
+
+        # Keyset pagination, read from the table's pre-sorted index
+        if cursor is not None:
+            paginated = paginate_cursor(
+                table,
+                filtered,
+                cursor,
+                to_item,
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                version=store.resource_versions["species"],
+                facets=facet_counts,
+            )
+            return respond(
+                expand_page(store, "species", paginated, expansion), projection, expansion
+            )
 
         # Sort
         sorted_species = sort_items(filtered, sort_by=sort_by, sort_order=sort_order)
 
-        # Convert to summaries
-        summaries = [
-            SpeciesSummary(
-                id=s.id,
-                name=s.name,
-                classification=s.classification,
-                designation=s.designation,
-                language=s.language,
-            )
-            for s in sorted_species
-        ]
-
-        return paginate(summaries, page=page, page_size=page_size)
+        # Paginate, converting only the items of the page
+        paginated = paginate(
+            sorted_species, page=page, page_size=page_size, facets=facet_counts, to_item=to_item
+        )
+        return respond(expand_page(store, "species", paginated, expansion), projection, expansion)
 
+    except (CursorError, FilterError, ExpansionError, ProjectionError) as e:
+        raise HTTPException(status_code=400, detail=e.message)
     except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
@@ -72,16 +120,28 @@ async def list_species(
     summary="Get species by ID",
     description="Get detailed information about a specific species.",
 )
-async def get_species_by_id(species_id: int) -> Species:
+async def get_species_by_id(
+    species_id: int,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    expand_expr: str | None = Query(None, alias="expand", description=EXPAND_DESCRIPTION),
+) -> Species:
     """Get a single species by ID."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        data = await swapi.get_species(species_id)
-        return Species.from_swapi(data, species_id)
-    except SWAPIError as e:
-        if e.status_code == 404:
+        projection = parse_fields("species", fields) if fields else None
+        expansion = parse_expand("species", expand_expr) if expand_expr else ()
+
+        await store.ensure_loaded()
+        species = store.table("species").get(species_id)
+        if species is None:
             raise HTTPException(status_code=404, detail=f"Species with ID {species_id} not found")
+
+        item = species if projection is None else project(species, projection)
+        return respond(expand(store, "species", [item], expansion)[0], projection, expansion)
+    except (ExpansionError, ProjectionError) as e:
+        raise HTTPException(status_code=400, detail=e.message)
+    except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
 
@@ -93,18 +153,14 @@ async def get_species_by_id(species_id: int) -> Species:
 )
 async def get_species_people(species_id: int) -> list[PersonSummary]:
     """Get all people of a species."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        species_data = await swapi.get_species(species_id)
-        species = Species.from_swapi(species_data, species_id)
-
-        if not species.people_ids:
-            return []
+        await store.ensure_loaded()
+        if store.table("species").get(species_id) is None:
+            raise HTTPException(status_code=404, detail=f"Species with ID {species_id} not found")
 
-        people_data = await swapi.get_multiple_by_ids("people", species.people_ids)
-        return [PersonSummary.from_swapi(data, data.get("id", 0)) for data in people_data]
+        people = store.related_models("species", species_id, "people")
+        return [PersonSummary.from_model(model) for model in people]
     except SWAPIError as e:
-        if e.status_code == 404:
-            raise HTTPException(status_code=404, detail=f"Species with ID {species_id} not found")
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
@@ -1,13 +1,36 @@
 """Starships API endpoints."""
 
+from functools import partial
+
 from fastapi import APIRouter, HTTPException, Query
 
-from src.dependencies import get_swapi_client
+from src.dependencies import get_dataset_store
 from src.models.base import PaginatedResponse, SortOrder
 from src.models.people import PersonSummary
-from src.models.starships import Starship, StarshipFilter, StarshipSummary
+from src.models.starships import Starship, StarshipSummary
+from src.services.expansion import (
+    EXPAND_DESCRIPTION,
+    ExpansionError,
+    expand,
+    expand_page,
+    parse_expand,
+)
+from src.services.projection import (
+    FIELDS_DESCRIPTION,
+    ProjectionError,
+    parse_fields,
+    project,
+    respond,
+)
+from src.services.query_filter import (
+    FACETS_DESCRIPTION,
+    FILTER_DESCRIPTION,
+    FilterError,
+    count_facets,
+    select_rows,
+)
 from src.services.swapi_client import SWAPIError
-from src.utils.pagination import paginate
+from src.utils.pagination import CURSOR_DESCRIPTION, CursorError, paginate, paginate_cursor
 from src.utils.sorting import STARSHIP_SORT_KEYS, sort_items
 
 router = APIRouter()
@@ -26,6 +49,11 @@ async def list_starships(
         None, description="Field to sort by (name, length, cost_in_credits, hyperdrive_rating)"
     ),
     sort_order: SortOrder = Query(SortOrder.ASC, description="Sort order"),
+    filter_expr: str | None = Query(None, alias="filter", description=FILTER_DESCRIPTION),
+    facets: str | None = Query(None, description=FACETS_DESCRIPTION),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    expand_expr: str | None = Query(None, alias="expand", description=EXPAND_DESCRIPTION),
     manufacturer: str | None = Query(None, description="Filter by manufacturer (partial match)"),
     starship_class: str | None = Query(
         None, description="Filter by starship class (partial match)"
@@ -36,26 +64,53 @@ async def list_starships(
     max_length: float | None = Query(None, description="Maximum length in meters"),
 ) -> PaginatedResponse[StarshipSummary]:
     """List all starships with filtering, sorting, and pagination."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        all_starships_data = await swapi.get_all_starships()
-
-        # Convert to Starship models
-        starships = [Starship.from_swapi(data, data["id"]) for data in all_starships_data]
-
-        # Apply filters
-        starship_filter = StarshipFilter(
-            manufacturer=manufacturer,
-            starship_class=starship_class,
-            min_cost=min_cost,
-            max_cost=max_cost,
-            min_length=min_length,
-            max_length=max_length,
-            min_hyperdrive=None,
-            max_hyperdrive=None,
+        projection = parse_fields("starships", fields) if fields else None
+        expansion = parse_expand("starships", expand_expr) if expand_expr else ()
+        to_item = (
+            StarshipSummary.from_model
+            if projection is None
+            else partial(project, fields=projection)
         )
-        filtered = [s for s in starships if starship_filter.apply(s)]
+
+        await store.ensure_loaded()
+
+        table = store.table("starships")
+
+        # Categorical parameters, matched on the encoded columns
+        rows = table.match("manufacturer", manufacturer, partial=True)
+        rows &= table.match("starship_class", starship_class, partial=True)
+
+        # Numeric ranges, read from the sorted columns
+        rows &= table.within("cost_in_credits", min_cost, max_cost)
+        rows &= table.within("length", min_length, max_length)
+
+        # Filter expression, resolved on the table indexes, within those rows
+        rows = select_rows(table, filter_expr, rows)
+        filtered = table.models_of(rows)
+
+        # Facet counts over the match bitmap, intersected with the value index bitmaps
+        facet_counts = count_facets(table, rows, facets)
+
+        # Keyset pagination, read from the table's pre-sorted index
+        if cursor is not None:
+            paginated = paginate_cursor(
+                table,
+                filtered,
+                cursor,
+                to_item,
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                key_mapper=STARSHIP_SORT_KEYS,
+                version=store.resource_versions["starships"],
+                facets=facet_counts,
+            )
+            return respond(
+                expand_page(store, "starships", paginated, expansion), projection, expansion
+            )
 
         # Sort
         sorted_starships = sort_items(
@@ -65,24 +120,18 @@ async def list_starships(
             key_mapper=STARSHIP_SORT_KEYS,
         )
 
-        # Convert to summaries
-        summaries = [
-            StarshipSummary(
-                id=s.id,
-                name=s.name,
-                model=s.model,
-                starship_class=s.starship_class,
-                manufacturer=s.manufacturer,
-                max_atmosphering_speed=s.max_atmosphering_speed
-                if s.max_atmosphering_speed not in ("n/a", "unknown")
-                else None,
-                hyperdrive_rating=s.hyperdrive_rating,
-            )
-            for s in sorted_starships
-        ]
-
-        return paginate(summaries, page=page, page_size=page_size)
+        # Paginate, converting only the items of the page
+        paginated = paginate(
+            sorted_starships,
+            page=page,
+            page_size=page_size,
+            facets=facet_counts,
+            to_item=to_item,
+        )
+        return respond(expand_page(store, "starships", paginated, expansion), projection, expansion)
 
+    except (CursorError, FilterError, ExpansionError, ProjectionError) as e:
+        raise HTTPException(status_code=400, detail=e.message)
     except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
@@ -91,17 +140,20 @@ async def list_starships(
     "/search",
     response_model=list[StarshipSummary],
     summary="Search starships",
-    description="Search for starships by name or model.",
+    description="Search for starships by name or model, tolerating typos.",
 )
 async def search_starships(
     q: str = Query(..., min_length=1, description="Search query"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
 ) -> list[StarshipSummary]:
     """Search starships by name or model."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        results = await swapi.search_starships(q)
-        return [StarshipSummary.from_swapi(data, data["id"]) for data in results]
+        await store.ensure_loaded()
+        table = store.table("starships")
+        hits = store.search.search(q, resources=["starships"], limit=limit)
+        return [StarshipSummary.from_model(table.models[hit.id]) for hit in hits]
     except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
@@ -112,16 +164,28 @@ async def search_starships(
     summary="Get starship by ID",
     description="Get detailed information about a specific starship.",
 )
-async def get_starship(starship_id: int) -> Starship:
+async def get_starship(
+    starship_id: int,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    expand_expr: str | None = Query(None, alias="expand", description=EXPAND_DESCRIPTION),
+) -> Starship:
     """Get a single starship by ID."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        data = await swapi.get_starship(starship_id)
-        return Starship.from_swapi(data, starship_id)
-    except SWAPIError as e:
-        if e.status_code == 404:
+        projection = parse_fields("starships", fields) if fields else None
+        expansion = parse_expand("starships", expand_expr) if expand_expr else ()
+
+        await store.ensure_loaded()
+        starship = store.table("starships").get(starship_id)
+        if starship is None:
             raise HTTPException(status_code=404, detail=f"Starship with ID {starship_id} not found")
+
+        item = starship if projection is None else project(starship, projection)
+        return respond(expand(store, "starships", [item], expansion)[0], projection, expansion)
+    except (ExpansionError, ProjectionError) as e:
+        raise HTTPException(status_code=400, detail=e.message)
+    except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
 
@@ -133,18 +197,14 @@ async def get_starship(starship_id: int) -> Starship:
 )
 async def get_starship_pilots(starship_id: int) -> list[PersonSummary]:
     """Get all pilots of a starship."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        starship_data = await swapi.get_starship(starship_id)
-        starship = Starship.from_swapi(starship_data, starship_id)
-
-        if not starship.pilot_ids:
-            return []
+        await store.ensure_loaded()
+        if store.table("starships").get(starship_id) is None:
+            raise HTTPException(status_code=404, detail=f"Starship with ID {starship_id} not found")
 
-        people_data = await swapi.get_multiple_by_ids("people", starship.pilot_ids)
-        return [PersonSummary.from_swapi(data, data.get("id", 0)) for data in people_data]
+        people = store.related_models("starships", starship_id, "people")
+        return [PersonSummary.from_model(model) for model in people]
     except SWAPIError as e:
-        if e.status_code == 404:
-            raise HTTPException(status_code=404, detail=f"Starship with ID {starship_id} not found")
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
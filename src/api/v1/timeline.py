@@ -5,20 +5,78 @@ Funcionalidades:
 - Cronologia de filmes por data de lançamento
 - Cronologia de filmes por ordem dos episódios (in-universe)
 - Eventos significativos do universo
+- Jornadas de personagens pelos filmes (individual e em lote)
+- Linha do tempo de nascimentos (BBY/ABY), idades e gerações
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
-from src.dependencies import get_swapi_client
-from src.services.swapi_client import SWAPIClient
+from src.dependencies import get_dataset_store
+from src.models.normalization import parse_birth_year, parse_number
+from src.models.people import Person
+from src.services.dataset_store import DatasetStore, SortedColumn
+from src.services.swapi_client import SWAPIError
+from src.services.timeline_index import (
+    EPISODE_YEARS,
+    TimelineIndex,
+    age_at,
+    ages_between,
+    born_between,
+    format_year,
+    generations,
+)
 
 router = APIRouter(prefix="/api/v1/timeline", tags=["Timeline"])
 
+MAX_JOURNEYS = 100
+
+
+async def _store() -> DatasetStore:
+    """Store do dataset, carregado uma vez por requisição."""
+    store = get_dataset_store()
+
+    try:
+        await store.ensure_loaded()
+    except SWAPIError as e:
+        raise HTTPException(status_code=e.status_code or 500, detail=e.message)
+    return store
+
+
+def _births(store: DatasetStore) -> tuple[dict[int, Person], SortedColumn]:
+    """Personagens e o índice ordenado dos anos de nascimento (anos relativos a Yavin)."""
+    people = store.table("people")
+    return people.models, people.column("birth_year_aby")  # type: ignore[return-value]
+
 
-def _extract_id(url: str) -> int:
-    """Extrai ID numérico de uma URL SWAPI."""
-    parts = url.rstrip("/").split("/")
-    return int(parts[-1])
+def _year(value: str | None, name: str) -> float | None:
+    """Converte um ano como "32BBY", "4ABY" ou "-32" para anos relativos a Yavin."""
+    if value is None:
+        return None
+    text = value.strip()
+    year = parse_number(text) if text.startswith("-") else parse_birth_year(text)
+    if year is None:
+        raise HTTPException(status_code=400, detail=f"Ano inválido em '{name}': {value}")
+    return year
+
+
+def _character(person: Person) -> dict:
+    return {
+        "id": person.id,
+        "name": person.name,
+        "birth_year": person.birth_year,
+        "birth_year_aby": person.birth_year_aby,
+    }
+
+
+def _timeline(store: DatasetStore) -> TimelineIndex:
+    """Índice da timeline, recalculado apenas quando pessoas ou filmes mudam."""
+    return store.views.get(
+        ("timeline",),
+        {"people", "films"},
+        lambda: TimelineIndex(
+            store.table("people"), store.table("films"), store.membership("people", "films")
+        ),
+    )
 
 
 @router.get(
@@ -26,31 +84,9 @@ def _extract_id(url: str) -> int:
     summary="Filmes por ordem de lançamento",
     description="Retorna os filmes ordenados por data de lançamento real.",
 )
-async def get_films_release_order(
-    swapi: SWAPIClient = Depends(get_swapi_client),
-) -> list[dict]:
+async def get_films_release_order() -> list[dict]:
     """Retorna filmes em ordem de lançamento."""
-    all_films = await swapi.get_all_films()
-
-    films_data = []
-    for f in all_films:
-        episode_id = f.get("episode_id", 0)
-        films_data.append(
-            {
-                "id": _extract_id(f.get("url", "")),
-                "episode_id": episode_id,
-                "title": f.get("title"),
-                "release_date": f.get("release_date"),
-                "director": f.get("director"),
-                "era": _get_film_era(episode_id),
-            }
-        )
-
-    # Ordenar por data de lançamento
-    return sorted(
-        films_data,
-        key=lambda x: x["release_date"] or "9999-99-99",
-    )
+    return _timeline(await _store()).release_order
 
 
 @router.get(
@@ -58,29 +94,9 @@ async def get_films_release_order(
     summary="Filmes em ordem cronológica (in-universe)",
     description="Retorna os filmes na ordem cronológica da história Star Wars.",
 )
-async def get_films_chronological_order(
-    swapi: SWAPIClient = Depends(get_swapi_client),
-) -> list[dict]:
+async def get_films_chronological_order() -> list[dict]:
     """Retorna filmes em ordem cronológica do universo."""
-    all_films = await swapi.get_all_films()
-
-    films_data = []
-    for f in all_films:
-        episode_id = f.get("episode_id", 0)
-        films_data.append(
-            {
-                "id": _extract_id(f.get("url", "")),
-                "episode_id": episode_id,
-                "title": f.get("title"),
-                "release_date": f.get("release_date"),
-                "director": f.get("director"),
-                "era": _get_film_era(episode_id),
-                "chronological_order": _get_chronological_order(episode_id),
-            }
-        )
-
-    # Ordenar por ordem cronológica (episódio)
-    return sorted(films_data, key=lambda x: x["chronological_order"])
+    return _timeline(await _store()).chronological
 
 
 @router.get(
@@ -131,66 +147,168 @@ async def get_star_wars_eras() -> list[dict]:
 @router.get(
     "/character-journey/{character_id}",
     summary="Jornada de um personagem",
-    description="Retorna a linha do tempo de aparições de um personagem nos filmes.",
+    description=(
+        "Retorna a linha do tempo de aparições de um personagem nos filmes, "
+        "com os episódios agrupados por era."
+    ),
 )
-async def get_character_journey(
-    character_id: int,
-    swapi: SWAPIClient = Depends(get_swapi_client),
-) -> dict:
+async def get_character_journey(character_id: int) -> dict:
     """Retorna a jornada de um personagem através dos filmes."""
-    try:
-        person = await swapi.get_person(character_id)
-    except Exception:
-        raise HTTPException(status_code=404, detail="Personagem não encontrado") from None
+    journey = _timeline(await _store()).journeys.get(character_id)
+    if journey is None:
+        raise HTTPException(status_code=404, detail="Personagem não encontrado")
+    return journey
 
-    all_films = await swapi.get_all_films()
 
-    # Extrair IDs dos filmes do personagem
-    person_film_urls = person.get("films", [])
-    person_film_ids = [_extract_id(url) for url in person_film_urls]
+@router.get(
+    "/character-journeys",
+    summary="Jornadas de vários personagens",
+    description=(
+        f"Retorna as jornadas de até {MAX_JOURNEYS} personagens de uma vez "
+        "(`?ids=1&ids=4&ids=5`), lidas do índice pré-calculado da timeline. "
+        "IDs inexistentes são listados em `not_found`."
+    ),
+)
+async def get_character_journeys(
+    ids: list[int] = Query(
+        ..., min_length=1, max_length=MAX_JOURNEYS, description="IDs dos personagens"
+    ),
+) -> dict:
+    """Retorna as jornadas de vários personagens."""
+    journeys = _timeline(await _store()).journeys
+    ids = list(dict.fromkeys(ids))
+    return {
+        "total": sum(entity_id in journeys for entity_id in ids),
+        "journeys": [journeys[entity_id] for entity_id in ids if entity_id in journeys],
+        "not_found": [entity_id for entity_id in ids if entity_id not in journeys],
+    }
 
-    # Filtrar filmes em que o personagem aparece
-    character_films = [f for f in all_films if _extract_id(f.get("url", "")) in person_film_ids]
 
-    # Ordenar por episódio
-    character_films.sort(key=lambda x: x.get("episode_id", 0))
+@router.get(
+    "/births",
+    summary="Personagens nascidos entre dois anos",
+    description=(
+        "Personagens nascidos entre `start` e `end` (inclusive), do mais velho ao mais novo. "
+        "Os anos aceitam a notação BBY/ABY (`32BBY`, `4ABY`) ou anos relativos à Batalha "
+        "de Yavin (`-32`, `4`). Respondido por busca binária no índice ordenado."
+    ),
+)
+async def get_births(
+    start: str | None = Query(None, description="Ano inicial, ex.: 100BBY"),
+    end: str | None = Query(None, description="Ano final, ex.: 0BBY"),
+) -> dict:
+    """Retorna os personagens nascidos num intervalo de anos."""
+    low, high = _year(start, "start"), _year(end, "end")
+    people, column = _births(await _store())
+    characters = [_character(people[entity_id]) for entity_id in born_between(column, low, high)]
+    return {
+        "start": None if low is None else format_year(low),
+        "end": None if high is None else format_year(high),
+        "total": len(characters),
+        "characters": characters,
+    }
 
-    journey = []
-    for film in character_films:
-        episode_id = film.get("episode_id", 0)
-        journey.append(
-            {
-                "episode_id": episode_id,
-                "title": film.get("title"),
-                "release_date": film.get("release_date"),
-                "era": _get_film_era(episode_id),
-            }
-        )
 
+@router.get(
+    "/generations",
+    summary="Histograma de gerações",
+    description=(
+        "Quantidade de personagens nascidos em cada intervalo de `width` anos, do mais antigo "
+        "ao mais recente. Personagens sem ano de nascimento conhecido são contados em `unknown`."
+    ),
+)
+async def get_generations(
+    width: int = Query(20, ge=1, le=1000, description="Largura de cada geração, em anos"),
+) -> dict:
+    """Retorna o histograma de anos de nascimento."""
+    people, column = _births(await _store())
+    buckets = generations(column, width)
     return {
-        "character": {
-            "id": character_id,
-            "name": person.get("name"),
-            "birth_year": person.get("birth_year"),
-            "homeworld": person.get("homeworld"),
-        },
-        "total_films": len(journey),
-        "journey": journey,
+        "width": width,
+        "total": len(column),
+        "unknown": len(people) - len(column),
+        "buckets": [
+            {
+                "start": bucket.start,
+                "end": bucket.end,
+                "label": f"{format_year(bucket.start)} - {format_year(bucket.end)}",
+                "count": bucket.count,
+            }
+            for bucket in buckets
+        ],
     }
 
 
-def _get_film_era(episode_id: int) -> str:
-    """Retorna a era do filme baseado no episódio."""
-    if episode_id in [1, 2, 3]:
-        return "Prequel Era"
-    elif episode_id in [4, 5, 6]:
-        return "Original Trilogy"
-    elif episode_id in [7, 8, 9]:
-        return "Sequel Era"
-    return "Unknown"
+@router.get(
+    "/character-ages/{character_id}",
+    summary="Idade de um personagem em cada filme",
+    description=(
+        "Idade do personagem durante os eventos de cada filme, em ordem cronológica "
+        "(`null` quando ainda não tinha nascido ou o ano é desconhecido)."
+    ),
+)
+async def get_character_ages(character_id: int) -> dict:
+    """Retorna a idade de um personagem em cada filme."""
+    store = await _store()
+    index = _timeline(store)
+    people, _ = _births(store)
+    person = people.get(character_id)
+    if person is None:
+        raise HTTPException(status_code=404, detail="Personagem não encontrado")
+
+    appears = {step["episode_id"] for step in index.journeys[character_id]["journey"]}
+    films = []
+    for film in index.chronological:
+        year = EPISODE_YEARS.get(film["episode_id"])
+        films.append(
+            {
+                "id": film["id"],
+                "episode_id": film["episode_id"],
+                "title": film["title"],
+                "year": None if year is None else format_year(year),
+                "age": age_at(person.birth_year_aby, year),
+                "appears": film["episode_id"] in appears,
+            }
+        )
+    return {"character": _character(person), "films": films}
 
 
-def _get_chronological_order(episode_id: int) -> int:
-    """Retorna a ordem cronológica do episódio."""
-    # Ordem cronológica: 1, 2, 3, 4, 5, 6 (SWAPI só tem os 6 primeiros)
-    return episode_id
+@router.get(
+    "/films/{film_id}/ages",
+    summary="Idade dos personagens num filme",
+    description=(
+        "Personagens com idade entre `min_age` e `max_age` durante os eventos de um filme, "
+        "do mais velho ao mais novo, e se aparecem no filme. Respondido por busca binária "
+        "no índice de anos de nascimento."
+    ),
+)
+async def get_film_ages(
+    film_id: int,
+    min_age: float | None = Query(None, ge=0, description="Idade mínima"),
+    max_age: float | None = Query(None, ge=0, description="Idade máxima"),
+) -> dict:
+    """Retorna as idades dos personagens durante um filme."""
+    store = await _store()
+    index = _timeline(store)
+    film = index.films.get(film_id)
+    if film is None:
+        raise HTTPException(status_code=404, detail="Filme não encontrado")
+    year = EPISODE_YEARS.get(film["episode_id"])
+    if year is None:
+        raise HTTPException(status_code=400, detail="Ano do filme desconhecido")
+
+    people, column = _births(store)
+    cast = set(store.relations.related_ids("films", film_id, "people"))
+    characters = [
+        {
+            **_character(people[entity_id]),
+            "age": age_at(people[entity_id].birth_year_aby, year),
+            "appears": entity_id in cast,
+        }
+        for entity_id in ages_between(column, year, min_age, max_age)
+    ]
+    return {
+        "film": {**film, "year": format_year(year)},
+        "total": len(characters),
+        "characters": characters,
+    }
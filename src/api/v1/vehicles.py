@@ -1,13 +1,36 @@
 """Vehicles API endpoints."""
 
+from functools import partial
+
 from fastapi import APIRouter, HTTPException, Query
 
-from src.dependencies import get_swapi_client
+from src.dependencies import get_dataset_store
 from src.models.base import PaginatedResponse, SortOrder
 from src.models.people import PersonSummary
 from src.models.vehicles import Vehicle, VehicleSummary
+from src.services.expansion import (
+    EXPAND_DESCRIPTION,
+    ExpansionError,
+    expand,
+    expand_page,
+    parse_expand,
+)
+from src.services.projection import (
+    FIELDS_DESCRIPTION,
+    ProjectionError,
+    parse_fields,
+    project,
+    respond,
+)
+from src.services.query_filter import (
+    FACETS_DESCRIPTION,
+    FILTER_DESCRIPTION,
+    FilterError,
+    count_facets,
+    select_rows,
+)
 from src.services.swapi_client import SWAPIError
-from src.utils.pagination import paginate
+from src.utils.pagination import CURSOR_DESCRIPTION, CursorError, paginate, paginate_cursor
 from src.utils.sorting import sort_items
 
 router = APIRouter()
@@ -24,42 +47,71 @@ async def list_vehicles(
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
     sort_by: str | None = Query(None, description="Field to sort by (name, model)"),
     sort_order: SortOrder = Query(SortOrder.ASC, description="Sort order"),
+    filter_expr: str | None = Query(None, alias="filter", description=FILTER_DESCRIPTION),
+    facets: str | None = Query(None, description=FACETS_DESCRIPTION),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    expand_expr: str | None = Query(None, alias="expand", description=EXPAND_DESCRIPTION),
     vehicle_class: str | None = Query(None, description="Filter by vehicle class"),
     manufacturer: str | None = Query(None, description="Filter by manufacturer"),
 ) -> PaginatedResponse[VehicleSummary]:
     """List all vehicles with pagination."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        all_vehicles_data = await swapi.get_all_vehicles()
-
-        # Convert to Vehicle models
-        vehicles = [Vehicle.from_swapi(data, data["id"]) for data in all_vehicles_data]
-
-        # Apply filters
-        filtered = vehicles
-        if vehicle_class:
-            filtered = [v for v in filtered if vehicle_class.lower() in v.vehicle_class.lower()]
-        if manufacturer:
-            filtered = [v for v in filtered if manufacturer.lower() in v.manufacturer.lower()]
+        projection = parse_fields("vehicles", fields) if fields else None
+        expansion = parse_expand("vehicles", expand_expr) if expand_expr else ()
+        to_item = (
+            VehicleSummary.from_model if projection is None else partial(project, fields=projection)
+        )
+
+        await store.ensure_loaded()
+
+        table = store.table("vehicles")
+
+        # Categorical parameters, matched on the encoded columns
+        rows = table.match("vehicle_class", vehicle_class, partial=True)
+        rows &= table.match("manufacturer", manufacturer, partial=True)
+
+        # Filter expression, resolved on the table indexes, within those rows
+        rows = select_rows(table, filter_expr, rows)
+        filtered = table.models_of(rows)
+
+        # Facet counts over the match bitmap, intersected with the value index bitmaps
+        facet_counts = count_facets(table, rows, facets)
+
+        # Keyset pagination, read from the table's pre-sorted index
+        if cursor is not None:
+            paginated = paginate_cursor(
+                table,
+                filtered,
+                cursor,
+                to_item,
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                version=store.resource_versions["vehicles"],
+                facets=facet_counts,
+            )
+            return respond(
+                expand_page(store, "vehicles", paginated, expansion), projection, expansion
+            )
 
         # Sort
         sorted_vehicles = sort_items(filtered, sort_by=sort_by, sort_order=sort_order)
 
-        # Convert to summaries
-        summaries = [
-            VehicleSummary(
-                id=v.id,
-                name=v.name,
-                model=v.model,
-                vehicle_class=v.vehicle_class,
-                manufacturer=v.manufacturer,
-            )
-            for v in sorted_vehicles
-        ]
-
-        return paginate(summaries, page=page, page_size=page_size)
-
+        # Paginate, converting only the items of the page
+        paginated = paginate(
+            sorted_vehicles,
+            page=page,
+            page_size=page_size,
+            facets=facet_counts,
+            to_item=to_item,
+        )
+        return respond(expand_page(store, "vehicles", paginated, expansion), projection, expansion)
+
+    except (CursorError, FilterError, ExpansionError, ProjectionError) as e:
+        raise HTTPException(status_code=400, detail=e.message)
     except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
@@ -70,16 +122,28 @@ async def list_vehicles(
     summary="Get vehicle by ID",
     description="Get detailed information about a specific vehicle.",
 )
-async def get_vehicle(vehicle_id: int) -> Vehicle:
+async def get_vehicle(
+    vehicle_id: int,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    expand_expr: str | None = Query(None, alias="expand", description=EXPAND_DESCRIPTION),
+) -> Vehicle:
     """Get a single vehicle by ID."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        data = await swapi.get_vehicle(vehicle_id)
-        return Vehicle.from_swapi(data, vehicle_id)
-    except SWAPIError as e:
-        if e.status_code == 404:
+        projection = parse_fields("vehicles", fields) if fields else None
+        expansion = parse_expand("vehicles", expand_expr) if expand_expr else ()
+
+        await store.ensure_loaded()
+        vehicle = store.table("vehicles").get(vehicle_id)
+        if vehicle is None:
             raise HTTPException(status_code=404, detail=f"Vehicle with ID {vehicle_id} not found")
+
+        item = vehicle if projection is None else project(vehicle, projection)
+        return respond(expand(store, "vehicles", [item], expansion)[0], projection, expansion)
+    except (ExpansionError, ProjectionError) as e:
+        raise HTTPException(status_code=400, detail=e.message)
+    except SWAPIError as e:
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
 
 
@@ -91,18 +155,14 @@ async def get_vehicle(vehicle_id: int) -> Vehicle:
 )
 async def get_vehicle_pilots(vehicle_id: int) -> list[PersonSummary]:
     """Get all pilots of a vehicle."""
-    swapi = get_swapi_client()
+    store = get_dataset_store()
 
     try:
-        vehicle_data = await swapi.get_vehicle(vehicle_id)
-        vehicle = Vehicle.from_swapi(vehicle_data, vehicle_id)
-
-        if not vehicle.pilot_ids:
-            return []
+        await store.ensure_loaded()
+        if store.table("vehicles").get(vehicle_id) is None:
+            raise HTTPException(status_code=404, detail=f"Vehicle with ID {vehicle_id} not found")
 
-        people_data = await swapi.get_multiple_by_ids("people", vehicle.pilot_ids)
-        return [PersonSummary.from_swapi(data, data.get("id", 0)) for data in people_data]
+        people = store.related_models("vehicles", vehicle_id, "people")
+        return [PersonSummary.from_model(model) for model in people]
     except SWAPIError as e:
-        if e.status_code == 404:
-            raise HTTPException(status_code=404, detail=f"Vehicle with ID {vehicle_id} not found")
         raise HTTPException(status_code=e.status_code or 500, detail=e.message)
@@ -6,6 +6,7 @@ from fastapi import Depends
 
 from src.config import Settings, get_settings
 from src.services.cache_service import CacheService
+from src.services.dataset_store import DatasetStore
 from src.services.swapi_client import SWAPIClient
 
 # Settings dependency
@@ -45,3 +46,18 @@ def get_cache_service() -> CacheService:
 
 
 CacheServiceDep = Annotated[CacheService, Depends(get_cache_service)]
+
+
+# Dataset Store singleton
+_dataset_store: DatasetStore | None = None
+
+
+def get_dataset_store() -> DatasetStore:
+    """Get dataset store singleton instance."""
+    global _dataset_store
+    if _dataset_store is None:
+        _dataset_store = DatasetStore(swapi=get_swapi_client())
+    return _dataset_store
+
+
+DatasetStoreDep = Annotated[DatasetStore, Depends(get_dataset_store)]
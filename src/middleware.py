@@ -41,45 +41,64 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         # Pular rate limiting para paths isentos
-        if any(request.url.path.startswith(path) for path in self.exempt_paths):
+        if self.is_exempt(request.url.path):
             return await call_next(request)
 
         # Obter IP do cliente (considera proxies)
-        client_ip = self._get_client_ip(request)
+        client_ip = self.client_ip(request)
 
-        # Limpar requests antigos (mais de 1 minuto)
-        now = datetime.now()
-        cutoff = now - timedelta(minutes=1)
-        self._requests[client_ip] = [ts for ts in self._requests[client_ip] if ts > cutoff]
-
-        # Verificar limite
-        if len(self._requests[client_ip]) >= self.requests_per_minute:
+        # Verificar limite e registrar request
+        if not self.consume(client_ip):
             return Response(
                 content='{"detail": "Rate limit exceeded. Try again in 1 minute."}',
                 status_code=429,
                 media_type="application/json",
-                headers={
-                    "Retry-After": "60",
-                    "X-RateLimit-Limit": str(self.requests_per_minute),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int((cutoff + timedelta(minutes=1)).timestamp())),
-                },
+                headers=self.limit_headers(),
             )
 
-        # Registrar request
-        self._requests[client_ip].append(now)
+        # Endpoints que executam várias requisições (batch) cobram o restante daqui
+        request.state.rate_limiter = self
 
         # Processar request
         response = await call_next(request)
 
         # Adicionar headers de rate limit
-        remaining = self.requests_per_minute - len(self._requests[client_ip])
+        remaining = max(0, self.requests_per_minute - len(self._requests[client_ip]))
         response.headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
         response.headers["X-RateLimit-Remaining"] = str(remaining)
 
         return response
 
-    def _get_client_ip(self, request: Request) -> str:
+    def is_exempt(self, path: str) -> bool:
+        """Verifica se o path é isento de rate limiting."""
+        return any(path.startswith(exempt) for exempt in self.exempt_paths)
+
+    def consume(self, client_ip: str, hits: int = 1) -> bool:
+        """
+        Registra `hits` requests do IP se couberem no limite do último minuto.
+
+        Retorna False (sem registrar nada) quando o limite seria excedido.
+        """
+        # Limpar requests antigos (mais de 1 minuto)
+        now = datetime.now()
+        cutoff = now - timedelta(minutes=1)
+        self._requests[client_ip] = [ts for ts in self._requests[client_ip] if ts > cutoff]
+
+        if len(self._requests[client_ip]) + hits > self.requests_per_minute:
+            return False
+        self._requests[client_ip].extend([now] * hits)
+        return True
+
+    def limit_headers(self) -> dict[str, str]:
+        """Headers de uma resposta 429."""
+        return {
+            "Retry-After": "60",
+            "X-RateLimit-Limit": str(self.requests_per_minute),
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int((datetime.now() + timedelta(minutes=1)).timestamp())),
+        }
+
+    def client_ip(self, request: Request) -> str:
         """Obtém IP real do cliente considerando proxies."""
         # Cloud Run usa X-Forwarded-For
         forwarded = request.headers.get("X-Forwarded-For")
@@ -0,0 +1,96 @@
+"""Analytics models."""
+
+from pydantic import BaseModel, Field
+
+
+class HistogramBin(BaseModel):
+    """A histogram bin."""
+
+    start: float = Field(..., description="Lower bound (inclusive)")
+    end: float = Field(..., description="Upper bound (exclusive, inclusive for the last bin)")
+    count: int = Field(..., description="Number of values in the bin")
+
+
+class ColumnAnalytics(BaseModel):
+    """Distribution of a numeric field of a resource."""
+
+    resource: str = Field(..., description="Resource type")
+    field: str = Field(..., description="Numeric field")
+    count: int = Field(..., description="Number of entities with a known value")
+    missing: int = Field(..., description="Number of entities with an unknown value")
+    min: float | None = Field(None, description="Minimum value")
+    max: float | None = Field(None, description="Maximum value")
+    mean: float | None = Field(None, description="Mean value")
+    median: float | None = Field(None, description="Median value")
+    stddev: float | None = Field(None, description="Population standard deviation")
+    percentiles: dict[str, float | None] = Field(
+        default_factory=dict, description="Requested percentiles, keyed as p<q>"
+    )
+    histogram: list[HistogramBin] = Field(default_factory=list, description="Histogram bins")
+
+
+class CorrelationGroup(BaseModel):
+    """Correlation and covariance matrices of one group."""
+
+    group: str | None = Field(None, description="Group label (None when not grouped)")
+    count: int = Field(..., description="Number of entities in the group")
+    correlation: dict[str, dict[str, float | None]] = Field(
+        ..., description="Pearson correlation between each pair of fields"
+    )
+    covariance: dict[str, dict[str, float | None]] = Field(
+        ..., description="Sample covariance between each pair of fields"
+    )
+    pairs: dict[str, dict[str, int]] = Field(
+        ..., description="Number of entities with both values known, per pair of fields"
+    )
+
+
+class CorrelationMatrix(BaseModel):
+    """Pairwise relationships between numeric fields of a resource."""
+
+    resource: str = Field(..., description="Resource type")
+    fields: list[str] = Field(..., description="Numeric fields of the matrix")
+    group_by: str | None = Field(None, description="Grouping field or related resource")
+    groups: list[CorrelationGroup] = Field(..., description="Matrices per group")
+
+
+class AggregateGroup(BaseModel):
+    """Aggregates of one group."""
+
+    group: dict[str, str] = Field(..., description="Value of each grouping key")
+    values: dict[str, float | int | None] = Field(..., description="Aggregates by name")
+
+
+class AggregateResult(BaseModel):
+    """Result of a group-by aggregation."""
+
+    resource: str = Field(..., description="Resource type")
+    group_by: list[str] = Field(..., description="Grouping fields or related resources")
+    aggregates: list[str] = Field(..., description="Aggregate names, e.g. count, avg_height")
+    filter: str | None = Field(None, description="Filter expression applied before grouping")
+    total: int = Field(..., description="Number of groups")
+    groups: list[AggregateGroup] = Field(..., description="Groups, largest first")
+
+
+class SimilarEntity(BaseModel):
+    """An entity similar to the target."""
+
+    id: int = Field(..., description="Entity ID")
+    name: str = Field(..., description="Entity name")
+    distance: float = Field(..., description="Distance to the target, from 0 (identical) to 1")
+    similarity: float = Field(..., description="1 - distance")
+    contributions: dict[str, float | None] = Field(
+        ...,
+        description="Share of the distance contributed by each feature "
+        "(None when either value is unknown)",
+    )
+
+
+class SimilarityResult(BaseModel):
+    """Nearest neighbours of an entity."""
+
+    resource: str = Field(..., description="Resource type")
+    id: int = Field(..., description="Target entity ID")
+    name: str = Field(..., description="Target entity name")
+    features: list[str] = Field(..., description="Features compared")
+    results: list[SimilarEntity] = Field(..., description="Most similar entities, nearest first")
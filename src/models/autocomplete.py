@@ -0,0 +1,12 @@
+"""Autocomplete models."""
+
+from pydantic import BaseModel, Field
+
+
+class AutocompleteSuggestion(BaseModel):
+    """A name suggestion for a typed prefix."""
+
+    resource: str = Field(..., description="Resource type (people, films, starships...)")
+    id: int = Field(..., description="Resource ID")
+    name: str = Field(..., description="Name (or title for films)")
+    popularity: int = Field(..., description="Film appearances (characters for films)")
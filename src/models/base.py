@@ -25,6 +25,12 @@ class PaginatedResponse(BaseModel, Generic[T]):
     has_next: bool = Field(..., description="Whether there is a next page")
     has_previous: bool = Field(..., description="Whether there is a previous page")
     results: list[T] = Field(..., description="List of items")
+    facets: dict[str, dict[str, int]] | None = Field(
+        None, description="Per-value counts of the requested facets over all matching items"
+    )
+    next_cursor: str | None = Field(
+        None, description="Cursor of the next page (cursor pagination only)"
+    )
 
 
 class ErrorResponse(BaseModel):
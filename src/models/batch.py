@@ -0,0 +1,38 @@
+"""Batch request models."""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+class BatchRequestItem(BaseModel):
+    """One sub-request of a batch."""
+
+    id: str | None = Field(None, description="Client label, echoed in the result")
+    method: Literal["GET"] = Field("GET", description="HTTP method (only GET is supported)")
+    path: str = Field(
+        ..., description="Absolute path with query string, e.g. /api/v1/people?page=1"
+    )
+
+
+class BatchRequest(BaseModel):
+    """A batch of sub-requests."""
+
+    requests: list[BatchRequestItem] = Field(..., description="Sub-requests, in order")
+
+
+class BatchResult(BaseModel):
+    """Response of one sub-request."""
+
+    id: str | None = Field(None, description="Client label of the sub-request")
+    path: str = Field(..., description="Requested path")
+    status: int = Field(..., description="HTTP status code of the sub-request")
+    body: Any = Field(None, description="Decoded JSON body (text for non-JSON responses)")
+
+
+class BatchResponse(BaseModel):
+    """Responses of a batch, in request order."""
+
+    count: int = Field(..., description="Number of sub-requests")
+    executed: int = Field(..., description="Distinct sub-requests actually executed")
+    results: list[BatchResult] = Field(..., description="One result per sub-request")
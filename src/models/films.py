@@ -15,6 +15,24 @@ class FilmSummary(BaseModel):
     release_date: date | None = Field(None, description="Release date")
     characters_count: int = Field(0, description="Number of characters in the film")
 
+    @classmethod
+    def from_model(cls, film: "Film") -> "FilmSummary":
+        """
+        Create from an already parsed model, without re-parsing the raw record.
+
+        Used with the models parsed at ingest by the dataset store.
+        """
+        return cls.model_validate(
+            {
+                "id": film.id,
+                "episode_id": film.episode_id,
+                "title": film.title,
+                "director": film.director,
+                "release_date": film.release_date,
+                "characters_count": len(film.character_ids),
+            },
+        )
+
     @classmethod
     def from_swapi(cls, data: dict, film_id: int) -> "FilmSummary":
         """Create from SWAPI response."""
@@ -105,3 +123,22 @@ class Film(BaseModel):
             created=created,
             edited=edited,
         )
+
+
+class FilmMember(BaseModel):
+    """An entity matched by a film set query."""
+
+    id: int = Field(..., description="Entity ID")
+    name: str = Field(..., description="Entity name")
+    film_ids: list[int] = Field(..., description="Films the entity appears in, by episode")
+
+
+class FilmSetResult(BaseModel):
+    """Entities of a resource matching a set expression over films."""
+
+    resource: str = Field(..., description="Resource type")
+    query: dict[str, list[int]] = Field(
+        ..., description="Film IDs per operator (all, any, none, exactly), combined with AND"
+    )
+    total: int = Field(..., description="Number of matching entities")
+    results: list[FilmMember] = Field(..., description="Matching entities, by ID")
@@ -0,0 +1,84 @@
+"""Character graph models."""
+
+from pydantic import BaseModel, Field
+
+
+class GraphNode(BaseModel):
+    """A character or linking entity."""
+
+    id: int = Field(..., description="Entity ID")
+    name: str = Field(..., description="Entity name")
+
+
+class CoAppearance(BaseModel):
+    """A character linked to the target and what they share."""
+
+    id: int = Field(..., description="Character ID")
+    name: str = Field(..., description="Character name")
+    weight: int = Field(..., description="Number of shared entities")
+    shared: dict[str, list[GraphNode]] = Field(
+        ..., description="Shared films, starships, vehicles and planets"
+    )
+
+
+class CoAppearanceResult(BaseModel):
+    """Characters linked to a character, heaviest link first."""
+
+    id: int = Field(..., description="Character ID")
+    name: str = Field(..., description="Character name")
+    via: list[str] = Field(..., description="Resources linking the characters")
+    total: int = Field(..., description="Number of linked characters")
+    results: list[CoAppearance] = Field(..., description="Linked characters")
+
+
+class PathStep(BaseModel):
+    """One hop of a path: two characters and what connects them."""
+
+    source: GraphNode = Field(..., description="Character the hop starts from")
+    target: GraphNode = Field(..., description="Character the hop leads to")
+    shared: dict[str, list[GraphNode]] = Field(..., description="Entities connecting them")
+
+
+class GraphPath(BaseModel):
+    """Shortest connection between two characters."""
+
+    source: GraphNode = Field(..., description="First character")
+    target: GraphNode = Field(..., description="Second character")
+    via: list[str] = Field(..., description="Resources linking the characters")
+    connected: bool = Field(..., description="Whether the characters are connected")
+    length: int | None = Field(None, description="Number of hops (None when not connected)")
+    steps: list[PathStep] = Field(default_factory=list, description="Hops, in order")
+
+
+class CentralityScore(BaseModel):
+    """Centrality of a character."""
+
+    rank: int = Field(..., description="1-based rank")
+    id: int = Field(..., description="Character ID")
+    name: str = Field(..., description="Character name")
+    score: float = Field(..., description="Metric value")
+
+
+class CentralityRanking(BaseModel):
+    """Characters ranked by a centrality metric."""
+
+    metric: str = Field(..., description="Centrality metric")
+    via: list[str] = Field(..., description="Resources linking the characters")
+    nodes: int = Field(..., description="Number of characters in the graph")
+    edges: int = Field(..., description="Number of linked character pairs")
+    results: list[CentralityScore] = Field(..., description="Most central characters first")
+
+
+class GraphComponent(BaseModel):
+    """A group of characters connected to each other."""
+
+    size: int = Field(..., description="Number of characters")
+    members: list[GraphNode] = Field(..., description="Characters, by ID")
+
+
+class GraphComponents(BaseModel):
+    """Connected components of the character graph."""
+
+    via: list[str] = Field(..., description="Resources linking the characters")
+    total: int = Field(..., description="Number of components")
+    components: list[GraphComponent] = Field(..., description="Components, largest first")
@@ -0,0 +1,146 @@
+"""
+Canonical parsing of SWAPI's string-typed values.
+
+SWAPI returns every number as a string: with thousands separators ("1,358"),
+units ("1000km", "10 MGLT"), ranges ("30-165"), durations ("2 months") or a
+marker for missing data ("unknown", "n/a", "none", "indefinite"). These
+parsers are the single set of rules for reading them. `normalize` applies
+them to a raw record once at ingest (from each model's `from_swapi`), so
+everything downstream reads typed values; unknown values become None, never 0.
+"""
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+UNKNOWN_VALUES = frozenset({"", "unknown", "n/a", "none", "indefinite"})
+
+# A number, optionally followed by a unit ("1000km", "10 MGLT")
+_NUMBER = re.compile(r"([-+]?\d+(?:\.\d+)?)\s*[a-z]*")
+_RANGE = re.compile(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)")
+# An in-universe year: "19BBY", "41.9BBY", "4ABY" (a bare number is ABY)
+_YEAR = re.compile(r"(\d+(?:\.\d+)?)\s*(bby|aby)?")
+
+DAYS_PER_UNIT = {"hour": 1 / 24, "day": 1, "week": 7, "month": 30, "year": 365}
+
+
+def _clean(value: Any) -> str | None:
+    if value is None:
+        return None
+    text = str(value).strip().lower().replace(",", "")
+    return None if text in UNKNOWN_VALUES else text
+
+
+def parse_number(value: Any) -> float | None:
+    """Parse a number such as "1,358", "0.5" or "1000km"; None when unknown."""
+    text = _clean(value)
+    if text is None:
+        return None
+    match = _NUMBER.fullmatch(text)
+    return float(match.group(1)) if match else None
+
+
+def parse_int(value: Any) -> int | None:
+    """Parse a whole number (fractions are truncated); None when unknown."""
+    number = parse_number(value)
+    return None if number is None else int(number)
+
+
+def parse_range(value: Any) -> tuple[int | None, int | None]:
+    """Parse a count that may be a range: "30-165" -> (30, 165), "1,500" -> (1500, 1500)."""
+    text = _clean(value)
+    if text is None:
+        return None, None
+    match = _RANGE.fullmatch(text)
+    if match:
+        low, high = sorted((int(float(match.group(1))), int(float(match.group(2)))))
+        return low, high
+    number = parse_int(text)
+    return number, number
+
+
+def parse_days(value: Any) -> float | None:
+    """Parse a duration such as "2 months" or "1 week" into days; "none" is 0."""
+    if value is not None and str(value).strip().lower() == "none":
+        return 0.0
+    text = _clean(value)
+    if text is None:
+        return None
+    parts = text.split()
+    if len(parts) != 2:
+        return None
+    amount = parse_number(parts[0])
+    unit = DAYS_PER_UNIT.get(parts[1].removesuffix("s"))
+    if amount is None or unit is None:
+        return None
+    return amount * unit
+
+
+def parse_birth_year(value: Any) -> float | None:
+    """Parse an in-universe year into years after the Battle of Yavin: "19BBY" -> -19.0."""
+    text = _clean(value)
+    if text is None:
+        return None
+    match = _YEAR.fullmatch(text)
+    if not match:
+        return None
+    years = float(match.group(1))
+    return -years if match.group(2) == "bby" and years else years
+
+
+def _range_min(value: Any) -> int | None:
+    return parse_range(value)[0]
+
+
+def _range_max(value: Any) -> int | None:
+    return parse_range(value)[1]
+
+
+# Canonical numeric fields per resource: model field -> (raw SWAPI key, parser)
+NUMERIC_SCHEMA: dict[str, dict[str, tuple[str, Callable[[Any], Any]]]] = {
+    "people": {
+        "height": ("height", parse_int),
+        "mass": ("mass", parse_number),
+        "birth_year_aby": ("birth_year", parse_birth_year),
+    },
+    "films": {},
+    "starships": {
+        "cost_in_credits": ("cost_in_credits", parse_int),
+        "length": ("length", parse_number),
+        "hyperdrive_rating": ("hyperdrive_rating", parse_number),
+        "mglt": ("MGLT", parse_int),
+        "cargo_capacity": ("cargo_capacity", parse_int),
+        "crew_min": ("crew", _range_min),
+        "crew_max": ("crew", _range_max),
+        "passenger_capacity": ("passengers", _range_max),
+        "consumables_days": ("consumables", parse_days),
+    },
+    "planets": {
+        "diameter": ("diameter", parse_int),
+        "rotation_period": ("rotation_period", parse_int),
+        "orbital_period": ("orbital_period", parse_int),
+        "population": ("population", parse_int),
+        "surface_water": ("surface_water", parse_int),
+    },
+    "vehicles": {
+        "cost_in_credits": ("cost_in_credits", parse_int),
+        "length": ("length", parse_number),
+        "max_atmosphering_speed": ("max_atmosphering_speed", parse_int),
+        "cargo_capacity": ("cargo_capacity", parse_int),
+        "crew_min": ("crew", _range_min),
+        "crew_max": ("crew", _range_max),
+        "passenger_capacity": ("passengers", _range_max),
+        "consumables_days": ("consumables", parse_days),
+    },
+    "species": {
+        "average_height": ("average_height", parse_int),
+        "average_lifespan": ("average_lifespan", parse_int),
+    },
+}
+
+
+def normalize(resource: str, data: dict[str, Any]) -> dict[str, Any]:
+    """Canonical numeric values of a raw SWAPI record, keyed by model field."""
+    return {
+        field: parser(data.get(key)) for field, (key, parser) in NUMERIC_SCHEMA[resource].items()
+    }
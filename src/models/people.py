@@ -1,9 +1,10 @@
 """People/Characters models."""
 
 from datetime import datetime
-from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
+
+from src.models.normalization import normalize
 
 
 class PersonSummary(BaseModel):
@@ -16,6 +17,24 @@ class PersonSummary(BaseModel):
     homeworld_id: int | None = Field(None, description="Homeworld planet ID")
     films_count: int = Field(0, description="Number of films appeared in")
 
+    @classmethod
+    def from_model(cls, person: "Person") -> "PersonSummary":
+        """
+        Create from an already parsed model, without re-parsing the raw record.
+
+        Used with the models parsed at ingest by the dataset store.
+        """
+        return cls.model_validate(
+            {
+                "id": person.id,
+                "name": person.name,
+                "gender": person.gender,
+                "birth_year": person.birth_year,
+                "homeworld_id": person.homeworld_id,
+                "films_count": len(person.film_ids),
+            },
+        )
+
     @classmethod
     def from_swapi(cls, data: dict, person_id: int) -> "PersonSummary":
         """Create from SWAPI response."""
@@ -47,6 +66,9 @@ class Person(BaseModel):
     skin_color: str = Field(..., description="Skin color")
     eye_color: str = Field(..., description="Eye color")
     birth_year: str = Field(..., description="Birth year (BBY/ABY)")
+    birth_year_aby: float | None = Field(
+        None, description="Birth year relative to the Battle of Yavin (negative for BBY)"
+    )
     gender: str = Field(..., description="Gender")
     homeworld_id: int | None = Field(None, description="Homeworld planet ID")
     homeworld_name: str | None = Field(None, description="Homeworld planet name")
@@ -57,28 +79,6 @@ class Person(BaseModel):
     created: datetime | None = Field(None, description="Created timestamp")
     edited: datetime | None = Field(None, description="Last edited timestamp")
 
-    @field_validator("height", mode="before")
-    @classmethod
-    def parse_height(cls, v: Any) -> int | None:
-        """Parse height from string to int."""
-        if v is None or v == "unknown" or v == "n/a":
-            return None
-        try:
-            return int(str(v).replace(",", ""))
-        except ValueError:
-            return None
-
-    @field_validator("mass", mode="before")
-    @classmethod
-    def parse_mass(cls, v: Any) -> float | None:
-        """Parse mass from string to float."""
-        if v is None or v == "unknown" or v == "n/a":
-            return None
-        try:
-            return float(str(v).replace(",", ""))
-        except ValueError:
-            return None
-
     @classmethod
     def _extract_ids(cls, urls: list[str]) -> list[int]:
         """Extract IDs from SWAPI URLs."""
@@ -118,8 +118,7 @@ class Person(BaseModel):
         return cls(
             id=person_id,
             name=data["name"],
-            height=data.get("height"),
-            mass=data.get("mass"),
+            **normalize("people", data),
             hair_color=data.get("hair_color", "unknown"),
             skin_color=data.get("skin_color", "unknown"),
             eye_color=data.get("eye_color", "unknown"),
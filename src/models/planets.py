@@ -1,9 +1,10 @@
 """Planets models."""
 
 from datetime import datetime
-from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
+
+from src.models.normalization import normalize, parse_int
 
 
 class PlanetSummary(BaseModel):
@@ -15,23 +16,32 @@ class PlanetSummary(BaseModel):
     terrain: str = Field(..., description="Terrain type(s)")
     population: int | None = Field(None, description="Population")
 
+    @classmethod
+    def from_model(cls, planet: "Planet") -> "PlanetSummary":
+        """
+        Create from an already parsed model, without re-parsing the raw record.
+
+        Used with the models parsed at ingest by the dataset store.
+        """
+        return cls.model_validate(
+            {
+                "id": planet.id,
+                "name": planet.name,
+                "climate": planet.climate,
+                "terrain": planet.terrain,
+                "population": planet.population,
+            },
+        )
+
     @classmethod
     def from_swapi(cls, data: dict, planet_id: int) -> "PlanetSummary":
         """Create from SWAPI response."""
-        population = None
-        pop_str = data.get("population", "unknown")
-        if pop_str and pop_str != "unknown":
-            try:
-                population = int(pop_str)
-            except ValueError:
-                pass
-
         return cls(
             id=planet_id,
             name=data["name"],
             climate=data.get("climate", "Unknown"),
             terrain=data.get("terrain", "Unknown"),
-            population=population,
+            population=parse_int(data.get("population")),
         )
 
 
@@ -53,39 +63,6 @@ class Planet(BaseModel):
     created: datetime | None = Field(None, description="Created timestamp")
     edited: datetime | None = Field(None, description="Last edited timestamp")
 
-    @field_validator("diameter", "rotation_period", "orbital_period", mode="before")
-    @classmethod
-    def parse_int_field(cls, v: Any) -> int | None:
-        """Parse integer fields from string."""
-        if v is None or v == "unknown" or v == "n/a":
-            return None
-        try:
-            return int(str(v).replace(",", ""))
-        except ValueError:
-            return None
-
-    @field_validator("population", mode="before")
-    @classmethod
-    def parse_population(cls, v: Any) -> int | None:
-        """Parse population from string to int."""
-        if v is None or v == "unknown" or v == "n/a":
-            return None
-        try:
-            return int(str(v).replace(",", ""))
-        except ValueError:
-            return None
-
-    @field_validator("surface_water", mode="before")
-    @classmethod
-    def parse_surface_water(cls, v: Any) -> int | None:
-        """Parse surface water percentage from string."""
-        if v is None or v == "unknown" or v == "n/a":
-            return None
-        try:
-            return int(float(str(v)))
-        except ValueError:
-            return None
-
     @classmethod
     def _extract_ids(cls, urls: list[str]) -> list[int]:
         """Extract IDs from SWAPI URLs."""
@@ -118,14 +95,10 @@ class Planet(BaseModel):
         return cls(
             id=planet_id,
             name=data["name"],
-            diameter=data.get("diameter"),
-            rotation_period=data.get("rotation_period"),
-            orbital_period=data.get("orbital_period"),
+            **normalize("planets", data),
             gravity=data.get("gravity", "Unknown"),
-            population=data.get("population"),
             climate=data.get("climate", "Unknown"),
             terrain=data.get("terrain", "Unknown"),
-            surface_water=data.get("surface_water"),
             resident_ids=cls._extract_ids(data.get("residents", [])),
             film_ids=cls._extract_ids(data.get("films", [])),
             created=created,
@@ -0,0 +1,12 @@
+"""Search models."""
+
+from pydantic import BaseModel, Field
+
+
+class SearchResult(BaseModel):
+    """A ranked search result across resources."""
+
+    resource: str = Field(..., description="Resource type (people, films, starships...)")
+    id: int = Field(..., description="Resource ID")
+    name: str = Field(..., description="Name (or title for films)")
+    score: float = Field(..., description="Relevance score")
@@ -1,9 +1,10 @@
 """Species models."""
 
 from datetime import datetime
-from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
+
+from src.models.normalization import normalize
 
 
 class SpeciesSummary(BaseModel):
@@ -15,6 +16,23 @@ class SpeciesSummary(BaseModel):
     designation: str = Field(..., description="Designation (sentient/non-sentient)")
     language: str = Field(..., description="Language spoken")
 
+    @classmethod
+    def from_model(cls, species: "Species") -> "SpeciesSummary":
+        """
+        Create from an already parsed model, without re-parsing the raw record.
+
+        Used with the models parsed at ingest by the dataset store.
+        """
+        return cls.model_validate(
+            {
+                "id": species.id,
+                "name": species.name,
+                "classification": species.classification,
+                "designation": species.designation,
+                "language": species.language,
+            },
+        )
+
     @classmethod
     def from_swapi(cls, data: dict, species_id: int) -> "SpeciesSummary":
         """Create from SWAPI response."""
@@ -46,17 +64,6 @@ class Species(BaseModel):
     created: datetime | None = Field(None, description="Created timestamp")
     edited: datetime | None = Field(None, description="Last edited timestamp")
 
-    @field_validator("average_height", "average_lifespan", mode="before")
-    @classmethod
-    def parse_int_field(cls, v: Any) -> int | None:
-        """Parse integer fields from string."""
-        if v is None or v == "unknown" or v == "n/a" or v == "indefinite":
-            return None
-        try:
-            return int(str(v).replace(",", ""))
-        except ValueError:
-            return None
-
     @classmethod
     def _extract_ids(cls, urls: list[str]) -> list[int]:
         """Extract IDs from SWAPI URLs."""
@@ -101,8 +108,7 @@ class Species(BaseModel):
             name=data["name"],
             classification=data.get("classification", "Unknown"),
             designation=data.get("designation", "Unknown"),
-            average_height=data.get("average_height"),
-            average_lifespan=data.get("average_lifespan"),
+            **normalize("species", data),
             eye_colors=data.get("eye_colors", "Unknown"),
             hair_colors=data.get("hair_colors", "Unknown"),
             skin_colors=data.get("skin_colors", "Unknown"),
@@ -1,9 +1,10 @@
 """Starships models."""
 
 from datetime import datetime
-from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
+
+from src.models.normalization import normalize, parse_number
 
 
 class StarshipSummary(BaseModel):
@@ -17,18 +18,30 @@ class StarshipSummary(BaseModel):
     max_atmosphering_speed: str | None = Field(None, description="Max atmospheric speed")
     hyperdrive_rating: float | None = Field(None, description="Hyperdrive rating")
 
+    @classmethod
+    def from_model(cls, starship: "Starship") -> "StarshipSummary":
+        """
+        Create from an already parsed model, without re-parsing the raw record.
+
+        Used with the models parsed at ingest by the dataset store.
+        """
+        return cls.model_validate(
+            {
+                "id": starship.id,
+                "name": starship.name,
+                "model": starship.model,
+                "starship_class": starship.starship_class,
+                "manufacturer": starship.manufacturer,
+                "max_atmosphering_speed": starship.max_atmosphering_speed
+                if starship.max_atmosphering_speed not in ("n/a", "unknown")
+                else None,
+                "hyperdrive_rating": starship.hyperdrive_rating,
+            },
+        )
+
     @classmethod
     def from_swapi(cls, data: dict, starship_id: int) -> "StarshipSummary":
         """Create from SWAPI response."""
-        # Parse hyperdrive rating
-        hyperdrive = None
-        hd_val = data.get("hyperdrive_rating")
-        if hd_val and hd_val not in ("unknown", "n/a"):
-            try:
-                hyperdrive = float(hd_val)
-            except ValueError:
-                pass
-
         # Get max speed (keep as string)
         max_speed = data.get("max_atmosphering_speed")
         if max_speed in ("unknown", "n/a"):
@@ -41,7 +54,7 @@ class StarshipSummary(BaseModel):
             starship_class=data.get("starship_class", "Unknown"),
             manufacturer=data.get("manufacturer", "Unknown"),
             max_atmosphering_speed=max_speed,
-            hyperdrive_rating=hyperdrive,
+            hyperdrive_rating=parse_number(data.get("hyperdrive_rating")),
         )
 
 
@@ -56,73 +69,21 @@ class Starship(BaseModel):
     cost_in_credits: int | None = Field(None, description="Cost in credits")
     length: float | None = Field(None, description="Length in meters")
     crew: str = Field(..., description="Number of crew required")
+    crew_min: int | None = Field(None, description="Minimum crew (crew may be a range)")
+    crew_max: int | None = Field(None, description="Maximum crew (crew may be a range)")
     passengers: str = Field(..., description="Number of passengers")
+    passenger_capacity: int | None = Field(None, description="Maximum number of passengers")
     max_atmosphering_speed: str = Field(..., description="Max atmospheric speed")
     hyperdrive_rating: float | None = Field(None, description="Hyperdrive rating")
     mglt: int | None = Field(None, description="Max Megalights per hour")
     cargo_capacity: int | None = Field(None, description="Cargo capacity in kg")
     consumables: str = Field(..., description="Consumables duration")
+    consumables_days: float | None = Field(None, description="Consumables duration in days")
     pilot_ids: list[int] = Field(default_factory=list, description="Pilot IDs")
     film_ids: list[int] = Field(default_factory=list, description="Film IDs")
     created: datetime | None = Field(None, description="Created timestamp")
     edited: datetime | None = Field(None, description="Last edited timestamp")
 
-    @field_validator("cost_in_credits", mode="before")
-    @classmethod
-    def parse_cost(cls, v: Any) -> int | None:
-        """Parse cost from string to int."""
-        if v is None or v == "unknown" or v == "n/a":
-            return None
-        try:
-            return int(str(v).replace(",", ""))
-        except ValueError:
-            return None
-
-    @field_validator("length", mode="before")
-    @classmethod
-    def parse_length(cls, v: Any) -> float | None:
-        """Parse length from string to float."""
-        if v is None or v == "unknown" or v == "n/a":
-            return None
-        try:
-            return float(str(v).replace(",", ""))
-        except ValueError:
-            return None
-
-    @field_validator("hyperdrive_rating", mode="before")
-    @classmethod
-    def parse_hyperdrive(cls, v: Any) -> float | None:
-        """Parse hyperdrive rating from string to float."""
-        if v is None or v == "unknown" or v == "n/a":
-            return None
-        try:
-            return float(str(v))
-        except ValueError:
-            return None
-
-    @field_validator("mglt", mode="before")
-    @classmethod
-    def parse_mglt(cls, v: Any) -> int | None:
-        """Parse MGLT from string to int."""
-        if v is None or v == "unknown" or v == "n/a":
-            return None
-        try:
-            # Handle cases like "10 MGLT"
-            return int(str(v).split()[0].replace(",", ""))
-        except (ValueError, IndexError):
-            return None
-
-    @field_validator("cargo_capacity", mode="before")
-    @classmethod
-    def parse_cargo(cls, v: Any) -> int | None:
-        """Parse cargo capacity from string to int."""
-        if v is None or v == "unknown" or v == "n/a":
-            return None
-        try:
-            return int(str(v).replace(",", ""))
-        except ValueError:
-            return None
-
     @classmethod
     def _extract_ids(cls, urls: list[str]) -> list[int]:
         """Extract IDs from SWAPI URLs."""
@@ -158,14 +119,10 @@ class Starship(BaseModel):
             model=data.get("model", "Unknown"),
             starship_class=data.get("starship_class", "Unknown"),
             manufacturer=data.get("manufacturer", "Unknown"),
-            cost_in_credits=data.get("cost_in_credits"),
-            length=data.get("length"),
+            **normalize("starships", data),
             crew=data.get("crew", "Unknown"),
             passengers=data.get("passengers", "Unknown"),
             max_atmosphering_speed=data.get("max_atmosphering_speed", "Unknown"),
-            hyperdrive_rating=data.get("hyperdrive_rating"),
-            mglt=data.get("MGLT"),
-            cargo_capacity=data.get("cargo_capacity"),
             consumables=data.get("consumables", "Unknown"),
             pilot_ids=cls._extract_ids(data.get("pilots", [])),
             film_ids=cls._extract_ids(data.get("films", [])),
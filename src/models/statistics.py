@@ -61,3 +61,48 @@ class ComparisonResult(BaseModel):
     entity_type: str = Field(..., description="Type of entities being compared")
     entities: list[dict] = Field(..., description="List of entities with their attributes")
     comparison_fields: list[str] = Field(..., description="Fields used for comparison")
+
+
+class ComparedValue(BaseModel):
+    """A value held by one of the compared entities."""
+
+    id: int = Field(..., description="Entity ID")
+    value: float = Field(..., description="Field value")
+
+
+class ComparisonFieldSummary(BaseModel):
+    """One field over the compared entities."""
+
+    better: str | None = Field(
+        ..., description="Whether the higher or the lower value wins (None for signed years)"
+    )
+    count: int = Field(..., description="Number of entities with a known value")
+    min: ComparedValue | None = Field(None, description="Smallest value")
+    max: ComparedValue | None = Field(None, description="Largest value")
+    mean: float | None = Field(None, description="Mean value")
+    winner: int | None = Field(None, description="ID of the entity with the best value")
+
+
+class ComparedEntity(BaseModel):
+    """An entity of a comparison matrix, with its row of pairwise comparisons."""
+
+    id: int = Field(..., description="Entity ID")
+    name: str = Field(..., description="Entity name")
+    values: dict[str, float | None] = Field(..., description="Value of each field")
+    ranks: dict[str, int | None] = Field(..., description="Rank for each field (1 = best)")
+    difference: dict[str, list[float | None]] | None = Field(
+        None, description="Per field, this value minus the value of each entity, in order"
+    )
+    ratio: dict[str, list[float | None]] | None = Field(
+        None, description="Per field, this value divided by the value of each entity, in order"
+    )
+
+
+class ComparisonMatrix(BaseModel):
+    """Pairwise comparison of many entities."""
+
+    resource: str = Field(..., description="Resource type")
+    fields: list[str] = Field(..., description="Numeric fields compared")
+    count: int = Field(..., description="Number of entities compared")
+    summary: dict[str, ComparisonFieldSummary] = Field(..., description="Summary of each field")
+    entities: list[ComparedEntity] = Field(..., description="Entities, in comparison order")
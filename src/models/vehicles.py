@@ -1,9 +1,10 @@
 """Vehicles models."""
 
 from datetime import datetime
-from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
+
+from src.models.normalization import normalize
 
 
 class VehicleSummary(BaseModel):
@@ -15,6 +16,23 @@ class VehicleSummary(BaseModel):
     vehicle_class: str = Field(..., description="Vehicle class")
     manufacturer: str = Field(..., description="Manufacturer")
 
+    @classmethod
+    def from_model(cls, vehicle: "Vehicle") -> "VehicleSummary":
+        """
+        Create from an already parsed model, without re-parsing the raw record.
+
+        Used with the models parsed at ingest by the dataset store.
+        """
+        return cls.model_validate(
+            {
+                "id": vehicle.id,
+                "name": vehicle.name,
+                "model": vehicle.model,
+                "vehicle_class": vehicle.vehicle_class,
+                "manufacturer": vehicle.manufacturer,
+            },
+        )
+
     @classmethod
     def from_swapi(cls, data: dict, vehicle_id: int) -> "VehicleSummary":
         """Create from SWAPI response."""
@@ -38,50 +56,19 @@ class Vehicle(BaseModel):
     cost_in_credits: int | None = Field(None, description="Cost in credits")
     length: float | None = Field(None, description="Length in meters")
     crew: str = Field(..., description="Number of crew required")
+    crew_min: int | None = Field(None, description="Minimum crew (crew may be a range)")
+    crew_max: int | None = Field(None, description="Maximum crew (crew may be a range)")
     passengers: str = Field(..., description="Number of passengers")
+    passenger_capacity: int | None = Field(None, description="Maximum number of passengers")
     max_atmosphering_speed: int | None = Field(None, description="Max atmospheric speed")
     cargo_capacity: int | None = Field(None, description="Cargo capacity in kg")
     consumables: str = Field(..., description="Consumables duration")
+    consumables_days: float | None = Field(None, description="Consumables duration in days")
     pilot_ids: list[int] = Field(default_factory=list, description="Pilot IDs")
     film_ids: list[int] = Field(default_factory=list, description="Film IDs")
     created: datetime | None = Field(None, description="Created timestamp")
     edited: datetime | None = Field(None, description="Last edited timestamp")
 
-    @field_validator("cost_in_credits", "cargo_capacity", mode="before")
-    @classmethod
-    def parse_int_field(cls, v: Any) -> int | None:
-        """Parse integer fields from string."""
-        if v is None or v == "unknown" or v == "n/a":
-            return None
-        try:
-            return int(str(v).replace(",", ""))
-        except ValueError:
-            return None
-
-    @field_validator("length", mode="before")
-    @classmethod
-    def parse_length(cls, v: Any) -> float | None:
-        """Parse length from string to float."""
-        if v is None or v == "unknown" or v == "n/a":
-            return None
-        try:
-            return float(str(v).replace(",", ""))
-        except ValueError:
-            return None
-
-    @field_validator("max_atmosphering_speed", mode="before")
-    @classmethod
-    def parse_speed(cls, v: Any) -> int | None:
-        """Parse max speed from string to int."""
-        if v is None or v == "unknown" or v == "n/a":
-            return None
-        try:
-            # Handle cases like "30" or "1000km"
-            speed_str = str(v).lower().replace("km", "").strip()
-            return int(speed_str)
-        except ValueError:
-            return None
-
     @classmethod
     def _extract_ids(cls, urls: list[str]) -> list[int]:
         """Extract IDs from SWAPI URLs."""
@@ -117,12 +104,9 @@ class Vehicle(BaseModel):
             model=data.get("model", "Unknown"),
             vehicle_class=data.get("vehicle_class", "Unknown"),
             manufacturer=data.get("manufacturer", "Unknown"),
-            cost_in_credits=data.get("cost_in_credits"),
-            length=data.get("length"),
+            **normalize("vehicles", data),
             crew=data.get("crew", "Unknown"),
             passengers=data.get("passengers", "Unknown"),
-            max_atmosphering_speed=data.get("max_atmosphering_speed"),
-            cargo_capacity=data.get("cargo_capacity"),
             consumables=data.get("consumables", "Unknown"),
             pilot_ids=cls._extract_ids(data.get("pilots", [])),
             film_ids=cls._extract_ids(data.get("films", [])),
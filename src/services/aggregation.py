@@ -0,0 +1,107 @@
+"""Group-by aggregation over the column store."""
+
+import math
+from collections.abc import Mapping, Sequence
+from itertools import product
+from typing import NamedTuple
+
+from src.services.column_analytics import percentile
+
+AGGREGATE_FUNCTIONS = ("count", "sum", "avg", "min", "max")
+
+
+class AggregationError(Exception):
+    """Invalid aggregation query."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
+
+class Aggregate(NamedTuple):
+    """An aggregate function applied to a numeric field (no field for a row count)."""
+
+    function: str
+    field: str | None = None
+    q: float | None = None
+
+    @property
+    def name(self) -> str:
+        """Output column name, e.g. `count`, `avg_height` or `p90_height`."""
+        return self.function if self.field is None else f"{self.function}_{self.field}"
+
+
+def parse_aggregate(spec: str, fields: Sequence[str]) -> Aggregate:
+    """
+    Parse an aggregate spec: `count`, `<function>:<field>` or `p<q>:<field>`.
+
+    `count:<field>` counts the rows where the field is known.
+    """
+    function, _, field = spec.strip().lower().partition(":")
+    if function == "count" and not field:
+        return Aggregate("count")
+    if field not in fields:
+        raise AggregationError(f"Invalid field in '{spec}'. Use: {', '.join(fields)}")
+    if function in AGGREGATE_FUNCTIONS:
+        return Aggregate(function, field)
+    if function.startswith("p"):
+        try:
+            q = float(function[1:])
+        except ValueError:
+            q = -1.0
+        if 0 <= q <= 100:
+            return Aggregate(f"p{q:g}", field, q)
+    raise AggregationError(
+        f"Invalid aggregate '{spec}'. Use count, or one of "
+        f"{', '.join(AGGREGATE_FUNCTIONS)}, p<0-100> followed by ':<field>'"
+    )
+
+
+def group_rows(labels: Sequence[Sequence[Sequence[str]]], rows: Sequence[int]) -> dict:
+    """
+    Hash rows into groups.
+
+    `labels[k][row]` holds the labels of a row for the k-th grouping key; a row
+    with several labels (e.g. climate "arid, temperate") joins every group of
+    the cross product. Returns {group key tuple: [rows]} in first-seen order.
+    """
+    groups: dict[tuple[str, ...], list[int]] = {}
+    for row in rows:
+        for key in product(*(field_labels[row] for field_labels in labels)):
+            group = groups.get(key)
+            if group is None:
+                groups[key] = group = []
+            group.append(row)
+    return groups
+
+
+def aggregate(
+    rows: Sequence[int], vectors: Mapping[str, Sequence[float]], aggregates: Sequence[Aggregate]
+) -> dict[str, float | int | None]:
+    """Compute aggregates over some rows; unknown (NaN) values are skipped."""
+    known: dict[str, list[float]] = {}
+    for field in {a.field for a in aggregates if a.field is not None}:
+        vector = vectors[field]
+        known[field] = sorted(value for row in rows if not math.isnan(value := vector[row]))
+
+    result: dict[str, float | int | None] = {}
+    for agg in aggregates:
+        if agg.field is None:
+            result[agg.name] = len(rows)
+            continue
+        values = known[agg.field]
+        if agg.function == "count":
+            result[agg.name] = len(values)
+        elif not values:
+            result[agg.name] = None
+        elif agg.function == "sum":
+            result[agg.name] = math.fsum(values)
+        elif agg.function == "avg":
+            result[agg.name] = math.fsum(values) / len(values)
+        elif agg.function == "min":
+            result[agg.name] = values[0]
+        elif agg.function == "max":
+            result[agg.name] = values[-1]
+        else:
+            result[agg.name] = percentile(values, agg.q)
+    return result
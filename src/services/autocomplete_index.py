@@ -0,0 +1,99 @@
+"""Prefix autocomplete index over resource names."""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from typing import NamedTuple
+
+
+class Suggestion(NamedTuple):
+    """An autocomplete suggestion."""
+
+    resource: str
+    id: int
+    name: str
+    popularity: int
+
+
+def _word_starts(name: str) -> list[str]:
+    """Keys of a name: the name from each of its word starts ("luke skywalker", "skywalker")."""
+    words = name.lower().split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+class AutocompleteIndex:
+    """
+    Sorted-array prefix index.
+
+    Every word start of a name is a key ("luke skywalker" and "skywalker"),
+    so typing any word of a name matches. Keys are kept in one sorted list;
+    a prefix query is a bisect followed by a scan of the contiguous matches.
+    """
+
+    def __init__(self, suggestions: Iterable[Suggestion] = ()):
+        entries: list[tuple[str, str, int]] = []
+        self._suggestions: dict[tuple[str, int], Suggestion] = {}
+        for suggestion in suggestions:
+            self._suggestions[(suggestion.resource, suggestion.id)] = suggestion
+            for key in _word_starts(suggestion.name):
+                entries.append((key, suggestion.resource, suggestion.id))
+        entries.sort()
+        self._keys = [key for key, _, _ in entries]
+        self._owners = [(resource, entity_id) for _, resource, entity_id in entries]
+
+    def __len__(self) -> int:
+        return len(self._suggestions)
+
+    def add(self, suggestion: Suggestion) -> None:
+        """Add a suggestion, replacing the previous one of the same entity."""
+        owner = (suggestion.resource, suggestion.id)
+        previous = self._suggestions.get(owner)
+        if previous is not None and previous.name == suggestion.name:
+            # Same keys, only the popularity changed
+            self._suggestions[owner] = suggestion
+            return
+
+        self.remove(*owner)
+        self._suggestions[owner] = suggestion
+        for key in _word_starts(suggestion.name):
+            idx = bisect_right(self._keys, key)
+            self._keys.insert(idx, key)
+            self._owners.insert(idx, owner)
+
+    def remove(self, resource: str, entity_id: int) -> None:
+        """Remove the suggestion of an entity (no-op if it is not indexed)."""
+        suggestion = self._suggestions.pop((resource, entity_id), None)
+        if suggestion is None:
+            return
+        for key in _word_starts(suggestion.name):
+            idx = bisect_left(self._keys, key)
+            while self._owners[idx] != (resource, entity_id):
+                idx += 1
+            del self._keys[idx]
+            del self._owners[idx]
+
+    def complete(
+        self,
+        prefix: str,
+        resources: Iterable[str] | None = None,
+        limit: int = 10,
+    ) -> list[Suggestion]:
+        """Suggestions whose name (or any word of it) starts with `prefix`."""
+        prefix = " ".join(prefix.lower().split())
+        if not prefix:
+            return []
+        allowed = set(resources) if resources is not None else None
+
+        found: dict[tuple[str, int], Suggestion] = {}
+        start = bisect_left(self._keys, prefix)
+        for idx in range(start, len(self._keys)):
+            if not self._keys[idx].startswith(prefix):
+                break
+            suggestion = self._suggestions[self._owners[idx]]
+            if allowed is None or suggestion.resource in allowed:
+                found[self._owners[idx]] = suggestion
+
+        # Most popular first, then the ones whose full name starts with the prefix
+        return sorted(
+            found.values(),
+            key=lambda s: (-s.popularity, not s.name.lower().startswith(prefix), s.name),
+        )[:limit]
@@ -0,0 +1,143 @@
+"""Summary statistics, percentiles and histograms over sorted numeric columns."""
+
+import math
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from typing import NamedTuple
+
+
+class ColumnSummary(NamedTuple):
+    """Summary statistics of a numeric column (None when it has no values)."""
+
+    count: int
+    min: float | None
+    max: float | None
+    mean: float | None
+    median: float | None
+    stddev: float | None
+
+
+class HistogramBucket(NamedTuple):
+    """A histogram bin covering [start, end) (the last bin also includes `end`)."""
+
+    start: float
+    end: float
+    count: int
+
+
+def percentile(values: Sequence[float], q: float) -> float | None:
+    """
+    The q-th percentile (0-100) of ascending values.
+
+    Interpolates linearly between the closest ranks, like numpy's default.
+    """
+    if not values:
+        return None
+    position = (len(values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize(values: Sequence[float]) -> ColumnSummary:
+    """Summary statistics of ascending values (population standard deviation)."""
+    count = len(values)
+    if not count:
+        return ColumnSummary(0, None, None, None, None, None)
+
+    mean = math.fsum(values) / count
+    variance = math.fsum((value - mean) ** 2 for value in values) / count
+    return ColumnSummary(
+        count=count,
+        min=values[0],
+        max=values[-1],
+        mean=mean,
+        median=percentile(values, 50),
+        stddev=math.sqrt(variance),
+    )
+
+
+def histogram(
+    values: Sequence[float],
+    bins: int = 10,
+    start: float | None = None,
+    end: float | None = None,
+) -> list[HistogramBucket]:
+    """
+    Equal-width histogram of ascending values.
+
+    The range defaults to [min, max]; values outside an explicit range are
+    ignored. Each bin count is two bisects, so the cost does not depend on
+    the number of values. Raises ValueError when the resolved range is
+    empty or reversed; only a column of equal values is widened by 0.5.
+    """
+    if not values and (start is None or end is None):
+        return []
+    low = values[0] if start is None else start
+    high = values[-1] if end is None else end
+    if low > high or (low == high and (start is not None or end is not None)):
+        raise ValueError(f"Histogram start ({low:g}) must be lower than end ({high:g})")
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+
+    width = (high - low) / bins
+    edges = [low + width * i for i in range(bins)] + [high]
+    buckets = []
+    for i in range(bins):
+        first = bisect_left(values, edges[i])
+        last = (
+            bisect_right(values, edges[i + 1])
+            if i == bins - 1
+            else bisect_left(values, edges[i + 1])
+        )
+        buckets.append(HistogramBucket(edges[i], edges[i + 1], last - first))
+    return buckets
+
+
+class PairwiseStats(NamedTuple):
+    """Covariance and correlation matrices plus the number of rows behind each pair."""
+
+    covariance: list[list[float | None]]
+    correlation: list[list[float | None]]
+    counts: list[list[int]]
+
+
+def pairwise(
+    vectors: Sequence[Sequence[float]], rows: Sequence[int] | None = None
+) -> PairwiseStats:
+    """
+    Sample covariance and Pearson correlation between row-aligned vectors.
+
+    NaN marks an unknown value. Every pair uses the rows where both values
+    are known (pairwise-complete), so one sparse field does not shrink the
+    sample of the others. `rows` restricts the computation to a subset.
+    """
+    size = len(vectors)
+    if rows is None:
+        rows = range(len(vectors[0])) if vectors else range(0)
+    known = [[i for i in rows if not math.isnan(vector[i])] for vector in vectors]
+    covariance: list[list[float | None]] = [[None] * size for _ in range(size)]
+    correlation: list[list[float | None]] = [[None] * size for _ in range(size)]
+    counts = [[0] * size for _ in range(size)]
+
+    for a in range(size):
+        known_a = set(known[a])
+        for b in range(a, size):
+            common = [i for i in known[b] if i in known_a]
+            counts[a][b] = counts[b][a] = len(common)
+            if len(common) < 2:
+                continue
+            x = [vectors[a][i] for i in common]
+            y = [vectors[b][i] for i in common]
+            mean_x = math.fsum(x) / len(common)
+            mean_y = math.fsum(y) / len(common)
+            dx = [value - mean_x for value in x]
+            dy = [value - mean_y for value in y]
+            cov = math.fsum(p * q for p, q in zip(dx, dy, strict=True)) / (len(common) - 1)
+            covariance[a][b] = covariance[b][a] = cov
+            spread = math.sqrt(math.fsum(p * p for p in dx) * math.fsum(q * q for q in dy))
+            if spread:
+                corr = 1.0 if a == b else max(-1.0, min(1.0, cov * (len(common) - 1) / spread))
+                correlation[a][b] = correlation[b][a] = corr
+
+    return PairwiseStats(covariance, correlation, counts)
@@ -0,0 +1,90 @@
+"""Pairwise comparison of many entities over the numeric columns."""
+
+import math
+from collections.abc import Sequence
+from typing import NamedTuple
+
+from src.services.dataset_store import INTERVAL_FIELDS
+
+# Fields where the smallest value wins (cheaper, faster hyperdrive); the largest wins elsewhere
+LOWER_IS_BETTER = frozenset({"cost_in_credits", "hyperdrive_rating"})
+
+
+class FieldComparison(NamedTuple):
+    """Summary of one field over the compared entities."""
+
+    field: str
+    better: str | None
+    count: int
+    min_id: int | None
+    min: float | None
+    max_id: int | None
+    max: float | None
+    mean: float | None
+    winner_id: int | None
+    ranks: list[int | None]
+
+
+def compare_field(field: str, ids: Sequence[int], values: Sequence[float]) -> FieldComparison:
+    """
+    Min, max, mean, winner and rank of every entity for one field.
+
+    `values` are aligned with `ids`, NaN where unknown. Ranks start at 1 for
+    the best value and ties share a rank (1, 2, 2, 4); unknown values have
+    no rank. Ties for min, max and winner go to the lowest ID. Interval
+    fields (signed years) have no best value: no winner and no ranks.
+    """
+    interval = field in INTERVAL_FIELDS
+    # Interval fields are only ordered ascending, to find their min and max
+    lower = field in LOWER_IS_BETTER or interval
+    better = None if interval else "lower" if lower else "higher"
+    known = sorted(
+        (value if lower else -value, ids[i], i)
+        for i, value in enumerate(values)
+        if not math.isnan(value)
+    )
+    ranks: list[int | None] = [None] * len(values)
+    if not interval:
+        for position, (key, _, i) in enumerate(known):
+            previous = known[position - 1] if position else None
+            ranks[i] = ranks[previous[2]] if previous and previous[0] == key else position + 1
+
+    if not known:
+        return FieldComparison(field, better, 0, None, None, None, None, None, None, ranks)
+
+    best, worst = known[0], known[-1]
+    # The opposite end's lowest ID among tied values
+    worst = next(entry for entry in known if entry[0] == worst[0])
+    low, high = (best, worst) if lower else (worst, best)
+    return FieldComparison(
+        field=field,
+        better=better,
+        count=len(known),
+        min_id=low[1],
+        min=values[low[2]],
+        max_id=high[1],
+        max=values[high[2]],
+        mean=math.fsum(values[i] for _, _, i in known) / len(known),
+        winner_id=None if interval else best[1],
+        ranks=ranks,
+    )
+
+
+def pairwise(
+    values: Sequence[float], i: int, with_ratios: bool = True
+) -> tuple[list[float | None], list[float | None]]:
+    """
+    Differences and ratios of entity `i` against every entity for one field.
+
+    Returns `values[i] - values[j]` and `values[i] / values[j]` for every j;
+    None where either value is unknown (or for a zero divisor), and no
+    ratios at all without `with_ratios` (interval fields).
+    """
+    value = values[i]
+    if math.isnan(value):
+        return [None] * len(values), [None] * len(values)
+    differences = [None if math.isnan(other) else value - other for other in values]
+    if not with_ratios:
+        return differences, [None] * len(values)
+    ratios = [None if math.isnan(other) or other == 0 else value / other for other in values]
+    return differences, ratios
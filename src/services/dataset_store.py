@@ -0,0 +1,863 @@
+"""In-memory dataset store with column indexes over the full SWAPI dataset."""
+
+import asyncio
+import logging
+import math
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+from src.models.films import Film
+from src.models.people import Person
+from src.models.planets import Planet
+from src.models.species import Species
+from src.models.starships import Starship
+from src.models.vehicles import Vehicle
+from src.services.autocomplete_index import AutocompleteIndex, Suggestion
+from src.services.cache_service import CacheService
+from src.services.materialized_views import MaterializedViews
+from src.services.model_cache import ModelCache
+from src.services.relation_index import RELATION_FIELDS, Adjacency, RelationIndex
+from src.services.search_index import SearchIndex
+from src.services.swapi_client import SWAPIClient
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_MODELS: dict[str, type[BaseModel]] = {
+    "people": Person,
+    "films": Film,
+    "starships": Starship,
+    "planets": Planet,
+    "vehicles": Vehicle,
+    "species": Species,
+}
+
+# Numeric model attributes that get a sorted column per resource
+NUMERIC_FIELDS: dict[str, tuple[str, ...]] = {
+    "people": ("height", "mass", "birth_year_aby"),
+    "films": ("episode_id",),
+    "starships": (
+        "length",
+        "cost_in_credits",
+        "mglt",
+        "hyperdrive_rating",
+        "cargo_capacity",
+        "crew_max",
+        "passenger_capacity",
+        "consumables_days",
+    ),
+    "planets": ("population", "diameter", "rotation_period", "orbital_period", "surface_water"),
+    "vehicles": (
+        "length",
+        "cost_in_credits",
+        "max_atmosphering_speed",
+        "cargo_capacity",
+        "crew_max",
+        "passenger_capacity",
+        "consumables_days",
+    ),
+    "species": ("average_height", "average_lifespan"),
+}
+
+# Numeric fields on an interval scale (signed in-universe years): order and differences
+# are meaningful, ratios and a "best" value are not, so comparisons skip them by default
+INTERVAL_FIELDS: frozenset[str] = frozenset({"birth_year_aby"})
+
+# Categorical model attributes usable for grouping. True marks fields holding
+# comma separated lists (e.g. climate "arid, temperate"), split into values.
+CATEGORICAL_FIELDS: dict[str, dict[str, bool]] = {
+    "people": {"gender": False, "eye_color": False, "hair_color": True, "skin_color": True},
+    "films": {"director": False, "producer": True},
+    "starships": {"starship_class": False, "manufacturer": False},
+    "planets": {"climate": True, "terrain": True, "gravity": False},
+    "vehicles": {"vehicle_class": False, "manufacturer": False},
+    "species": {
+        "classification": False,
+        "designation": False,
+        "language": False,
+        "eye_colors": True,
+        "hair_colors": True,
+        "skin_colors": True,
+    },
+}
+
+# Related resources of each resource (relations are indexed in both directions)
+RELATED_RESOURCES: dict[str, set[str]] = {
+    resource: {target for source, _, target in RELATION_FIELDS if source == resource}
+    | {source for source, _, target in RELATION_FIELDS if target == resource}
+    for resource in RESOURCE_MODELS
+}
+
+
+def display_name(model: BaseModel) -> str:
+    """Return the human readable name of a model (films use their title)."""
+    return getattr(model, "name", None) or getattr(model, "title", "")
+
+
+def _popularity_target(resource: str) -> str:
+    """Related resource whose link count measures popularity."""
+    return "people" if resource == "films" else "films"
+
+
+class SortedColumn:
+    """
+    Numeric column sorted ascending by (value, id).
+
+    Entities without a value (unknown/n/a) are left out. Lookups use bisect,
+    so rank and range queries are O(log n) with no per-request sort.
+    """
+
+    def __init__(self, pairs: list[tuple[float, int]]):
+        pairs = sorted(pairs)
+        self.values = array("d", (value for value, _ in pairs))
+        self.ids = array("l", (entity_id for _, entity_id in pairs))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def count_below(self, value: float) -> int:
+        """Number of entities with a value strictly lower than `value`."""
+        return bisect_left(self.values, value)
+
+    def count_above(self, value: float) -> int:
+        """Number of entities with a value strictly higher than `value`."""
+        return len(self.values) - bisect_right(self.values, value)
+
+    def index_of(self, entity_id: int, value: float) -> int | None:
+        """Position of an entity in the column, or None if it is not indexed."""
+        lo = bisect_left(self.values, value)
+        hi = bisect_right(self.values, value)
+        # Ties are ordered by ID, so the entity can be located with a second bisect
+        idx = bisect_left(self.ids, entity_id, lo, hi)
+        if idx < hi and self.ids[idx] == entity_id:
+            return idx
+        return None
+
+    def insert(self, value: float, entity_id: int) -> None:
+        """Insert an entity, keeping the (value, id) order."""
+        lo = bisect_left(self.values, value)
+        hi = bisect_right(self.values, value)
+        idx = bisect_left(self.ids, entity_id, lo, hi)
+        self.values.insert(idx, value)
+        self.ids.insert(idx, entity_id)
+
+    def remove(self, value: float, entity_id: int) -> None:
+        """Remove an entity (no-op if it is not indexed)."""
+        idx = self.index_of(entity_id, value)
+        if idx is not None:
+            del self.values[idx]
+            del self.ids[idx]
+
+    def between(
+        self,
+        low: float | None = None,
+        high: float | None = None,
+        include_low: bool = True,
+        include_high: bool = True,
+    ) -> array:
+        """IDs of the entities whose value lies in a range (open ends when None)."""
+        start = 0
+        if low is not None:
+            start = bisect_left(self.values, low) if include_low else bisect_right(self.values, low)
+        end = len(self.values)
+        if high is not None:
+            end = (
+                bisect_right(self.values, high) if include_high else bisect_left(self.values, high)
+            )
+        return self.ids[start:end]
+
+
+class SortIndex:
+    """
+    Entity IDs of a table in a list sort order, with ties broken by ID.
+
+    Used for keyset pagination: a page resumes right after the last (key, id)
+    seen, located by bisection, so it needs no per-request sort and is stable
+    when entities are added or removed before that position.
+    """
+
+    def __init__(self, models: Mapping[int, Any], key: Callable[[Any], Any], descending: bool):
+        self.descending = descending
+        entries = sorted((key(model), entity_id) for entity_id, model in models.items())
+        if descending:
+            # Keys descending, ties still by ascending ID
+            entries.sort(key=lambda entry: entry[0], reverse=True)
+        self.keys = [entry[0] for entry in entries]
+        self.ids = [entry[1] for entry in entries]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _before(self, position: int, key: Any, entity_id: int) -> bool:
+        current = self.keys[position]
+        if current == key:
+            return self.ids[position] <= entity_id
+        return current > key if self.descending else current < key
+
+    def after(self, key: Any, entity_id: int) -> int:
+        """Position of the first entry ordered after (key, entity_id)."""
+        lo, hi = 0, len(self.ids)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._before(mid, key, entity_id):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+class CategoricalColumn:
+    """
+    Dictionary-encoded categorical field: one int code per row.
+
+    Each distinct lowercased value is stored once in `values`, with its
+    comma separated parts when the field holds lists (`parts`), the spelling
+    first seen (`labels`) and the bitmap of the rows holding it (`bitmaps`).
+    Matching a value is a lookup in the (small) vocabulary followed by
+    bitmap unions; rows are never re-read or re-lowercased.
+    """
+
+    def __init__(self, raw_values: Iterable[str], split: bool):
+        self.values: list[str] = []
+        self.parts: list[tuple[str, ...]] = []
+        self.labels: list[tuple[str, ...]] = []
+        self.bitmaps: list[int] = []
+        self.codes = array("I")
+        self._code_of: dict[str, int] = {}
+        for row, raw in enumerate(raw_values):
+            value = raw.lower()
+            code = self._code_of.get(value)
+            if code is None:
+                code = self._code_of[value] = len(self.values)
+                labels = [v.strip() for v in raw.split(",")] if split else [raw.strip()]
+                labels = [label for label in labels if label] or ["unknown"]
+                self.values.append(value)
+                self.labels.append(tuple(labels))
+                self.parts.append(tuple(label.lower() for label in labels))
+                self.bitmaps.append(0)
+            self.codes.append(code)
+            self.bitmaps[code] |= 1 << row
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def part_index(self) -> dict[str, int]:
+        """Bitmap of the rows holding each lowercase part."""
+        index: dict[str, int] = {}
+        for parts, bitmap in zip(self.parts, self.bitmaps, strict=True):
+            for part in parts:
+                index[part] = index.get(part, 0) | bitmap
+        return index
+
+    def equal(self, value: str) -> int:
+        """Rows whose whole value equals `value` (lowercase)."""
+        code = self._code_of.get(value)
+        return 0 if code is None else self.bitmaps[code]
+
+    def containing(self, text: str) -> int:
+        """Rows whose whole lowercase value contains `text` (lowercase)."""
+        matched = 0
+        for value, bitmap in zip(self.values, self.bitmaps, strict=True):
+            if text in value:
+                matched |= bitmap
+        return matched
+
+
+# Set operators of membership queries
+SET_OPERATORS = ("all", "any", "none", "exactly")
+
+
+class MembershipColumn:
+    """
+    Links of every row to a small related resource (e.g. the films), as bitmasks.
+
+    Each related entity gets a bit, in `domain` order; `masks[row]` holds the
+    bits of the entities a row is linked to, so checking one entity is a
+    single AND. `bitmaps[bit]` is the transposed view, the bitmap of the rows
+    linked to each related entity, so a set query over every row takes one
+    big-int operation per related entity instead of a pass over the rows.
+    """
+
+    def __init__(self, row_ids: Sequence[int], domain: Sequence[int], adjacency: Adjacency):
+        self.domain = list(domain)
+        self._bit = {target: bit for bit, target in enumerate(self.domain)}
+        self.masks: list[int] = []
+        self.bitmaps = [0] * len(self.domain)
+        for row, entity_id in enumerate(row_ids):
+            mask = 0
+            for target in adjacency.neighbors(entity_id):
+                bit = self._bit.get(target)
+                if bit is not None:
+                    mask |= 1 << bit
+                    self.bitmaps[bit] |= 1 << row
+            self.masks.append(mask)
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def mask(self, targets: Iterable[int]) -> int:
+        """Mask of some related entities (KeyError for unknown ones)."""
+        mask = 0
+        for target in targets:
+            mask |= 1 << self._bit[target]
+        return mask
+
+    def targets(self, mask: int) -> list[int]:
+        """Related entities set in a mask, in domain order."""
+        return [target for bit, target in enumerate(self.domain) if mask >> bit & 1]
+
+    def select(self, operator: str, mask: int) -> int:
+        """
+        Rows linked to all, any, none or exactly the related entities of `mask`.
+
+        An empty mask matches every row for `all` and `none`, no row for
+        `any`, and the unlinked rows for `exactly`.
+        """
+        everything = (1 << len(self.masks)) - 1
+        if operator == "all":
+            rows = everything
+            for bit, bitmap in enumerate(self.bitmaps):
+                if mask >> bit & 1:
+                    rows &= bitmap
+            return rows
+
+        linked = other = 0
+        for bit, bitmap in enumerate(self.bitmaps):
+            if mask >> bit & 1:
+                linked |= bitmap
+            else:
+                other |= bitmap
+        if operator == "any":
+            return linked
+        if operator == "none":
+            return everything & ~linked
+        if operator == "exactly":
+            return self.select("all", mask) & ~other
+        raise ValueError(f"Unknown set operator: {operator}")
+
+
+class ResourceChanges(NamedTuple):
+    """IDs added, edited and removed in one resource by a refresh."""
+
+    added: list[int]
+    updated: list[int]
+    removed: list[int]
+
+    @property
+    def total(self) -> int:
+        """Number of changed records."""
+        return len(self.added) + len(self.updated) + len(self.removed)
+
+
+class ChangeSet(NamedTuple):
+    """Outcome of a dataset refresh."""
+
+    version: int
+    full: bool
+    resources: dict[str, ResourceChanges]
+
+    @property
+    def changed(self) -> list[str]:
+        """Resources with at least one changed record."""
+        return [resource for resource, changes in self.resources.items() if changes.total]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summary of the changes, leaving out untouched resources."""
+        return {
+            "version": self.version,
+            "full": self.full,
+            "resources": {
+                resource: self.resources[resource]._asdict() for resource in self.changed
+            },
+        }
+
+    def counts(self) -> dict[str, Any]:
+        """Number of added, updated and removed records per changed resource."""
+        return {
+            "version": self.version,
+            "full": self.full,
+            "resources": {
+                resource: {
+                    kind: len(ids) for kind, ids in self.resources[resource]._asdict().items()
+                }
+                for resource in self.changed
+            },
+        }
+
+
+class ResourceTable:
+    """Parsed models of one resource plus its sorted numeric columns."""
+
+    def __init__(
+        self,
+        resource: str,
+        records: Iterable[dict[str, Any]],
+        cache: ModelCache | None = None,
+    ):
+        self.resource = resource
+        self._model_cls = RESOURCE_MODELS[resource]
+        self._cache = cache
+
+        self.records: dict[int, dict[str, Any]] = {}
+        self.models: dict[int, BaseModel] = {}
+        for data in records:
+            if "id" not in data:
+                continue
+            data = self._retained(data)
+            self.records[data["id"]] = data
+            self.models[data["id"]] = self._parse(data)
+
+        # Row-ordered structures derived on demand, dropped whenever rows change
+        self._derived: dict[tuple[Any, ...], Any] = {}
+        self.sorted_columns: dict[str, SortedColumn] = {}
+        for field in NUMERIC_FIELDS[resource]:
+            pairs = []
+            for entity_id, model in self.models.items():
+                value = getattr(model, field, None)
+                if value is not None:
+                    pairs.append((float(value), entity_id))
+            self.sorted_columns[field] = SortedColumn(pairs)
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def _retained(self, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Copy of a raw record, with its categorical values interned, to keep in `records`.
+
+        Categorical values repeat across records: the table keeps a single
+        copy of each, shared by the records and the models parsed from them,
+        while the crawled record (which the SWAPI response cache may also
+        hold) is left untouched.
+        """
+        record = dict(data)
+        for field in CATEGORICAL_FIELDS[self.resource]:
+            value = record.get(field)
+            if isinstance(value, str):
+                record[field] = sys.intern(value)
+        return record
+
+    def _parse(self, data: dict[str, Any]) -> BaseModel:
+        if self._cache is not None:
+            return self._cache.parse(self.resource, data)
+        return self._model_cls.from_swapi(data, data["id"])  # type: ignore[attr-defined]
+
+    def diff(self, records: Mapping[int, dict[str, Any]]) -> ResourceChanges:
+        """Compare fresh records keyed by ID against the table by (id, edited)."""
+        current = self.records
+        return ResourceChanges(
+            added=sorted(records.keys() - current.keys()),
+            updated=sorted(
+                entity_id
+                for entity_id in records.keys() & current.keys()
+                if records[entity_id].get("edited") != current[entity_id].get("edited")
+            ),
+            removed=sorted(current.keys() - records.keys()),
+        )
+
+    def apply(self, records: Mapping[int, dict[str, Any]], changes: ResourceChanges) -> None:
+        """Re-parse and re-index only the records listed in `changes`."""
+        self._derived.clear()
+        for entity_id in changes.updated + changes.removed:
+            model = self.models[entity_id]
+            for field, column in self.sorted_columns.items():
+                value = getattr(model, field, None)
+                if value is not None:
+                    column.remove(float(value), entity_id)
+        for entity_id in changes.removed:
+            del self.records[entity_id]
+            del self.models[entity_id]
+        if self._cache is not None:
+            self._cache.discard(self.resource, changes.removed)
+
+        for entity_id in changes.added + changes.updated:
+            data = self._retained(records[entity_id])
+            model = self._parse(data)
+            self.records[entity_id] = data
+            self.models[entity_id] = model
+            for field, column in self.sorted_columns.items():
+                value = getattr(model, field, None)
+                if value is not None:
+                    column.insert(float(value), entity_id)
+
+    def get(self, entity_id: int) -> BaseModel | None:
+        """Get a parsed model by ID."""
+        return self.models.get(entity_id)
+
+    def get_many(self, entity_ids: Iterable[int]) -> dict[int, BaseModel]:
+        """Get the parsed models of many IDs in one lookup (unknown IDs are left out)."""
+        models = self.models
+        return {entity_id: models[entity_id] for entity_id in entity_ids if entity_id in models}
+
+    def column(self, field: str) -> SortedColumn:
+        """Get the sorted column of a numeric field."""
+        if field not in self.sorted_columns:
+            raise KeyError(f"Field '{field}' is not a numeric field of {self.resource}")
+        return self.sorted_columns[field]
+
+    def row_ids(self) -> list[int]:
+        """Entity IDs in row order (the order of vectors and bitmaps)."""
+        return list(self.models)
+
+    def _row_positions(self) -> dict[int, int]:
+        if ("rows", "") not in self._derived:
+            self._derived[("rows", "")] = {
+                entity_id: row for row, entity_id in enumerate(self.models)
+            }
+        return self._derived[("rows", "")]
+
+    def row(self, entity_id: int) -> int | None:
+        """Row of an entity (None if unknown)."""
+        return self._row_positions().get(entity_id)
+
+    def all_rows(self) -> int:
+        """Bitmap with every row set."""
+        return (1 << len(self.models)) - 1
+
+    def bitmap(self, entity_ids: Iterable[int]) -> int:
+        """Bitmap of the rows of some entities (bit i is row i)."""
+        positions = self._row_positions()
+        bitmap = 0
+        for entity_id in entity_ids:
+            row = positions.get(entity_id)
+            if row is not None:
+                bitmap |= 1 << row
+        return bitmap
+
+    def rows_of(self, bitmap: int) -> list[int]:
+        """Rows set in a bitmap, in ascending order."""
+        rows = []
+        while bitmap:
+            lowest = bitmap & -bitmap
+            rows.append(lowest.bit_length() - 1)
+            bitmap ^= lowest
+        return rows
+
+    def ids_of(self, bitmap: int) -> list[int]:
+        """Entity IDs of the rows set in a bitmap, in row order."""
+        row_ids = self.row_ids() if bitmap else []
+        return [row_ids[row] for row in self.rows_of(bitmap)]
+
+    def models_of(self, bitmap: int) -> list[BaseModel]:
+        """Parsed models of the rows set in a bitmap, in row order."""
+        if bitmap == self.all_rows():
+            return list(self.models.values())
+        return [self.models[entity_id] for entity_id in self.ids_of(bitmap)]
+
+    def vector(self, field: str) -> array:
+        """Values of a numeric field in row order, NaN where the value is unknown."""
+        if ("vector", field) not in self._derived:
+            self.column(field)
+            self._derived[("vector", field)] = array(
+                "d",
+                (
+                    math.nan if (value := getattr(model, field, None)) is None else float(value)
+                    for model in self.models.values()
+                ),
+            )
+        return self._derived[("vector", field)]
+
+    def sort_index(self, sort_by: str, descending: bool, key: Callable[[Any], Any]) -> SortIndex:
+        """Rows ordered by a sort key (`key` must be the same for a given `sort_by`)."""
+        if ("order", sort_by, descending) not in self._derived:
+            self._derived[("order", sort_by, descending)] = SortIndex(self.models, key, descending)
+        return self._derived[("order", sort_by, descending)]
+
+    def categorical(self, field: str) -> CategoricalColumn:
+        """Dictionary-encoded column of a categorical field."""
+        if field not in CATEGORICAL_FIELDS[self.resource]:
+            raise KeyError(f"Field '{field}' is not a categorical field of {self.resource}")
+        if ("categorical", field) not in self._derived:
+            self._derived[("categorical", field)] = CategoricalColumn(
+                (str(getattr(model, field, "") or "unknown") for model in self.models.values()),
+                split=CATEGORICAL_FIELDS[self.resource][field],
+            )
+        return self._derived[("categorical", field)]
+
+    def value_index(self, field: str) -> dict[str, int]:
+        """Bitmap of the rows holding each (lowercase) value of a categorical field."""
+        if ("values", field) not in self._derived:
+            self._derived[("values", field)] = self.categorical(field).part_index()
+        return self._derived[("values", field)]
+
+    def categories(self, field: str) -> dict[int, list[str]]:
+        """Values of a categorical field per entity, split when the field holds lists."""
+        column = self.categorical(field)
+        return {
+            entity_id: list(column.labels[code])
+            for entity_id, code in zip(self.models, column.codes, strict=True)
+        }
+
+    def match(self, field: str, value: str | None, partial: bool = False) -> int:
+        """
+        Rows whose whole categorical value equals (or with `partial`, contains) `value`.
+
+        Case-insensitive. Every row matches when `value` is empty, like the
+        optional query parameters this serves.
+        """
+        if not value:
+            return self.all_rows()
+        column = self.categorical(field)
+        return column.containing(value.lower()) if partial else column.equal(value.lower())
+
+    def within(self, field: str, low: float | None, high: float | None) -> int:
+        """
+        Rows whose numeric value lies between `low` and `high` (inclusive).
+
+        Unset bounds (None or 0) leave that end open, and every row matches
+        when both are unset, like the `min_*`/`max_*` query parameters this
+        serves. Otherwise rows with an unknown value never match.
+        """
+        if not low and not high:
+            return self.all_rows()
+        return self.bitmap(self.column(field).between(low or None, high or None))
+
+
+class DatasetStore:
+    """
+    In-process snapshot of every SWAPI resource.
+
+    The full dataset is small (a few hundred records), so it is loaded once,
+    parsed once and indexed once. Every reload that changes data bumps
+    `version`, which callers can use as part of their own cache keys, and the
+    per-resource counters in `resource_versions` for the resources that
+    actually changed. Derived values live in `views` and are recomputed only
+    when one of the resources they depend on changes. Routers read the
+    parsed models from the store and never parse raw records themselves.
+    Records are parsed through `model_cache`, so even a full rebuild only
+    parses records whose `edited` changed; incremental refreshes parse only
+    the changed records anyway.
+    """
+
+    def __init__(
+        self,
+        swapi: SWAPIClient,
+        ttl: int = CacheService.TTL_MEDIUM,
+        model_cache: ModelCache | None = None,
+    ):
+        self._swapi = swapi
+        self._ttl = ttl
+        self.model_cache = model_cache or ModelCache(RESOURCE_MODELS)
+        self._tables: dict[str, ResourceTable] = {}
+        self.relations = RelationIndex({})
+        self.search = SearchIndex()
+        self.autocomplete = AutocompleteIndex()
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+        self.version = 0
+        self.resource_versions: dict[str, int] = dict.fromkeys(RESOURCE_MODELS, 0)
+        self.views = MaterializedViews(self.resource_versions, max_entries=1024)
+        self.last_changes: ChangeSet | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Check if a snapshot has been loaded."""
+        return self._loaded_at is not None
+
+    def is_stale(self) -> bool:
+        """Check if the snapshot is missing or older than the TTL."""
+        return self._loaded_at is None or time.time() - self._loaded_at > self._ttl
+
+    async def ensure_loaded(self) -> "DatasetStore":
+        """Load the dataset if it is missing or stale."""
+        if self.is_stale():
+            async with self._lock:
+                if self.is_stale():
+                    await self.refresh()
+        return self
+
+    async def refresh(self, full: bool = False) -> ChangeSet:
+        """
+        Fetch every resource and bring the snapshot up to date.
+
+        The first load (or `full=True`) builds every table and index from
+        scratch. Later refreshes diff the crawl against the snapshot by
+        (id, edited) and only re-parse and re-index the records that were
+        added, edited or removed, so their cost follows the size of the change.
+        """
+        fetched = await asyncio.gather(
+            *(getattr(self._swapi, f"get_all_{resource}")() for resource in RESOURCE_MODELS)
+        )
+        crawl = {
+            resource: {data["id"]: data for data in records if "id" in data}
+            for resource, records in zip(RESOURCE_MODELS, fetched, strict=True)
+        }
+        changes = {
+            resource: self._tables[resource].diff(records)
+            if resource in self._tables
+            else ResourceChanges(added=sorted(records), updated=[], removed=[])
+            for resource, records in crawl.items()
+        }
+
+        full = full or not self._tables
+        if full:
+            self._rebuild(crawl)
+        else:
+            self._apply(crawl, changes)
+
+        self._loaded_at = time.time()
+        changed = [
+            resource for resource, resource_changes in changes.items() if resource_changes.total
+        ]
+        for resource in changed:
+            self.resource_versions[resource] += 1
+        if changed or self.version == 0:
+            self.version += 1
+        # Film membership masks are built at ingest (only for the resources that changed)
+        for resource in RELATED_RESOURCES["films"]:
+            self.membership(resource, "films")
+        self.last_changes = ChangeSet(version=self.version, full=full, resources=changes)
+        logger.info(
+            "Dataset %s refresh, version %d: %s",
+            "full" if full else "incremental",
+            self.version,
+            "; ".join(
+                f"{resource} {counts['added']} added, {counts['updated']} updated, "
+                f"{counts['removed']} removed"
+                for resource, counts in self.last_changes.counts()["resources"].items()
+            )
+            or "no changes",
+        )
+        return self.last_changes
+
+    def _rebuild(self, crawl: Mapping[str, Mapping[int, dict[str, Any]]]) -> None:
+        self._tables = {
+            resource: ResourceTable(resource, records.values(), self.model_cache)
+            for resource, records in crawl.items()
+        }
+        self.relations = RelationIndex.build(
+            {resource: table.models for resource, table in self._tables.items()}
+        )
+        self.search = SearchIndex.build(
+            {resource: table.records.values() for resource, table in self._tables.items()}
+        )
+        self.autocomplete = AutocompleteIndex(
+            self._suggestion(resource, entity_id, model)
+            for resource, table in self._tables.items()
+            for entity_id, model in table.models.items()
+        )
+
+    def _apply(
+        self,
+        crawl: Mapping[str, Mapping[int, dict[str, Any]]],
+        changes: Mapping[str, ResourceChanges],
+    ) -> None:
+        # Entities whose suggestion (name or popularity) may have changed
+        suggest: set[tuple[str, int]] = set()
+
+        for resource, resource_changes in changes.items():
+            if not resource_changes.total:
+                continue
+            table = self._tables[resource]
+            stale = resource_changes.updated + resource_changes.removed
+            old_records = {entity_id: table.records[entity_id] for entity_id in stale}
+            old_models = {entity_id: table.models[entity_id] for entity_id in stale}
+
+            table.apply(crawl[resource], resource_changes)
+            fresh = resource_changes.added + resource_changes.updated
+
+            touched = self.relations.update(
+                resource, old_models, {entity_id: table.models[entity_id] for entity_id in fresh}
+            )
+            for data in old_records.values():
+                self.search.remove(resource, data)
+            for entity_id in fresh:
+                self.search.add(resource, table.records[entity_id])
+            for entity_id in resource_changes.removed:
+                self.autocomplete.remove(resource, entity_id)
+
+            suggest.update((resource, entity_id) for entity_id in fresh)
+            suggest.update(
+                (source, entity_id)
+                for source, target, entity_id in touched
+                if target == _popularity_target(source)
+            )
+
+        for resource, entity_id in suggest:
+            model = self._tables[resource].get(entity_id)
+            if model is not None:
+                self.autocomplete.add(self._suggestion(resource, entity_id, model))
+
+    def _suggestion(self, resource: str, entity_id: int, model: BaseModel) -> Suggestion:
+        return Suggestion(
+            resource, entity_id, display_name(model), self.popularity(resource, entity_id)
+        )
+
+    def table(self, resource: str) -> ResourceTable:
+        """Get the table of a resource."""
+        if resource not in RESOURCE_MODELS:
+            raise KeyError(f"Unknown resource: {resource}")
+        return self._tables[resource]
+
+    def popularity(self, resource: str, entity_id: int) -> int:
+        """Number of films an entity appears in (number of characters for films)."""
+        return self.relations.adjacency(resource, _popularity_target(resource)).degree(entity_id)
+
+    def group_labels(self, resource: str, group_by: str) -> dict[int, list[str]]:
+        """
+        Group labels of every entity of a resource.
+
+        `group_by` is either a categorical field (labels are its values) or a
+        related resource (labels are the names of the related entities, e.g.
+        people grouped by species). Entities without a related one get "none".
+        """
+        table = self.table(resource)
+        if group_by in CATEGORICAL_FIELDS[resource]:
+            return table.categories(group_by)
+        if group_by not in RELATED_RESOURCES[resource]:
+            raise KeyError(f"Cannot group {resource} by '{group_by}'")
+
+        target_table = self.table(group_by)
+        adjacency = self.relations.adjacency(resource, group_by)
+        return {
+            entity_id: [
+                display_name(target_table.models[related_id])
+                for related_id in adjacency.neighbors(entity_id)
+                if related_id in target_table.models
+            ]
+            or ["none"]
+            for entity_id in table.models
+        }
+
+    def membership(self, resource: str, target: str) -> MembershipColumn:
+        """
+        Links of a resource to a related resource as per-row bitmasks.
+
+        Meant for small related resources such as the films. Bits follow the
+        related entities' ID order (episode order for films), and the column
+        is materialized until either resource changes.
+        """
+        if target not in RELATED_RESOURCES[resource]:
+            raise KeyError(f"{resource} are not related to {target}")
+
+        def compute() -> MembershipColumn:
+            models = self.table(target).models
+            domain = sorted(models, key=lambda i: (getattr(models[i], "episode_id", 0), i))
+            return MembershipColumn(
+                self.table(resource).row_ids(), domain, self.relations.adjacency(resource, target)
+            )
+
+        return self.views.get(("membership", resource, target), {resource, target}, compute)
+
+    def related_models(self, resource: str, entity_id: int, target: str) -> list[BaseModel]:
+        """Parsed models of `target` entities linked to an entity, resolved in-process."""
+        target_table = self.table(target)
+        return [
+            target_table.models[related_id]
+            for related_id in self.relations.related_ids(resource, entity_id, target)
+            if related_id in target_table.models
+        ]
+
+    def related_records(self, resource: str, entity_id: int, target: str) -> list[dict[str, Any]]:
+        """Raw records of `target` entities linked to an entity, resolved in-process."""
+        target_table = self.table(target)
+        return [
+            target_table.records[related_id]
+            for related_id in self.relations.related_ids(resource, entity_id, target)
+            if related_id in target_table.records
+        ]
@@ -0,0 +1,202 @@
+"""Nested relation expansion (`?expand=`) resolved with per-request batched lookups."""
+
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel
+
+from src.models.films import FilmSummary
+from src.models.people import PersonSummary
+from src.models.planets import PlanetSummary
+from src.models.species import SpeciesSummary
+from src.models.starships import StarshipSummary
+from src.models.vehicles import VehicleSummary
+from src.services.dataset_store import DatasetStore
+from src.services.relation_index import RELATION_FIELDS
+
+# Deepest nesting of an expansion, e.g. `films.planets`
+MAX_EXPAND_DEPTH = 2
+
+# Representation of expanded entities, as served by the relation endpoints
+RESOURCE_SUMMARIES: dict[str, type[BaseModel]] = {
+    "people": PersonSummary,
+    "films": FilmSummary,
+    "starships": StarshipSummary,
+    "planets": PlanetSummary,
+    "vehicles": VehicleSummary,
+    "species": SpeciesSummary,
+}
+
+
+def _expansion_name(field: str) -> str:
+    """Name of the expansion of a relation field: film_ids -> films, homeworld_id -> homeworld."""
+    name = field.removesuffix("_ids").removesuffix("_id")
+    return name if field.endswith("_id") or name in {"people", "species"} else f"{name}s"
+
+
+# Expandable relations per resource: name -> (related resource, whether it is a list)
+EXPANSIONS: dict[str, dict[str, tuple[str, bool]]] = {
+    resource: {
+        _expansion_name(field): (target, field.endswith("_ids"))
+        for source, field, target in RELATION_FIELDS
+        if source == resource
+    }
+    for resource in RESOURCE_SUMMARIES
+}
+
+EXPAND_DESCRIPTION = (
+    "Comma separated relations to embed, e.g. `homeworld,films,starships`; nest with dots "
+    f"up to {MAX_EXPAND_DEPTH} levels (`films.planets`). Related entities are embedded as "
+    "summaries under the relation name."
+)
+
+# Parsed expansion: (relation name, nested expansion) pairs
+ExpandTree = tuple[tuple[str, "ExpandTree"], ...]
+
+
+class ExpansionError(Exception):
+    """Invalid expansion."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
+
+def _tree(resource: str, paths: list[list[str]], depth: int) -> ExpandTree:
+    if depth > MAX_EXPAND_DEPTH:
+        raise ExpansionError(f"Expansions nest at most {MAX_EXPAND_DEPTH} levels")
+    children: dict[str, list[list[str]]] = {}
+    for name, *rest in paths:
+        if name not in EXPANSIONS[resource]:
+            raise ExpansionError(
+                f"Invalid expansion for {resource}: {name}. "
+                f"Use: {', '.join(sorted(EXPANSIONS[resource]))}"
+            )
+        children.setdefault(name, [])
+        if rest:
+            children[name].append(rest)
+    return tuple(
+        (name, _tree(EXPANSIONS[resource][name][0], rest, depth + 1) if rest else ())
+        for name, rest in children.items()
+    )
+
+
+@lru_cache(maxsize=256)
+def parse_expand(resource: str, expand: str) -> ExpandTree:
+    """Validate a comma separated list of dotted relation paths against the resource (cached)."""
+    paths = [path.strip().split(".") for path in expand.split(",") if path.strip()]
+    if not paths or not all(all(path) for path in paths):
+        raise ExpansionError(
+            f"Invalid expansion for {resource}. Use: {', '.join(sorted(EXPANSIONS[resource]))}"
+        )
+    return _tree(resource, paths, 1)
+
+
+class RelationLoader:
+    """
+    Per-request batched loader of related entities, in the manner of a DataLoader.
+
+    IDs requested with `load` are queued per resource; `dispatch` deduplicates
+    each queue and resolves it with a single table lookup. Results (including
+    misses) are kept for the loader's lifetime, so an entity reached through
+    several paths is only looked up once.
+    """
+
+    def __init__(self, store: DatasetStore):
+        self._store = store
+        self._queued: dict[str, set[int]] = defaultdict(set)
+        self._loaded: dict[str, dict[int, BaseModel | None]] = defaultdict(dict)
+        # (resource, number of IDs) of every lookup made
+        self.batches: list[tuple[str, int]] = []
+
+    def load(self, resource: str, entity_ids: Iterable[int]) -> None:
+        """Queue IDs for the next dispatch."""
+        loaded = self._loaded[resource]
+        self._queued[resource].update(i for i in entity_ids if i not in loaded)
+
+    def dispatch(self) -> None:
+        """Resolve every queued ID, one lookup per resource."""
+        for resource, entity_ids in self._queued.items():
+            if not entity_ids:
+                continue
+            loaded = self._loaded[resource]
+            loaded.update(dict.fromkeys(entity_ids))
+            loaded.update(self._store.table(resource).get_many(entity_ids))
+            self.batches.append((resource, len(entity_ids)))
+        self._queued.clear()
+
+    def get(self, resource: str, entity_id: int) -> BaseModel | None:
+        """A dispatched entity, None if it does not exist."""
+        return self._loaded[resource].get(entity_id)
+
+
+def expand(
+    store: DatasetStore,
+    resource: str,
+    items: Sequence[Any],
+    tree: ExpandTree,
+    loader: RelationLoader | None = None,
+) -> list[Any]:
+    """
+    Embed the related entities of `tree` into items of a resource.
+
+    Items are models or dicts with an `id`; they are returned as dicts with
+    one key per expansion (a summary or None for single relations, a list of
+    summaries otherwise). Expansion proceeds level by level: the IDs needed
+    by every item of a level are collected, then loaded in one batch per
+    resource, and entities repeated within a level share a single summary.
+    """
+    if not tree:
+        return list(items)
+    loader = loader or RelationLoader(store)
+    roots = [item if isinstance(item, dict) else item.model_dump() for item in items]
+
+    level: list[tuple[str, list[dict[str, Any]], ExpandTree]] = [(resource, roots, tree)]
+    while level:
+        links = []
+        for source, outs, subtrees in level:
+            for name, subtree in subtrees:
+                target, many = EXPANSIONS[source][name]
+                for out in outs:
+                    if many:
+                        related_ids = store.relations.related_ids(source, out["id"], target)
+                    else:
+                        # Single relations read their `*_id` field: the relation index
+                        # also links the inverse lists (planet residents), which may disagree
+                        model = store.table(source).get(out["id"])
+                        related_id = None if model is None else getattr(model, f"{name}_id")
+                        related_ids = [] if related_id is None else [related_id]
+                    loader.load(target, related_ids)
+                    links.append((out, name, target, many, related_ids, subtree))
+        loader.dispatch()
+
+        built: dict[tuple[str, ExpandTree], dict[int, dict[str, Any]]] = defaultdict(dict)
+        for out, name, target, many, related_ids, subtree in links:
+            summaries = built[target, subtree]
+            related = []
+            for related_id in related_ids:
+                if related_id not in summaries:
+                    model = loader.get(target, related_id)
+                    if model is None:
+                        continue
+                    summaries[related_id] = (
+                        RESOURCE_SUMMARIES[target].from_model(model).model_dump()
+                    )
+                related.append(summaries[related_id])
+            out[name] = related if many else (related[0] if related else None)
+
+        level = [
+            (target, list(summaries.values()), subtree)
+            for (target, subtree), summaries in built.items()
+            if subtree
+        ]
+    return roots
+
+
+def expand_page(store: DatasetStore, resource: str, page: Any, tree: ExpandTree) -> Any:
+    """Expand the results of a paginated response in place."""
+    if tree:
+        page.results = expand(store, resource, page.results, tree)
+    return page
@@ -0,0 +1,246 @@
+"""Character graph: people linked by the films, starships, vehicles and planets they share."""
+
+from array import array
+from collections import Counter, deque
+from collections.abc import Mapping, Sequence
+
+from pydantic import BaseModel
+
+from src.services.dataset_store import display_name
+from src.services.relation_index import Adjacency
+
+# Resources through which two characters can be connected
+GRAPH_LINKS = ("films", "starships", "vehicles", "planets")
+
+CENTRALITY_METRICS = ("degree", "strength", "closeness", "betweenness")
+
+# Metrics needing a traversal from every node (O(V * E)): computed off the event loop
+EXPENSIVE_METRICS = frozenset({"closeness", "betweenness"})
+
+
+class GraphError(Exception):
+    """Invalid graph query."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
+
+def parse_via(via: Sequence[str]) -> tuple[str, ...]:
+    """Validate the link resources of a query (all of them when none is given)."""
+    selected = [name.strip() for value in via for name in value.split(",") if name.strip()]
+    selected = selected or list(GRAPH_LINKS)
+    invalid = [name for name in selected if name not in GRAPH_LINKS]
+    if invalid:
+        raise GraphError(f"Invalid via: {', '.join(invalid)}. Use: {', '.join(GRAPH_LINKS)}")
+    return tuple(name for name in GRAPH_LINKS if name in selected)
+
+
+class CharacterGraph:
+    """
+    Undirected weighted graph of characters, in compressed sparse row form.
+
+    Two characters are adjacent when they share at least one film, starship,
+    vehicle or homeworld (restricted to the `memberships` given); the weight
+    of the edge is the number of entities they share. Rows are the people
+    sorted by ID: the neighbours of row `r` are `indices[indptr[r]:indptr[r + 1]]`,
+    sorted, with their weights at the same positions in `weights`.
+
+    The graph is immutable once built, so metrics are memoized on it and can
+    be computed from a worker thread.
+    """
+
+    def __init__(
+        self,
+        people: Mapping[int, BaseModel],
+        memberships: Mapping[str, Adjacency],
+        hub_names: Mapping[str, Mapping[int, str]],
+    ):
+        self.via = tuple(memberships)
+        self.ids = sorted(people)
+        self.names = [display_name(people[entity_id]) for entity_id in self.ids]
+        self._rows = {entity_id: row for row, entity_id in enumerate(self.ids)}
+        self._memberships = memberships
+        self._hub_names = hub_names
+        self._metrics: dict[str, list[float]] = {}
+        self._components: list[list[int]] | None = None
+
+        members: dict[tuple[str, int], list[int]] = {}
+        for resource, adjacency in memberships.items():
+            for row, entity_id in enumerate(self.ids):
+                for hub in adjacency.neighbors(entity_id):
+                    members.setdefault((resource, hub), []).append(row)
+
+        weights: Counter[tuple[int, int]] = Counter()
+        for rows in members.values():
+            for i, a in enumerate(rows):
+                for b in rows[i + 1 :]:
+                    weights[a, b] += 1
+
+        adjacent: list[list[tuple[int, int]]] = [[] for _ in self.ids]
+        for (a, b), weight in weights.items():
+            adjacent[a].append((b, weight))
+            adjacent[b].append((a, weight))
+
+        self.indptr = array("I", [0])
+        self.indices = array("I")
+        self.weights = array("I")
+        for edges in adjacent:
+            edges.sort()
+            self.indices.extend(b for b, _ in edges)
+            self.weights.extend(weight for _, weight in edges)
+            self.indptr.append(len(self.indices))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of undirected edges."""
+        return len(self.indices) // 2
+
+    def row(self, entity_id: int) -> int | None:
+        """Row of a character (None if unknown)."""
+        return self._rows.get(entity_id)
+
+    def neighbors(self, row: int) -> array:
+        """Rows adjacent to a row, sorted."""
+        return self.indices[self.indptr[row] : self.indptr[row + 1]]
+
+    def shared(self, a: int, b: int) -> dict[str, list[tuple[int, str]]]:
+        """Entities two characters share, as (ID, name) per link resource."""
+        result = {}
+        for resource, adjacency in self._memberships.items():
+            common = sorted(
+                set(adjacency.neighbors(self.ids[a])) & set(adjacency.neighbors(self.ids[b]))
+            )
+            if common:
+                names = self._hub_names[resource]
+                result[resource] = [(hub, names.get(hub, str(hub))) for hub in common]
+        return result
+
+    def coappearances(self, row: int) -> list[tuple[int, int]]:
+        """Adjacent rows with their weights, heaviest first (ties by ID)."""
+        start, end = self.indptr[row], self.indptr[row + 1]
+        edges = zip(self.indices[start:end], self.weights[start:end], strict=True)
+        return sorted(edges, key=lambda edge: (-edge[1], self.ids[edge[0]]))
+
+    def shortest_path(self, source: int, target: int) -> list[int] | None:
+        """Rows of a shortest path between two rows (fewest hops), None if not connected."""
+        parents = array("i", [-1]) * len(self.ids)
+        parents[source] = source
+        queue = deque([source])
+        while queue and parents[target] < 0:
+            node = queue.popleft()
+            for neighbor in self.neighbors(node):
+                if parents[neighbor] < 0:
+                    parents[neighbor] = node
+                    queue.append(neighbor)
+        if parents[target] < 0:
+            return None
+
+        path = [target]
+        while path[-1] != source:
+            path.append(parents[path[-1]])
+        return path[::-1]
+
+    def components(self) -> list[list[int]]:
+        """Connected components as sorted rows, largest first (ties by lowest ID)."""
+        if self._components is None:
+            labels = array("i", [-1]) * len(self.ids)
+            components = []
+            for start in range(len(self.ids)):
+                if labels[start] >= 0:
+                    continue
+                labels[start] = len(components)
+                component = [start]
+                for node in component:
+                    for neighbor in self.neighbors(node):
+                        if labels[neighbor] < 0:
+                            labels[neighbor] = labels[start]
+                            component.append(neighbor)
+                components.append(sorted(component))
+            components.sort(key=lambda rows: (-len(rows), rows[0]))
+            self._components = components
+        return self._components
+
+    def centrality(self, metric: str) -> list[float]:
+        """
+        Score of every row for a centrality metric.
+
+        - degree: number of distinct characters linked to
+        - strength: sum of the edge weights (shared entities, with repeats)
+        - closeness: Wasserman-Faust closeness, comparable across components
+        - betweenness: share of shortest paths between other characters going
+          through the character (Brandes, normalized to [0, 1])
+        """
+        if metric not in CENTRALITY_METRICS:
+            raise GraphError(f"Invalid metric: {metric}. Use: {', '.join(CENTRALITY_METRICS)}")
+        if metric not in self._metrics:
+            self._metrics[metric] = getattr(self, f"_{metric}")()
+        return self._metrics[metric]
+
+    def _degree(self) -> list[float]:
+        return [float(self.indptr[row + 1] - self.indptr[row]) for row in range(len(self.ids))]
+
+    def _strength(self) -> list[float]:
+        return [
+            float(sum(self.weights[self.indptr[row] : self.indptr[row + 1]]))
+            for row in range(len(self.ids))
+        ]
+
+    def _distances(self, source: int) -> array:
+        distances = array("i", [-1]) * len(self.ids)
+        distances[source] = 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for neighbor in self.neighbors(node):
+                if distances[neighbor] < 0:
+                    distances[neighbor] = distances[node] + 1
+                    queue.append(neighbor)
+        return distances
+
+    def _closeness(self) -> list[float]:
+        n = len(self.ids)
+        scores = []
+        for row in range(n):
+            reached = [d for d in self._distances(row) if d > 0]
+            total = sum(reached)
+            scores.append(len(reached) ** 2 / ((n - 1) * total) if total else 0.0)
+        return scores
+
+    def _betweenness(self) -> list[float]:
+        n = len(self.ids)
+        scores = [0.0] * n
+        for source in range(n):
+            order = []
+            predecessors: list[list[int]] = [[] for _ in range(n)]
+            paths = [0] * n
+            paths[source] = 1
+            distances = array("i", [-1]) * n
+            distances[source] = 0
+            queue = deque([source])
+            while queue:
+                node = queue.popleft()
+                order.append(node)
+                for neighbor in self.neighbors(node):
+                    if distances[neighbor] < 0:
+                        distances[neighbor] = distances[node] + 1
+                        queue.append(neighbor)
+                    if distances[neighbor] == distances[node] + 1:
+                        paths[neighbor] += paths[node]
+                        predecessors[neighbor].append(node)
+
+            dependency = [0.0] * n
+            for node in reversed(order):
+                for predecessor in predecessors[node]:
+                    dependency[predecessor] += (
+                        paths[predecessor] / paths[node] * (1 + dependency[node])
+                    )
+                if node != source:
+                    scores[node] += dependency[node]
+
+        # Each pair was counted from both ends
+        scale = 1 / ((n - 1) * (n - 2)) if n > 2 else 0.0
+        return [score * scale for score in scores]
@@ -0,0 +1,68 @@
+"""Materialized views: derived values recomputed only when their inputs change."""
+
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from functools import wraps
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from src.services.dataset_store import DatasetStore
+
+T = TypeVar("T")
+
+
+class MaterializedViews:
+    """
+    Cache of derived values keyed by the versions of the resources they read.
+
+    Each view declares its dependency set (e.g. planets only). A cached value
+    is served as long as none of those resources changed version; otherwise it
+    is recomputed once and stored again. With `max_entries`, the least
+    recently used views are dropped once the cache is full (for views keyed
+    by client queries).
+    """
+
+    def __init__(self, versions: Mapping[str, int], max_entries: int | None = None):
+        self._versions = versions
+        self._max_entries = max_entries
+        self._entries: dict[Hashable, tuple[tuple[int, ...], Any]] = {}
+        self.computations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, dependencies: Iterable[str], compute: Callable[[], T]) -> T:
+        """Get a view, recomputing it if one of its dependencies changed."""
+        stamp = tuple(self._versions.get(resource, 0) for resource in sorted(dependencies))
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry[0] == stamp:
+            self._entries[key] = entry
+            return entry[1]
+
+        value = compute()
+        self.computations += 1
+        self._entries[key] = (stamp, value)
+        if self._max_entries is not None and len(self._entries) > self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        return value
+
+    def clear(self) -> None:
+        """Drop every materialized value."""
+        self._entries.clear()
+
+
+def materialized(
+    *dependencies: str,
+) -> Callable[[Callable[["DatasetStore"], T]], Callable[["DatasetStore"], T]]:
+    """Decorate a `compute(store)` function so its result is materialized in the store."""
+
+    def decorator(compute: Callable[["DatasetStore"], T]) -> Callable[["DatasetStore"], T]:
+        key = f"{compute.__module__}.{compute.__qualname__}"
+
+        @wraps(compute)
+        def wrapper(store: "DatasetStore") -> T:
+            return store.views.get(key, dependencies, lambda: compute(store))
+
+        wrapper.dependencies = frozenset(dependencies)  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
@@ -0,0 +1,60 @@
+"""Memoized parsing of raw SWAPI records into models."""
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class ModelCache:
+    """
+    Parsed models keyed by (resource, id, edited).
+
+    SWAPI bumps `edited` whenever a record changes, so a record with the same
+    (resource, id, edited) always parses to the same model. Only the latest
+    version of each record is kept: parsing a newer `edited` replaces the old
+    model, and `discard` drops records that no longer exist, so the cache never
+    grows past the dataset. Records without `edited` are parsed every time.
+
+    Models are shared by every caller and must be treated as immutable
+    (use `model_copy(update=...)` to derive a changed one).
+    """
+
+    def __init__(self, models: Mapping[str, type[BaseModel]]):
+        self._models = models
+        self._entries: dict[tuple[str, int], tuple[str, BaseModel]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def parse(self, resource: str, data: dict[str, Any]) -> BaseModel:
+        """Get the model of a raw record (with its `id`), parsing it only once per version."""
+        key = (resource, data["id"])
+        edited = data.get("edited")
+        entry = self._entries.get(key)
+        if entry is not None and edited is not None and entry[0] == edited:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        model = self._models[resource].from_swapi(data, data["id"])  # type: ignore[attr-defined]
+        if edited is not None:
+            if entry is not None:
+                self.evictions += 1
+            self._entries[key] = (edited, model)
+        elif entry is not None:
+            del self._entries[key]
+        return model
+
+    def discard(self, resource: str, entity_ids: Iterable[int]) -> None:
+        """Drop the models of records that were removed."""
+        for entity_id in entity_ids:
+            if self._entries.pop((resource, entity_id), None) is not None:
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every parsed model."""
+        self._entries.clear()
@@ -0,0 +1,60 @@
+"""Sparse fieldsets: project stored models onto the fields a client asked for."""
+
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from src.services.dataset_store import RESOURCE_MODELS
+from src.services.expansion import ExpandTree
+
+FIELDS_DESCRIPTION = (
+    "Comma separated fields to return (sparse fieldset), e.g. `name,height`. "
+    "Any field of the detail model can be selected; `id` is always included."
+)
+
+
+class ProjectionError(Exception):
+    """Invalid sparse fieldset."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
+
+@lru_cache(maxsize=256)
+def parse_fields(resource: str, fields: str) -> tuple[str, ...]:
+    """
+    Validate a comma separated fieldset against the resource model (cached).
+
+    Returns the selected fields plus `id`, in model field order.
+    """
+    model_fields = RESOURCE_MODELS[resource].model_fields
+    selected = {field.strip() for field in fields.split(",") if field.strip()}
+    invalid = sorted(selected - model_fields.keys())
+    if invalid or not selected:
+        raise ProjectionError(
+            f"Invalid fields for {resource}: {', '.join(invalid) or 'none selected'}. "
+            f"Use: {', '.join(model_fields)}"
+        )
+    selected.add("id")
+    return tuple(field for field in model_fields if field in selected)
+
+
+def project(model: BaseModel, fields: tuple[str, ...]) -> dict[str, Any]:
+    """The selected attributes of a stored model; other fields are never read."""
+    return {field: getattr(model, field) for field in fields}
+
+
+def respond(content: Any, projection: tuple[str, ...] | None, expansion: ExpandTree = ()) -> Any:
+    """
+    Return content as is, or serialized directly when it holds projections or expansions.
+
+    Returning a response object skips the endpoint's response model, which
+    would otherwise reject (or re-validate) the partial or expanded objects.
+    """
+    if projection is None and not expansion:
+        return content
+    return Response(to_json(content), media_type="application/json")
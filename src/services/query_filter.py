@@ -0,0 +1,497 @@
+"""
+Filter expression language compiled to index-aware query plans.
+
+Grammar (keywords are case-insensitive):
+
+    expression := term (OR term)*
+    term       := factor (AND factor)*
+    factor     := NOT factor | "(" expression ")" | predicate
+    predicate  := field ("=" | "!=" | "<" | "<=" | ">" | ">=") value
+                | field IN "(" value ("," value)* ")"
+                | field BETWEEN value AND value
+                | field CONTAINS value
+    value      := number | 'quoted' | "quoted" | bare word
+
+Examples:
+
+    gender = male AND height > 180
+    climate CONTAINS temperate OR population BETWEEN 1000000 AND 5000000
+    NOT eye_color IN (blue, yellow)
+
+Expressions are compiled once per (resource, expression) and executed on row
+bitmaps of a ResourceTable: predicates on numeric and categorical fields use
+the sorted columns and the dictionary-encoded categorical columns (matched on
+their vocabulary, never per row), AND intersects the most selective
+indexes first, and the remaining predicates only scan the surviving rows.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from datetime import UTC, date, datetime
+from functools import cache, lru_cache
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from src.services.dataset_store import (
+    CATEGORICAL_FIELDS,
+    NUMERIC_FIELDS,
+    RESOURCE_MODELS,
+    ResourceTable,
+)
+
+FILTER_DESCRIPTION = (
+    "Filter expression, e.g. `gender = male AND height > 180`. Supports =, !=, <, <=, >, >=, "
+    "IN (a, b), BETWEEN a AND b, CONTAINS, AND, OR, NOT and parentheses."
+)
+
+FACETS_DESCRIPTION = (
+    "Comma separated categorical fields (e.g. `gender,eye_color`) to count per value "
+    "over all matching items"
+)
+
+_KEYWORDS = {"AND", "OR", "NOT", "IN", "BETWEEN", "CONTAINS"}
+_COMPARISONS = {"=", "!=", "<", "<=", ">", ">="}
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<symbol><=|>=|!=|=|<|>|\(|\)|,)
+      | '(?P<single>[^']*)'
+      | "(?P<double>[^"]*)"
+      | (?P<word>[^\s()=!<>,'"]+)
+    )""",
+    re.VERBOSE,
+)
+
+
+class FilterError(Exception):
+    """Invalid filter expression."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
+
+def _field_kind(annotation: Any) -> str | None:
+    """Kind of a model field: number, string, date, datetime or list."""
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        annotation = args[0] if len(args) == 1 else None
+    if annotation in (int, float):
+        return "number"
+    if annotation is str:
+        return "string"
+    if annotation is datetime:
+        return "datetime"
+    if annotation is date:
+        return "date"
+    if get_origin(annotation) is list:
+        return "list"
+    return None
+
+
+@cache
+def filterable_fields(resource: str) -> dict[str, str]:
+    """Model fields of a resource usable in filters, with their kind."""
+    fields = {}
+    for name, info in RESOURCE_MODELS[resource].model_fields.items():
+        kind = _field_kind(info.annotation)
+        if kind is not None:
+            fields[name] = kind
+    return fields
+
+
+class Node(ABC):
+    """A node of a compiled filter plan."""
+
+    # Whether the node is answered from indexes alone (no row scan)
+    indexed = False
+    # Number of scanning predicates below the node, to order cheap work first
+    cost = 0
+
+    def bitmap(self, table: ResourceTable) -> int:
+        """Rows matching the node, for indexed nodes."""
+        return self.evaluate(table, table.all_rows())
+
+    @abstractmethod
+    def evaluate(self, table: ResourceTable, candidates: int) -> int:
+        """Subset of the candidate rows matching the node."""
+
+
+class Predicate(Node):
+    """A comparison on one field."""
+
+    def __init__(self, resource: str, field: str, op: str, values: list[Any]):
+        self.field = field
+        self.op = op
+        self.values = values
+        self.numeric_index = field in NUMERIC_FIELDS[resource]
+        self.categorical_index = field in CATEGORICAL_FIELDS[resource]
+        self.split = CATEGORICAL_FIELDS[resource].get(field, False)
+        if self.numeric_index:
+            self.indexed = op != "contains"
+        elif self.categorical_index:
+            self.indexed = op in ("=", "!=", "in", "contains")
+        self.cost = 0 if self.indexed else 1
+
+    def __repr__(self) -> str:
+        return f"Predicate({self.field} {self.op} {self.values})"
+
+    def bitmap(self, table: ResourceTable) -> int:
+        if self.numeric_index:
+            return self._numeric_bitmap(table)
+        if self.op == "contains":
+            return table.categorical(self.field).containing(self.values[0])
+        index = table.value_index(self.field)
+        matched = 0
+        for value in self.values:
+            matched |= index.get(value, 0)
+        return table.all_rows() & ~matched if self.op == "!=" else matched
+
+    def _numeric_bitmap(self, table: ResourceTable) -> int:
+        column = table.column(self.field)
+        op, values = self.op, self.values
+        if op in ("=", "!=", "in"):
+            matched = 0
+            for value in values:
+                matched |= table.bitmap(column.between(value, value))
+            return table.bitmap(column.ids) & ~matched if op == "!=" else matched
+        if op == "between":
+            return table.bitmap(column.between(values[0], values[1]))
+        if op in ("<", "<="):
+            return table.bitmap(column.between(None, values[0], include_high=op == "<="))
+        return table.bitmap(column.between(values[0], None, include_low=op == ">="))
+
+    def evaluate(self, table: ResourceTable, candidates: int) -> int:
+        if self.indexed:
+            return self.bitmap(table) & candidates
+
+        row_ids = table.row_ids()
+        matched = 0
+        remaining = candidates
+        while remaining:
+            lowest = remaining & -remaining
+            remaining ^= lowest
+            if self.matches(table.models[row_ids[lowest.bit_length() - 1]]):
+                matched |= lowest
+        return matched
+
+    def matches(self, model: BaseModel) -> bool:
+        """Check the predicate against one model (unknown values never match)."""
+        value = getattr(model, self.field, None)
+        if value is None:
+            return False
+        if isinstance(value, str):
+            value = value.lower()
+
+        op = self.op
+        if op == "contains":
+            return self.values[0] in value
+        if op == "between":
+            return self.values[0] <= value <= self.values[1]
+        if op in ("=", "!=", "in"):
+            if isinstance(value, list):
+                found = any(v in value for v in self.values)
+            elif self.split:
+                parts = {part.strip() for part in value.split(",")}
+                found = any(v in parts for v in self.values)
+            else:
+                found = value in self.values
+            return found != (op == "!=")
+        target = self.values[0]
+        if op == "<":
+            return value < target
+        if op == "<=":
+            return value <= target
+        if op == ">":
+            return value > target
+        return value >= target
+
+
+class And(Node):
+    """Conjunction: intersects indexed children by ascending selectivity, then scans."""
+
+    def __init__(self, children: list[Node]):
+        self.children = children
+        self.indexed = all(child.indexed for child in children)
+        self.cost = sum(child.cost for child in children)
+
+    def __repr__(self) -> str:
+        return f"And({self.children})"
+
+    def evaluate(self, table: ResourceTable, candidates: int) -> int:
+        bitmaps = sorted(
+            (child.bitmap(table) for child in self.children if child.indexed), key=int.bit_count
+        )
+        for bitmap in bitmaps:
+            candidates &= bitmap
+            if not candidates:
+                return 0
+        scans = sorted((child for child in self.children if not child.indexed), key=_cost)
+        for child in scans:
+            candidates = child.evaluate(table, candidates)
+            if not candidates:
+                return 0
+        return candidates
+
+
+class Or(Node):
+    """Disjunction: cheap children first, later ones only see rows not matched yet."""
+
+    def __init__(self, children: list[Node]):
+        self.children = sorted(children, key=_cost)
+        self.indexed = all(child.indexed for child in children)
+        self.cost = sum(child.cost for child in children)
+
+    def __repr__(self) -> str:
+        return f"Or({self.children})"
+
+    def evaluate(self, table: ResourceTable, candidates: int) -> int:
+        matched = 0
+        for child in self.children:
+            remaining = candidates & ~matched
+            if not remaining:
+                break
+            matched |= child.evaluate(table, remaining)
+        return matched
+
+
+class Not(Node):
+    """Negation within the candidate rows."""
+
+    def __init__(self, child: Node):
+        self.child = child
+        self.indexed = child.indexed
+        self.cost = child.cost
+
+    def __repr__(self) -> str:
+        return f"Not({self.child})"
+
+    def evaluate(self, table: ResourceTable, candidates: int) -> int:
+        return candidates & ~self.child.evaluate(table, candidates)
+
+
+def _cost(node: Node) -> int:
+    return node.cost
+
+
+class FilterPlan:
+    """A compiled filter expression for one resource."""
+
+    def __init__(self, resource: str, expression: str, root: Node):
+        self.resource = resource
+        self.expression = expression
+        self.root = root
+
+    def __repr__(self) -> str:
+        return f"FilterPlan({self.resource!r}, {self.root})"
+
+    def execute(self, table: ResourceTable, candidates: int | None = None) -> int:
+        """Bitmap of the rows of a table (or of the candidate rows) matching the expression."""
+        return self.root.evaluate(table, table.all_rows() if candidates is None else candidates)
+
+    def select(self, table: ResourceTable, candidates: int | None = None) -> list[BaseModel]:
+        """Models matching the expression, in row order."""
+        return table.models_of(self.execute(table, candidates))
+
+
+class _Parser:
+    """Recursive descent parser producing plan nodes."""
+
+    def __init__(self, resource: str, expression: str):
+        self.resource = resource
+        self.fields = filterable_fields(resource)
+        self.tokens = self._tokenize(expression)
+        self.pos = 0
+
+    @staticmethod
+    def _tokenize(expression: str) -> list[tuple[str, str]]:
+        tokens = []
+        pos = 0
+        expression = expression.rstrip()
+        while pos < len(expression):
+            match = _TOKEN_RE.match(expression, pos)
+            if match is None:
+                raise FilterError(f"Unexpected character at position {pos}: {expression[pos:]!r}")
+            if match.group("symbol") is not None:
+                tokens.append(("symbol", match.group("symbol")))
+            elif match.group("word") is not None:
+                word = match.group("word")
+                kind = "keyword" if word.upper() in _KEYWORDS else "word"
+                tokens.append((kind, word.upper() if kind == "keyword" else word))
+            else:
+                quoted = match.group("single")
+                tokens.append(("string", quoted if quoted is not None else match.group("double")))
+            pos = match.end()
+        return tokens
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _next(self, expected: str) -> tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise FilterError(f"Unexpected end of expression, expected {expected}")
+        self.pos += 1
+        return token
+
+    def _accept(self, kind: str, value: str) -> bool:
+        if self._peek() == (kind, value):
+            self.pos += 1
+            return True
+        return False
+
+    def _expect(self, kind: str, value: str) -> None:
+        token = self._next(repr(value))
+        if token != (kind, value):
+            raise FilterError(f"Expected {value!r}, got {token[1]!r}")
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise FilterError("Empty filter expression")
+        node = self._expression()
+        if self._peek() is not None:
+            raise FilterError(f"Unexpected {self._peek()[1]!r}")  # type: ignore[index]
+        return node
+
+    def _expression(self) -> Node:
+        children = [self._term()]
+        while self._accept("keyword", "OR"):
+            children.append(self._term())
+        return children[0] if len(children) == 1 else Or(children)
+
+    def _term(self) -> Node:
+        children = [self._factor()]
+        while self._accept("keyword", "AND"):
+            children.append(self._factor())
+        return children[0] if len(children) == 1 else And(children)
+
+    def _factor(self) -> Node:
+        if self._accept("keyword", "NOT"):
+            return Not(self._factor())
+        if self._accept("symbol", "("):
+            node = self._expression()
+            self._expect("symbol", ")")
+            return node
+        return self._predicate()
+
+    def _predicate(self) -> Node:
+        kind, field = self._next("a field name")
+        if kind != "word":
+            raise FilterError(f"Expected a field name, got {field!r}")
+        if field not in self.fields:
+            raise FilterError(
+                f"Unknown field '{field}' for {self.resource}. "
+                f"Use: {', '.join(sorted(self.fields))}"
+            )
+        field_kind = self.fields[field]
+
+        kind, op = self._next("an operator")
+        if kind == "symbol" and op in _COMPARISONS:
+            if op not in ("=", "!=") and field_kind not in ("number", "date", "datetime"):
+                raise FilterError(f"Operator {op} is not supported on '{field}'")
+            values = [self._value(field, field_kind)]
+        elif (kind, op) == ("keyword", "IN"):
+            self._expect("symbol", "(")
+            values = [self._value(field, field_kind)]
+            while self._accept("symbol", ","):
+                values.append(self._value(field, field_kind))
+            self._expect("symbol", ")")
+            op = "in"
+        elif (kind, op) == ("keyword", "BETWEEN"):
+            if field_kind not in ("number", "date", "datetime"):
+                raise FilterError(f"BETWEEN is not supported on '{field}'")
+            values = [self._value(field, field_kind)]
+            self._expect("keyword", "AND")
+            values.append(self._value(field, field_kind))
+            op = "between"
+        elif (kind, op) == ("keyword", "CONTAINS"):
+            if field_kind not in ("string", "list"):
+                raise FilterError(f"CONTAINS is not supported on '{field}'")
+            values = [self._value(field, field_kind)]
+            op = "contains"
+        else:
+            raise FilterError(f"Expected an operator after '{field}', got {op!r}")
+
+        if field_kind == "list" and op not in ("contains", "in"):
+            raise FilterError(f"Use CONTAINS or IN on '{field}'")
+        return Predicate(self.resource, field, op, values)
+
+    def _value(self, field: str, field_kind: str) -> Any:
+        kind, raw = self._next("a value")
+        if kind not in ("word", "string"):
+            raise FilterError(f"Expected a value for '{field}', got {raw!r}")
+        try:
+            if field_kind == "number":
+                return float(raw.replace(",", ""))
+            if field_kind == "list":
+                return int(raw)
+            if field_kind == "date":
+                return date.fromisoformat(raw)
+            if field_kind == "datetime":
+                value = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+                return value if value.tzinfo else value.replace(tzinfo=UTC)
+        except ValueError:
+            raise FilterError(f"Invalid value for '{field}': {raw!r}")
+        return raw.lower()
+
+
+@lru_cache(maxsize=512)
+def compile_filter(resource: str, expression: str) -> FilterPlan:
+    """Parse and compile a filter expression (cached per resource and expression)."""
+    if resource not in RESOURCE_MODELS:
+        raise FilterError(f"Unknown resource: {resource}")
+    return FilterPlan(resource, expression, _Parser(resource, expression).parse())
+
+
+def select_rows(table: ResourceTable, expression: str | None, candidates: int | None = None) -> int:
+    """
+    Bitmap of the rows of a table matching a filter expression (all of them when None).
+
+    `candidates` restricts the result to a bitmap of rows, e.g. the rows
+    matched by the query parameters of a list endpoint.
+    """
+    if not expression:
+        return table.all_rows() if candidates is None else candidates
+    return compile_filter(table.resource, expression).execute(table, candidates)
+
+
+def select(
+    table: ResourceTable, expression: str | None, candidates: int | None = None
+) -> list[BaseModel]:
+    """Models of a table matching a filter expression, in row order (see `select_rows`)."""
+    return table.models_of(select_rows(table, expression, candidates))
+
+
+def count_facets(
+    table: ResourceTable, rows: int, facets: str | None
+) -> dict[str, dict[str, int]] | None:
+    """
+    Per-value counts of categorical fields over some rows of a table.
+
+    `facets` is a comma separated list of categorical fields. Counts come from
+    intersecting the bitmap of the rows (as computed by `select_rows`) with
+    the value index of each field; values are lowercase and ordered by
+    descending count. None when no facet is requested.
+    """
+    if not facets:
+        return None
+    fields = list(dict.fromkeys(f.strip() for f in facets.split(",") if f.strip()))
+    categorical = CATEGORICAL_FIELDS[table.resource]
+    invalid = [field for field in fields if field not in categorical]
+    if invalid:
+        raise FilterError(
+            f"Invalid facet '{invalid[0]}' for {table.resource}. Use: {', '.join(categorical)}"
+        )
+
+    result = {}
+    for field in fields:
+        counts = {
+            value: (rows & bitmap).bit_count() for value, bitmap in table.value_index(field).items()
+        }
+        result[field] = {
+            value: count
+            for value, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+            if count
+        }
+    return result
@@ -0,0 +1,194 @@
+"""Bidirectional relationship index between SWAPI resources."""
+
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator, Mapping
+
+from pydantic import BaseModel
+
+# (source resource, model attribute, target resource). Each link is indexed in
+# both directions, so e.g. people.film_ids and films.character_ids end up merged.
+RELATION_FIELDS: tuple[tuple[str, str, str], ...] = (
+    ("people", "film_ids", "films"),
+    ("people", "species_ids", "species"),
+    ("people", "vehicle_ids", "vehicles"),
+    ("people", "starship_ids", "starships"),
+    ("people", "homeworld_id", "planets"),
+    ("films", "character_ids", "people"),
+    ("films", "planet_ids", "planets"),
+    ("films", "starship_ids", "starships"),
+    ("films", "vehicle_ids", "vehicles"),
+    ("films", "species_ids", "species"),
+    ("planets", "resident_ids", "people"),
+    ("planets", "film_ids", "films"),
+    ("starships", "pilot_ids", "people"),
+    ("starships", "film_ids", "films"),
+    ("vehicles", "pilot_ids", "people"),
+    ("vehicles", "film_ids", "films"),
+    ("species", "people_ids", "people"),
+    ("species", "film_ids", "films"),
+    ("species", "homeworld_id", "planets"),
+)
+
+
+class Adjacency:
+    """
+    Compressed sparse row adjacency from source IDs to sorted target IDs.
+
+    Targets of every source are stored back to back in a single int array;
+    `_rows` maps a source ID to its (start, end) slice. Replacing a row appends
+    it at the end and leaves the old slice as garbage, which is compacted once
+    it outweighs the live targets.
+    """
+
+    def __init__(self, edges: Iterable[tuple[int, int]]):
+        grouped: dict[int, set[int]] = defaultdict(set)
+        for source, target in edges:
+            grouped[source].add(target)
+
+        self.targets = array("i")
+        self._rows: dict[int, tuple[int, int]] = {}
+        self._garbage = 0
+        for source in sorted(grouped):
+            start = len(self.targets)
+            self.targets.extend(sorted(grouped[source]))
+            self._rows[source] = (start, len(self.targets))
+
+    def __len__(self) -> int:
+        return len(self.targets) - self._garbage
+
+    def sources(self) -> list[int]:
+        """IDs that have at least one link."""
+        return list(self._rows)
+
+    def neighbors(self, source: int) -> array:
+        """Target IDs linked to a source (empty if none)."""
+        start, end = self._rows.get(source, (0, 0))
+        return self.targets[start:end]
+
+    def degree(self, source: int) -> int:
+        """Number of targets linked to a source."""
+        start, end = self._rows.get(source, (0, 0))
+        return end - start
+
+    def set_row(self, source: int, targets: Iterable[int]) -> None:
+        """Replace the targets linked to a source."""
+        start, end = self._rows.pop(source, (0, 0))
+        self._garbage += end - start
+        targets = sorted(set(targets))
+        if targets:
+            start = len(self.targets)
+            self.targets.extend(targets)
+            self._rows[source] = (start, len(self.targets))
+        if self._garbage > len(self):
+            self._compact()
+
+    def _compact(self) -> None:
+        targets = array("i")
+        rows: dict[int, tuple[int, int]] = {}
+        for source in sorted(self._rows):
+            start, end = self._rows[source]
+            rows[source] = (len(targets), len(targets) + end - start)
+            targets.extend(self.targets[start:end])
+        self.targets = targets
+        self._rows = rows
+        self._garbage = 0
+
+
+def _links(
+    resource: str, entity_id: int, model: BaseModel
+) -> Iterator[tuple[tuple[str, str], int, int]]:
+    """Links declared by a model as (pair, source ID, target ID), in both directions."""
+    for source_resource, field, target_resource in RELATION_FIELDS:
+        if source_resource != resource:
+            continue
+        value = getattr(model, field, None)
+        if value is None:
+            continue
+        for target_id in value if isinstance(value, list) else [value]:
+            yield (resource, target_resource), entity_id, target_id
+            yield (target_resource, resource), target_id, entity_id
+
+
+class RelationIndex:
+    """
+    Adjacency lists for every (resource, related resource) pair.
+
+    A link may be declared by either side (people.film_ids and
+    films.character_ids), so every link keeps a count of the models declaring
+    it. Updating a few models only rewrites the rows whose link set changed.
+    """
+
+    def __init__(
+        self,
+        adjacency: dict[tuple[str, str], Adjacency],
+        links: dict[tuple[str, str], dict[int, Counter[int]]] | None = None,
+    ):
+        self._adjacency = adjacency
+        self._links = links if links is not None else {}
+
+    @classmethod
+    def build(cls, models: Mapping[str, Mapping[int, BaseModel]]) -> "RelationIndex":
+        """Build the index from parsed models keyed by resource and ID."""
+        links: dict[tuple[str, str], dict[int, Counter[int]]] = defaultdict(
+            lambda: defaultdict(Counter)
+        )
+        for resource, resource_models in models.items():
+            for entity_id, model in resource_models.items():
+                for pair, source, target in _links(resource, entity_id, model):
+                    links[pair][source][target] += 1
+
+        adjacency = {
+            pair: Adjacency(
+                (source, target) for source, counts in rows.items() for target in counts
+            )
+            for pair, rows in links.items()
+        }
+        return cls(adjacency, {pair: dict(rows) for pair, rows in links.items()})
+
+    def update(
+        self,
+        resource: str,
+        old: Mapping[int, BaseModel],
+        new: Mapping[int, BaseModel],
+    ) -> set[tuple[str, str, int]]:
+        """
+        Replace the links declared by some models of a resource.
+
+        `old` holds the previous version of updated/removed models and `new`
+        the current version of added/updated ones. Returns the rows whose
+        targets changed, as (resource, target resource, source ID).
+        """
+        delta: Counter[tuple[tuple[str, str], int, int]] = Counter()
+        for entity_id, model in old.items():
+            for link in _links(resource, entity_id, model):
+                delta[link] -= 1
+        for entity_id, model in new.items():
+            for link in _links(resource, entity_id, model):
+                delta[link] += 1
+
+        touched: set[tuple[tuple[str, str], int]] = set()
+        for (pair, source, target), change in delta.items():
+            if not change:
+                continue
+            counts = self._links.setdefault(pair, {}).setdefault(source, Counter())
+            linked = counts[target] > 0
+            counts[target] += change
+            if counts[target] <= 0:
+                del counts[target]
+            if linked != (target in counts):
+                touched.add((pair, source))
+
+        for pair, source in touched:
+            self._adjacency.setdefault(pair, Adjacency(())).set_row(
+                source, self._links[pair][source]
+            )
+        return {(pair[0], pair[1], source) for pair, source in touched}
+
+    def adjacency(self, resource: str, target: str) -> Adjacency:
+        """Adjacency from a resource to a related resource."""
+        return self._adjacency.get((resource, target)) or Adjacency(())
+
+    def related_ids(self, resource: str, entity_id: int, target: str) -> list[int]:
+        """IDs of `target` entities linked to an entity."""
+        return self.adjacency(resource, target).neighbors(entity_id).tolist()
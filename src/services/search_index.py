@@ -0,0 +1,190 @@
+"""In-process full-text search index with typo tolerance over SWAPI records."""
+
+import re
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Mapping
+from typing import Any, NamedTuple
+
+# Searchable raw SWAPI fields per resource and their weight in the ranking
+SEARCH_FIELDS: dict[str, tuple[tuple[str, float], ...]] = {
+    "people": (("name", 3.0),),
+    "films": (("title", 3.0), ("director", 1.0)),
+    "starships": (("name", 3.0), ("model", 2.0), ("starship_class", 1.0)),
+    "vehicles": (("name", 3.0), ("model", 2.0), ("vehicle_class", 1.0)),
+    "species": (("name", 3.0), ("classification", 1.0)),
+    "planets": (("name", 3.0),),
+}
+
+# Similarity of a query token to an indexed token, by kind of match
+EXACT_MATCH = 1.0
+PREFIX_MATCH = 0.9
+INFIX_MATCH = 0.7
+FUZZY_MATCH = 0.6
+
+# Minimum trigram similarity (Dice coefficient) for a fuzzy match
+FUZZY_THRESHOLD = 0.45
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class SearchHit(NamedTuple):
+    """A ranked search result."""
+
+    resource: str
+    id: int
+    name: str
+    score: float
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def trigrams(token: str, padded: bool = True) -> set[str]:
+    """Character trigrams of a token (padded like pg_trgm by default)."""
+    text = f"  {token} " if padded else token
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """
+    Inverted index of tokens plus a trigram index over the token vocabulary.
+
+    Query tokens are matched against the vocabulary as exact, prefix, infix
+    (substring) or fuzzy (trigram similarity) matches, so misspelled queries
+    such as "skywaker" still find "Skywalker".
+    """
+
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[tuple[str, int], float]] = defaultdict(dict)
+        self._trigrams: dict[str, set[str]] = defaultdict(set)
+        self._names: dict[tuple[str, int], str] = {}
+        self._vocabulary: list[str] = []
+
+    @classmethod
+    def build(cls, records: Mapping[str, Iterable[dict[str, Any]]]) -> "SearchIndex":
+        """Build the index from raw records keyed by resource."""
+        index = cls()
+        for resource, resource_records in records.items():
+            for data in resource_records:
+                if "id" in data:
+                    index._add(resource, data)
+        index._vocabulary = sorted(index._postings)
+        return index
+
+    def _add(self, resource: str, data: dict[str, Any]) -> list[str]:
+        """Index a record and return the tokens it added to the vocabulary."""
+        key = (resource, data["id"])
+        self._names[key] = data.get("name") or data.get("title") or ""
+        new_tokens = []
+        for field, weight in SEARCH_FIELDS.get(resource, ()):
+            for token in tokenize(str(data.get(field) or "")):
+                postings = self._postings[token]
+                postings[key] = max(postings.get(key, 0.0), weight)
+                if len(postings) == 1 and token not in new_tokens:
+                    new_tokens.append(token)
+                    for gram in trigrams(token):
+                        self._trigrams[gram].add(token)
+        return new_tokens
+
+    def add(self, resource: str, data: dict[str, Any]) -> None:
+        """Index one more record (or re-index it after `remove`)."""
+        for token in self._add(resource, data):
+            insort(self._vocabulary, token)
+
+    def remove(self, resource: str, data: dict[str, Any]) -> None:
+        """Remove a record, dropping tokens no other record uses."""
+        key = (resource, data["id"])
+        if self._names.pop(key, None) is None:
+            return
+        for field, _ in SEARCH_FIELDS.get(resource, ()):
+            for token in tokenize(str(data.get(field) or "")):
+                postings = self._postings.get(token)
+                if postings is None or postings.pop(key, None) is None or postings:
+                    continue
+                del self._postings[token]
+                for gram in trigrams(token):
+                    self._trigrams[gram].discard(token)
+                del self._vocabulary[bisect_left(self._vocabulary, token)]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _matches(self, query_token: str) -> dict[str, float]:
+        """Vocabulary tokens similar to a query token, with their similarity."""
+        matches: dict[str, float] = {}
+
+        if query_token in self._postings:
+            matches[query_token] = EXACT_MATCH
+
+        # Prefix matches are contiguous in the sorted vocabulary
+        start = bisect_left(self._vocabulary, query_token)
+        for token in self._vocabulary[start:]:
+            if not token.startswith(query_token):
+                break
+            matches.setdefault(token, PREFIX_MATCH)
+
+        if len(query_token) < 3:
+            # Too short for trigrams: scan the vocabulary for infix matches
+            for token in self._vocabulary:
+                if query_token in token:
+                    matches.setdefault(token, INFIX_MATCH)
+            return matches
+
+        # Infix: every inner trigram of the query must be in the token
+        inner = trigrams(query_token, padded=False)
+        candidates = set.intersection(*(self._trigrams.get(g, set()) for g in inner))
+        for token in candidates:
+            if query_token in token:
+                matches.setdefault(token, INFIX_MATCH)
+
+        # Fuzzy: Dice coefficient over padded trigrams
+        grams = trigrams(query_token)
+        shared: Counter[str] = Counter()
+        for gram in grams:
+            shared.update(self._trigrams.get(gram, ()))
+        for token, count in shared.items():
+            if token in matches:
+                continue
+            similarity = 2 * count / (len(grams) + len(trigrams(token)))
+            if similarity >= FUZZY_THRESHOLD:
+                matches[token] = FUZZY_MATCH * similarity
+
+        return matches
+
+    def search(
+        self,
+        query: str,
+        resources: Iterable[str] | None = None,
+        limit: int = 20,
+    ) -> list[SearchHit]:
+        """
+        Search the index.
+
+        Results are ranked by how many query tokens matched, then by the sum of
+        the best weighted similarity of each query token.
+        """
+        allowed = set(resources) if resources is not None else None
+        scores: dict[tuple[str, int], float] = defaultdict(float)
+        matched: Counter[tuple[str, int]] = Counter()
+
+        for query_token in dict.fromkeys(tokenize(query)):
+            best: dict[tuple[str, int], float] = {}
+            for token, similarity in self._matches(query_token).items():
+                for key, weight in self._postings[token].items():
+                    if allowed is not None and key[0] not in allowed:
+                        continue
+                    best[key] = max(best.get(key, 0.0), similarity * weight)
+            for key, score in best.items():
+                scores[key] += score
+                matched[key] += 1
+
+        ranked = sorted(scores, key=lambda k: (-matched[k], -scores[k], self._names[k]))
+        return [
+            SearchHit(
+                resource=key[0], id=key[1], name=self._names[key], score=round(scores[key], 3)
+            )
+            for key in ranked[:limit]
+        ]
@@ -0,0 +1,167 @@
+"""Nearest neighbours over mixed numeric and categorical features (Gower distance)."""
+
+import heapq
+import math
+from array import array
+from collections.abc import Sequence
+from typing import NamedTuple
+
+from src.services.dataset_store import (
+    CATEGORICAL_FIELDS,
+    INTERVAL_FIELDS,
+    NUMERIC_FIELDS,
+    CategoricalColumn,
+    ResourceTable,
+    display_name,
+)
+
+# Numeric fields spanning more orders of magnitude than this are compared on a log scale
+LOG_SCALE_RATIO = 1_000
+
+
+class SimilarityError(Exception):
+    """Invalid similarity query."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
+
+class Neighbor(NamedTuple):
+    """An entity close to the target, with the distance contributed by each feature."""
+
+    id: int
+    name: str
+    distance: float
+    contributions: dict[str, float | None]
+
+
+def _scaled(vector: Sequence[float]) -> array:
+    """Values scaled to [0, 1] by their range (log scale for heavy tails), NaN kept."""
+    known = [value for value in vector if not math.isnan(value)]
+    if not known:
+        return array("d", vector)
+    low, high = min(known), max(known)
+    if low > 0 and high / low > LOG_SCALE_RATIO:
+        vector = [math.log10(value) for value in vector]
+        low, high = math.log10(low), math.log10(high)
+    span = high - low
+    return array("d", ((value - low) / span if span else 0.0 for value in vector))
+
+
+def _code_distances(column: CategoricalColumn, target: int) -> list[float]:
+    """Distance of every vocabulary entry to the target's (Jaccard on list values)."""
+    target_parts = set(column.parts[target])
+    if target_parts == {"unknown"}:
+        return [math.nan] * len(column.values)
+    distances = []
+    for parts in column.parts:
+        other = set(parts)
+        if other == {"unknown"}:
+            distances.append(math.nan)
+        else:
+            distances.append(1 - len(target_parts & other) / len(target_parts | other))
+    return distances
+
+
+class FeatureMatrix:
+    """
+    Row-aligned, normalized features of a table.
+
+    Numeric fields are scaled to [0, 1] by their range, on a log scale when
+    they span more than three orders of magnitude (cost, population, ...).
+    Categorical fields keep the dictionary codes of the table's categorical
+    columns: equal codes are at distance 0, different ones at 1 (1 - Jaccard
+    for multi-valued fields such as climate). Unknown values are missing and
+    skipped, as in Gower's distance.
+    """
+
+    def __init__(self, table: ResourceTable):
+        self.resource = table.resource
+        self.ids = table.row_ids()
+        self.names = [display_name(model) for model in table.models.values()]
+        self._rows = {entity_id: row for row, entity_id in enumerate(self.ids)}
+        self.numeric = {
+            field: _scaled(table.vector(field)) for field in NUMERIC_FIELDS[table.resource]
+        }
+        self.categorical = {
+            field: table.categorical(field) for field in CATEGORICAL_FIELDS[table.resource]
+        }
+
+    @property
+    def features(self) -> list[str]:
+        """Feature names, numeric first."""
+        return [*self.numeric, *self.categorical]
+
+    def distances(self, row: int, features: Sequence[str]) -> dict[str, list[float]]:
+        """Per-feature distances from one row to every row (NaN where either value is unknown)."""
+        result = {}
+        for feature in features:
+            if feature in self.numeric:
+                vector = self.numeric[feature]
+                target = vector[row]
+                result[feature] = [abs(value - target) for value in vector]
+            else:
+                column = self.categorical[feature]
+                by_code = _code_distances(column, column.codes[row])
+                result[feature] = [by_code[code] for code in column.codes]
+        return result
+
+    def nearest(self, entity_id: int, features: Sequence[str], limit: int) -> list[Neighbor]:
+        """
+        The `limit` entities closest to one entity, nearest first (ties by ID).
+
+        The distance is the mean of the per-feature distances over the
+        features known for both entities, so it lies in [0, 1]; each
+        contribution is a feature's share of it (None when not comparable).
+        """
+        row = self._rows[entity_id]
+        per_feature = self.distances(row, features)
+
+        totals = [0.0] * len(self.ids)
+        counts = [0] * len(self.ids)
+        for distances in per_feature.values():
+            for other, distance in enumerate(distances):
+                if not math.isnan(distance):
+                    totals[other] += distance
+                    counts[other] += 1
+
+        candidates = (
+            (totals[other] / counts[other], self.ids[other], other)
+            for other in range(len(self.ids))
+            if other != row and counts[other]
+        )
+        return [
+            Neighbor(
+                id=neighbor_id,
+                name=self.names[other],
+                distance=distance,
+                contributions={
+                    feature: None
+                    if math.isnan(distances[other])
+                    else distances[other] / counts[other]
+                    for feature, distances in per_feature.items()
+                },
+            )
+            for distance, neighbor_id, other in heapq.nsmallest(limit, candidates)
+        ]
+
+
+def parse_features(matrix: FeatureMatrix, fields: Sequence[str]) -> list[str]:
+    """
+    Validate the requested features.
+
+    Without a request, every feature but the interval fields: birth years
+    are comparable, but "similar" characters should not default to
+    characters of the same age.
+    """
+    if not fields:
+        return [feature for feature in matrix.features if feature not in INTERVAL_FIELDS]
+    selected = list(dict.fromkeys(field.strip() for field in fields if field.strip()))
+    invalid = [field for field in selected if field not in matrix.features]
+    if invalid or not selected:
+        raise SimilarityError(
+            f"Invalid fields for {matrix.resource}: {', '.join(invalid) or 'none selected'}. "
+            f"Use: {', '.join(matrix.features)}"
+        )
+    return selected
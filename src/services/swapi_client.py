@@ -110,17 +110,6 @@ class SWAPIClient:
         """Fetch all people across all pages."""
         return await self._get_all_resources("people")
 
-    async def search_people(self, query: str) -> list[dict[str, Any]]:
-        """Search people by name."""
-        url = f"{self._base_url}/people/?search={query}"
-        data = await self._fetch(url)
-        results = data.get("results", [])
-        # Add IDs to results
-        for item in results:
-            if "url" in item:
-                item["id"] = self._extract_id_from_url(item["url"])
-        return results
-
     # ==================== Films ====================
 
     async def get_films_page(self, page: int = 1) -> dict[str, Any]:
@@ -157,16 +146,6 @@ class SWAPIClient:
         """Fetch all starships."""
         return await self._get_all_resources("starships")
 
-    async def search_starships(self, query: str) -> list[dict[str, Any]]:
-        """Search starships by name or model."""
-        url = f"{self._base_url}/starships/?search={query}"
-        data = await self._fetch(url)
-        results = data.get("results", [])
-        for item in results:
-            if "url" in item:
-                item["id"] = self._extract_id_from_url(item["url"])
-        return results
-
     # ==================== Planets ====================
 
     async def get_planets_page(self, page: int = 1) -> dict[str, Any]:
@@ -185,16 +164,6 @@ class SWAPIClient:
         """Fetch all planets."""
         return await self._get_all_resources("planets")
 
-    async def search_planets(self, query: str) -> list[dict[str, Any]]:
-        """Search planets by name."""
-        url = f"{self._base_url}/planets/?search={query}"
-        data = await self._fetch(url)
-        results = data.get("results", [])
-        for item in results:
-            if "url" in item:
-                item["id"] = self._extract_id_from_url(item["url"])
-        return results
-
     # ==================== Vehicles ====================
 
     async def get_vehicles_page(self, page: int = 1) -> dict[str, Any]:
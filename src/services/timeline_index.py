@@ -0,0 +1,145 @@
+"""Precomputed film orders, character journeys and the in-universe birth-year timeline."""
+
+import math
+from bisect import bisect_left
+from typing import Any, NamedTuple
+
+from src.services.dataset_store import MembershipColumn, ResourceTable, SortedColumn
+
+# In-universe eras, in chronological order, by episode
+ERAS: dict[str, range] = {
+    "Prequel Era": range(1, 4),
+    "Original Trilogy": range(4, 7),
+    "Sequel Era": range(7, 10),
+}
+
+# In-universe year of each episode's events, relative to the Battle of Yavin
+EPISODE_YEARS: dict[int, float] = {1: -32, 2: -22, 3: -19, 4: 0, 5: 3, 6: 4}
+
+
+def film_era(episode_id: int) -> str:
+    """Era of a film by its episode."""
+    for era, episodes in ERAS.items():
+        if episode_id in episodes:
+            return era
+    return "Unknown"
+
+
+def chronological_order(episode_id: int) -> int:
+    """In-universe position of an episode (SWAPI only has episodes 1-6, in order)."""
+    return episode_id
+
+
+def format_year(year: float) -> str:
+    """In-universe notation of a year: -19 -> "19BBY", 4 -> "4ABY"."""
+    text = f"{abs(year):g}"
+    return f"{text}BBY" if year <= 0 else f"{text}ABY"
+
+
+def age_at(birth_year: float | None, year: float | None) -> float | None:
+    """Age at a year, None when unknown or not born yet."""
+    if birth_year is None or year is None or year < birth_year:
+        return None
+    return year - birth_year
+
+
+class GenerationBucket(NamedTuple):
+    """Characters born in [start, end)."""
+
+    start: float
+    end: float
+    count: int
+
+
+def born_between(column: SortedColumn, start: float | None, end: float | None) -> list[int]:
+    """IDs of the characters born between two years (inclusive), oldest first."""
+    return column.between(start, end).tolist()
+
+
+def generations(column: SortedColumn, width: float) -> list[GenerationBucket]:
+    """
+    Histogram of birth years in buckets of `width` years, aligned on multiples of it.
+
+    Every boundary is located by bisect on the sorted column, so the cost
+    follows the number of buckets, not the number of characters.
+    """
+    if not column.values:
+        return []
+    first = math.floor(column.values[0] / width)
+    last = math.floor(column.values[-1] / width)
+    buckets = []
+    for step in range(first, last + 1):
+        start, end = step * width, (step + 1) * width
+        count = bisect_left(column.values, end) - bisect_left(column.values, start)
+        buckets.append(GenerationBucket(start, end, count))
+    return buckets
+
+
+def ages_between(
+    column: SortedColumn, year: float, min_age: float | None, max_age: float | None
+) -> list[int]:
+    """IDs of the characters whose age at `year` lies in [min_age, max_age], oldest first."""
+    earliest = None if max_age is None else year - max_age
+    return column.between(earliest, year - (min_age or 0)).tolist()
+
+
+class TimelineIndex:
+    """
+    Film order tables and every character's journey, built once per dataset version.
+
+    Entries are ready-to-serve dicts shared by every request, so callers
+    must not modify them.
+    """
+
+    def __init__(self, people: ResourceTable, films: ResourceTable, membership: MembershipColumn):
+        self.films: dict[int, dict[str, Any]] = {}
+        for film_id, data in films.records.items():
+            episode_id = data.get("episode_id", 0)
+            self.films[film_id] = {
+                "id": film_id,
+                "episode_id": episode_id,
+                "title": data.get("title"),
+                "release_date": data.get("release_date"),
+                "director": data.get("director"),
+                "era": film_era(episode_id),
+            }
+
+        self.release_order = sorted(
+            self.films.values(), key=lambda film: film["release_date"] or "9999-99-99"
+        )
+        self.chronological = sorted(
+            (
+                {**film, "chronological_order": chronological_order(film["episode_id"])}
+                for film in self.films.values()
+            ),
+            key=lambda film: film["chronological_order"],
+        )
+
+        # Film masks already list each character's films in episode order
+        self.journeys: dict[int, dict[str, Any]] = {}
+        for entity_id, mask in zip(people.row_ids(), membership.masks, strict=True):
+            person = people.records[entity_id]
+            journey = [
+                {
+                    "episode_id": self.films[film_id]["episode_id"],
+                    "title": self.films[film_id]["title"],
+                    "release_date": self.films[film_id]["release_date"],
+                    "era": self.films[film_id]["era"],
+                }
+                for film_id in membership.targets(mask)
+                if film_id in self.films
+            ]
+            eras: dict[str, list[int]] = {}
+            for step in journey:
+                eras.setdefault(step["era"], []).append(step["episode_id"])
+            self.journeys[entity_id] = {
+                "character": {
+                    "id": entity_id,
+                    "name": person.get("name"),
+                    "birth_year": person.get("birth_year"),
+                    "homeworld": person.get("homeworld"),
+                },
+                "total_films": len(journey),
+                "eras": eras,
+                "journey": journey,
+            }
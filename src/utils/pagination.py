@@ -1,16 +1,39 @@
 """Pagination utilities."""
 
-from typing import TypeVar
+import base64
+import binascii
+import json
+from collections.abc import Callable
+from datetime import date
+from typing import Any, TypeVar
 
-from src.models.base import PaginatedResponse
+from src.models.base import PaginatedResponse, SortOrder
+from src.services.dataset_store import ResourceTable
+from src.utils.sorting import sort_key
 
 T = TypeVar("T")
+M = TypeVar("M")
+
+CURSOR_DESCRIPTION = (
+    "Keyset pagination cursor: pass an empty value for the first page, then the "
+    "`next_cursor` of the previous response (with the same filters and sort)"
+)
+
+
+class CursorError(Exception):
+    """Invalid or mismatched pagination cursor."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
 
 
 def paginate(
     items: list[T],
     page: int = 1,
     page_size: int = 10,
+    facets: dict[str, dict[str, int]] | None = None,
+    to_item: Callable[[T], Any] | None = None,
 ) -> PaginatedResponse[T]:
     """
     Paginate a list of items.
@@ -19,6 +42,8 @@ def paginate(
         items: Full list of items to paginate
         page: Page number (1-indexed)
         page_size: Number of items per page
+        facets: Facet counts over all items, if requested
+        to_item: Optional conversion applied to the items of the page only
 
     Returns:
         PaginatedResponse with the requested page of items
@@ -36,6 +61,7 @@ def paginate(
     # Calculate slice indices
     start_idx = (page - 1) * page_size
     end_idx = start_idx + page_size
+    page_items = items[start_idx:end_idx]
 
     return PaginatedResponse(
         count=total_count,
@@ -44,7 +70,8 @@ def paginate(
         total_pages=total_pages,
         has_next=page < total_pages,
         has_previous=page > 1,
-        results=items[start_idx:end_idx],
+        results=[to_item(item) for item in page_items] if to_item else page_items,
+        facets=facets,
     )
 
 
@@ -69,3 +96,131 @@ def get_pagination_params(
     validated_page = max(1, page or 1)
     validated_size = max(1, min(max_page_size, page_size or default_page_size))
     return validated_page, validated_size
+
+
+def _dump_key(value: Any) -> Any:
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    if isinstance(value, tuple | list):
+        return [_dump_key(v) for v in value]
+    return value
+
+
+def _load_key(value: Any) -> Any:
+    if isinstance(value, dict):
+        return date.fromisoformat(value["date"])
+    if isinstance(value, list):
+        return tuple(_load_key(v) for v in value)
+    return value
+
+
+def encode_cursor(state: dict[str, Any]) -> str:
+    """Encode a cursor state as an opaque URL-safe string."""
+    payload = json.dumps(_dump_key(list(state.items())), separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """Decode a cursor produced by `encode_cursor`."""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return dict(_load_key(json.loads(payload)))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError) as e:
+        raise CursorError("Invalid cursor") from e
+
+
+def paginate_cursor(
+    table: ResourceTable,
+    items: list[M],
+    cursor: str,
+    to_item: Callable[[M], T],
+    page_size: int = 10,
+    sort_by: str | None = None,
+    sort_order: SortOrder = SortOrder.ASC,
+    key_mapper: dict[str, Callable[[M], Any]] | None = None,
+    version: int = 0,
+    facets: dict[str, dict[str, int]] | None = None,
+) -> PaginatedResponse[T]:
+    """
+    Paginate the (filtered) models of a table with an opaque keyset cursor.
+
+    Pages are read from the table's pre-sorted index (ordered by ID when no
+    sort field is given), resuming after the last (sort key, ID) of the
+    previous page. The cursor also records the table version and the index
+    position: while the version is unchanged the position is reused as is,
+    otherwise the page is located again by its key, so pages stay stable
+    across refreshes.
+
+    Args:
+        table: Table holding the models
+        items: Models matching the current filters
+        cursor: Cursor of the previous page ("" for the first page)
+        to_item: Conversion of a model into a result item
+        page_size: Number of items per page
+        sort_by: Field name to sort by
+        sort_order: Sort order (asc/desc)
+        key_mapper: Optional dict mapping field names to key functions
+        version: Current version of the table
+        facets: Facet counts over all items, if requested
+
+    Returns:
+        PaginatedResponse with the page of items and the next cursor
+    """
+    page_size = max(1, min(100, page_size))
+    sort_field = sort_by or "id"
+    index = table.sort_index(
+        sort_field, sort_order == SortOrder.DESC, sort_key(sort_field, key_mapper)
+    )
+
+    page, start = 1, 0
+    if cursor:
+        state = decode_cursor(cursor)
+        try:
+            if (state["sort"], state["order"]) != (sort_field, sort_order.value):
+                raise CursorError("Cursor was issued for a different sort order")
+            page, start = state["page"], state["position"]
+            if not (
+                state["version"] == version
+                and 0 < start <= len(index)
+                and index.ids[start - 1] == state["id"]
+            ):
+                start = index.after(state["key"], state["id"])
+        except (KeyError, TypeError) as e:
+            raise CursorError("Invalid cursor") from e
+
+    selected = {model.id for model in items}  # type: ignore[attr-defined]
+    positions: list[int] = []
+    has_next = False
+    for position in range(start, len(index)):
+        if index.ids[position] in selected:
+            if len(positions) == page_size:
+                has_next = True
+                break
+            positions.append(position)
+
+    next_cursor = None
+    if has_next:
+        last = positions[-1]
+        next_cursor = encode_cursor(
+            {
+                "sort": sort_field,
+                "order": sort_order.value,
+                "key": index.keys[last],
+                "id": index.ids[last],
+                "version": version,
+                "position": last + 1,
+                "page": page + 1,
+            }
+        )
+
+    return PaginatedResponse(
+        count=len(items),
+        page=page,
+        page_size=page_size,
+        total_pages=max(1, (len(items) + page_size - 1) // page_size),
+        has_next=has_next,
+        has_previous=page > 1,
+        results=[to_item(table.models[index.ids[position]]) for position in positions],  # type: ignore[arg-type]
+        facets=facets,
+        next_cursor=next_cursor,
+    )
@@ -4,30 +4,27 @@ from collections.abc import Callable
 from typing import Any, TypeVar
 
 from src.models.base import SortOrder
+from src.models.normalization import parse_birth_year
 
 T = TypeVar("T")
 
 
-def sort_items(
-    items: list[T],
-    sort_by: str | None = None,
-    sort_order: SortOrder = SortOrder.ASC,
+def sort_key(
+    sort_by: str,
     key_mapper: dict[str, Callable[[T], Any]] | None = None,
-) -> list[T]:
+) -> Callable[[T], Any]:
     """
-    Sort a list of items by a field.
+    Build the key function used to sort items by a field.
+
+    Keys are (0, value) tuples, or (1, "") for None values so they sort last.
 
     Args:
-        items: List of items to sort
         sort_by: Field name to sort by
-        sort_order: Sort order (asc/desc)
         key_mapper: Optional dict mapping field names to key functions
 
     Returns:
-        Sorted list
+        Key function
     """
-    if not sort_by:
-        return items
 
     # Default key function - works with dicts and objects
     def default_key(item: T) -> Any:
@@ -52,9 +49,33 @@ def sort_items(
 
         key_func = make_key
 
+    return key_func
+
+
+def sort_items(
+    items: list[T],
+    sort_by: str | None = None,
+    sort_order: SortOrder = SortOrder.ASC,
+    key_mapper: dict[str, Callable[[T], Any]] | None = None,
+) -> list[T]:
+    """
+    Sort a list of items by a field.
+
+    Args:
+        items: List of items to sort
+        sort_by: Field name to sort by
+        sort_order: Sort order (asc/desc)
+        key_mapper: Optional dict mapping field names to key functions
+
+    Returns:
+        Sorted list
+    """
+    if not sort_by:
+        return items
+
     reverse = sort_order == SortOrder.DESC
 
-    return sorted(items, key=key_func, reverse=reverse)
+    return sorted(items, key=sort_key(sort_by, key_mapper), reverse=reverse)
 
 
 # Common sort key mappers
@@ -62,7 +83,13 @@ PEOPLE_SORT_KEYS: dict[str, Callable] = {
     "name": lambda p: p.name.lower() if hasattr(p, "name") else p.get("name", "").lower(),
     "height": lambda p: p.height if hasattr(p, "height") else p.get("height"),
     "mass": lambda p: p.mass if hasattr(p, "mass") else p.get("mass"),
-    "birth_year": lambda p: (p.birth_year if hasattr(p, "birth_year") else p.get("birth_year", "")),
+    # In-universe order ("41.9BBY" before "19BBY"), not the string order; models carry
+    # the year parsed at ingest
+    "birth_year": lambda p: (
+        p.birth_year_aby
+        if hasattr(p, "birth_year_aby")
+        else parse_birth_year(p.birth_year if hasattr(p, "birth_year") else p.get("birth_year"))
+    ),
 }
 
 STARSHIP_SORT_KEYS: dict[str, Callable] = {
@@ -193,7 +193,6 @@ def mock_swapi_client():
     mock.get_all_species = AsyncMock(return_value=[])
 
     mock.get_multiple_by_ids = AsyncMock(return_value=[])
-    mock.search_people = AsyncMock(return_value=[])
 
     return mock
 
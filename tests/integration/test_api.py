@@ -3,7 +3,10 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from src import dependencies
 from src.main import app
+from src.models.statistics import ComparedValue, ComparisonMatrix
+from src.services.dataset_store import DatasetStore
 
 
 @pytest.fixture
@@ -24,6 +27,25 @@ class TestHealthEndpoints:
         assert data["status"] == "healthy"
         assert data["service"] == "starwars-api"
 
+    def test_health_reports_last_changes(self, client, monkeypatch, mock_swapi_client):
+        """Test /health reports the record counts of the last dataset refresh."""
+        store = DatasetStore(swapi=mock_swapi_client)
+        monkeypatch.setattr(dependencies, "_dataset_store", store)
+
+        assert client.get("/health").json()["last_changes"] is None
+
+        client.get("/api/v1/analytics/people/height")
+        assert client.get("/health").json()["last_changes"] == {
+            "version": 1,
+            "full": True,
+            "resources": {
+                "people": {"added": 2, "updated": 0, "removed": 0},
+                "films": {"added": 1, "updated": 0, "removed": 0},
+                "planets": {"added": 1, "updated": 0, "removed": 0},
+                "starships": {"added": 1, "updated": 0, "removed": 0},
+            },
+        }
+
     def test_readiness_check(self, client):
         """Test /health/ready endpoint."""
         response = client.get("/health/ready")
@@ -67,3 +89,214 @@ class TestDocsEndpoint:
         assert "openapi" in data
         assert "info" in data
         assert "paths" in data
+
+
+class TestBatchEndpoint:
+    """Tests for the batch endpoint."""
+
+    def test_batch(self, client):
+        """Test results come back in order with their own status codes."""
+        response = client.post(
+            "/api/v1/batch",
+            json={
+                "requests": [
+                    {"id": "health", "path": "/health"},
+                    {"path": "/"},
+                    {"path": "/api/v1/people/abc"},
+                    {"path": "/api/v1/unknown"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 4
+        assert [r["status"] for r in data["results"]] == [200, 200, 422, 404]
+        assert data["results"][0]["id"] == "health"
+        assert data["results"][0]["body"]["status"] == "healthy"
+        assert data["results"][1]["body"]["docs"] == "/docs"
+
+    def test_identical_requests_run_once(self, client):
+        """Test identical sub-requests share one execution."""
+        response = client.post(
+            "/api/v1/batch",
+            json={
+                "requests": [
+                    {"path": "/health?a=1&b=2"},
+                    {"path": "/health?b=2&a=1"},
+                    {"path": "/health"},
+                ]
+            },
+        )
+
+        data = response.json()
+        assert data["executed"] == 2
+        assert {r["status"] for r in data["results"]} == {200}
+
+    def test_rejected_items(self, client):
+        """Test relative and nested batch paths fail on their own."""
+        response = client.post(
+            "/api/v1/batch",
+            json={"requests": [{"path": "health"}, {"path": "/api/v1/batch"}, {"path": "/"}]},
+        )
+
+        assert [r["status"] for r in response.json()["results"]] == [400, 400, 200]
+
+    def test_batch_size(self, client):
+        """Test empty and oversized batches are rejected."""
+        assert client.post("/api/v1/batch", json={"requests": []}).status_code == 400
+        oversized = {"requests": [{"path": "/health"}] * 21}
+        assert client.post("/api/v1/batch", json=oversized).status_code == 400
+
+    def test_batch_uses_rate_limit(self, client):
+        """Test every executed sub-request counts against the client's budget."""
+        headers = {"X-Forwarded-For": "203.0.113.7"}
+        batch = {"requests": [{"path": f"/?n={i}"} for i in range(20)]}
+
+        first = client.post("/api/v1/batch", json=batch, headers=headers)
+        assert first.headers["X-RateLimit-Remaining"] == "79"
+
+        for _ in range(3):
+            assert client.post("/api/v1/batch", json=batch, headers=headers).status_code == 200
+        # 84 hits used: the batch itself fits, its 20 sub-requests do not
+        rejected = client.post("/api/v1/batch", json=batch, headers=headers)
+        assert rejected.status_code == 429
+        assert client.get("/", headers=headers).status_code == 200
+
+
+class TestPersonEndpoint:
+    """Tests for the character detail endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def store(self, monkeypatch, mock_swapi_client):
+        """Install a store where Luke's homeworld is planet 2, but planet 1 lists him."""
+        luke, threepio = mock_swapi_client.get_all_people.return_value
+        mock_swapi_client.get_all_people.return_value = [
+            {**luke, "homeworld": "https://swapi.dev/api/planets/2/"},
+            threepio,
+        ]
+        (tatooine,) = mock_swapi_client.get_all_planets.return_value
+        mock_swapi_client.get_all_planets.return_value = [
+            {**tatooine, "residents": ["https://swapi.dev/api/people/1/"]},
+            {**tatooine, "id": 2, "name": "Alderaan", "url": "https://swapi.dev/api/planets/2/"},
+        ]
+        store = DatasetStore(swapi=mock_swapi_client)
+        monkeypatch.setattr(dependencies, "_dataset_store", store)
+        return store
+
+    def test_homeworld_name_follows_homeworld_id(self, client):
+        """Test the homeworld name comes from homeworld_id, not from planet residents."""
+        response = client.get("/api/v1/people/1")
+
+        assert response.status_code == 200
+        assert response.json()["homeworld_id"] == 2
+        assert response.json()["homeworld_name"] == "Alderaan"
+
+    def test_expanded_homeworld_follows_homeworld_id(self, client):
+        """Test the embedded homeworld is the planet of homeworld_id."""
+        response = client.get("/api/v1/people/1", params={"expand": "homeworld"})
+
+        assert response.json()["homeworld"]["name"] == "Alderaan"
+
+
+class TestPeopleListEndpoint:
+    """Tests for the character list endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def store(self, monkeypatch, mock_swapi_client):
+        """Install a store over the mock SWAPI client."""
+        store = DatasetStore(swapi=mock_swapi_client)
+        monkeypatch.setattr(dependencies, "_dataset_store", store)
+        return store
+
+    def test_facets_follow_range_filters(self, client):
+        """Test facets count the same rows as the results, range parameters included."""
+        response = client.get("/api/v1/people", params={"min_height": 170, "facets": "gender"})
+
+        data = response.json()
+        assert [person["name"] for person in data["results"]] == ["Luke Skywalker"]
+        assert data["facets"] == {"gender": {"male": 1}}
+
+
+class TestComparisonMatrixEndpoint:
+    """Tests for the comparison matrix endpoint."""
+
+    URL = "/api/v1/compare/people/matrix"
+
+    @pytest.fixture(autouse=True)
+    def store(self, monkeypatch, mock_swapi_client):
+        """Install a store of 501 people: heights 101-601, odd IDs male, every 10th mass unknown."""
+        mock_swapi_client.get_all_people.return_value = [
+            {
+                "id": i,
+                "name": f"Trooper {i}",
+                "height": str(100 + i),
+                "mass": "unknown" if i % 10 == 0 else str(50 + i % 40),
+                "gender": "male" if i % 2 else "female",
+                "birth_year": f"{i}BBY",
+            }
+            for i in range(1, 502)
+        ]
+        store = DatasetStore(swapi=mock_swapi_client)
+        monkeypatch.setattr(dependencies, "_dataset_store", store)
+        return store
+
+    def test_streamed_above_threshold(self, client):
+        """Test a filtered set above the threshold is streamed as a valid matrix."""
+        response = client.get(self.URL, params={"filter": "height <= 160"})
+
+        assert response.status_code == 200
+        assert "content-length" not in response.headers
+        matrix = ComparisonMatrix.model_validate_json(response.content)
+        assert matrix.count == 60
+        assert matrix.fields == ["height", "mass"]
+        assert [entity.id for entity in matrix.entities] == list(range(1, 61))
+        assert matrix.summary["height"].winner == 60
+        assert matrix.summary["height"].min == ComparedValue(id=1, value=101)
+        assert matrix.summary["mass"].count == 54
+        first = matrix.entities[0]
+        assert first.difference["height"][:3] == [0, -1, -2]
+        assert first.ratio["mass"][9] is None
+
+    def test_ids_within_filter_keep_request_order(self, client):
+        """Test the given IDs are narrowed by the filter, deduplicated and kept in order."""
+        response = client.get(
+            self.URL, params={"ids": [9, 4, 3, 9, 1000, 7], "filter": "gender = male"}
+        )
+
+        assert response.status_code == 200
+        assert "content-length" in response.headers
+        matrix = ComparisonMatrix.model_validate_json(response.content)
+        assert [entity.id for entity in matrix.entities] == [9, 3, 7]
+        assert [entity.ranks["height"] for entity in matrix.entities] == [1, 3, 2]
+
+    def test_birth_year_on_request(self, client):
+        """Test signed birth years are compared without winner, ranks or ratios."""
+        response = client.get(self.URL, params={"ids": [1, 2], "fields": "birth_year_aby"})
+
+        matrix = ComparisonMatrix.model_validate_json(response.content)
+        assert matrix.summary["birth_year_aby"].better is None
+        assert matrix.summary["birth_year_aby"].winner is None
+        assert matrix.entities[0].difference == {"birth_year_aby": [0, 1]}
+        assert matrix.entities[0].ratio == {"birth_year_aby": [None, None]}
+
+    def test_without_pairwise(self, client):
+        """Test pairwise differences and ratios can be left out."""
+        response = client.get(self.URL, params={"ids": [1, 2, 3], "pairwise": "false"})
+
+        matrix = ComparisonMatrix.model_validate_json(response.content)
+        assert all(e.difference is None and e.ratio is None for e in matrix.entities)
+        assert matrix.entities[2].ranks == {"height": 1, "mass": 1}
+
+    def test_unknown_resource(self, client):
+        """Test an unknown resource is a 404."""
+        response = client.get("/api/v1/compare/droids/matrix", params={"ids": [1, 2]})
+
+        assert response.status_code == 404
+
+    def test_too_many_matches(self, client):
+        """Test a filter matching more than the maximum is rejected."""
+        response = client.get(self.URL, params={"filter": "height > 100"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "501 entities match; compare at most 500"
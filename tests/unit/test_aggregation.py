@@ -0,0 +1,89 @@
+"""Tests for group-by aggregation."""
+
+import math
+
+import pytest
+
+from src.services.aggregation import (
+    Aggregate,
+    AggregationError,
+    aggregate,
+    group_rows,
+    parse_aggregate,
+)
+
+FIELDS = ("height", "mass")
+
+
+class TestParseAggregate:
+    """Tests for parse_aggregate."""
+
+    def test_specs(self):
+        """Test parsing aggregate specs."""
+        assert parse_aggregate("count", FIELDS) == Aggregate("count")
+        assert parse_aggregate("AVG:height", FIELDS) == Aggregate("avg", "height")
+        assert parse_aggregate("p90:mass", FIELDS) == Aggregate("p90", "mass", 90.0)
+        assert parse_aggregate("p99.5:mass", FIELDS).name == "p99.5_mass"
+
+    @pytest.mark.parametrize("spec", ["avg", "avg:name", "median:height", "p101:height", "px:mass"])
+    def test_invalid_specs(self, spec):
+        """Test invalid specs raise AggregationError."""
+        with pytest.raises(AggregationError):
+            parse_aggregate(spec, FIELDS)
+
+
+class TestGroupRows:
+    """Tests for group_rows."""
+
+    def test_single_key(self):
+        """Test rows hashed by one key."""
+        labels = [[["male"], ["female"], ["male"]]]
+
+        assert group_rows(labels, [0, 1, 2]) == {("male",): [0, 2], ("female",): [1]}
+
+    def test_multi_valued_and_multiple_keys(self):
+        """Test multi-valued labels join every group of the cross product."""
+        labels = [[["arid", "temperate"], ["arid"]], [["desert"], ["desert", "forest"]]]
+
+        assert group_rows(labels, [0, 1]) == {
+            ("arid", "desert"): [0, 1],
+            ("temperate", "desert"): [0],
+            ("arid", "forest"): [1],
+        }
+
+    def test_no_keys(self):
+        """Test rows form a single group without keys."""
+        assert group_rows([], [1, 3]) == {(): [1, 3]}
+
+
+class TestAggregate:
+    """Tests for aggregate."""
+
+    def test_aggregates_skip_unknown_values(self):
+        """Test aggregates over known values only."""
+        vectors = {"height": [172.0, math.nan, 150.0, 202.0]}
+        aggregates = [
+            Aggregate("count"),
+            Aggregate("count", "height"),
+            Aggregate("sum", "height"),
+            Aggregate("avg", "height"),
+            Aggregate("min", "height"),
+            Aggregate("max", "height"),
+            Aggregate("p50", "height", 50.0),
+        ]
+
+        assert aggregate([0, 1, 2], vectors, aggregates) == {
+            "count": 3,
+            "count_height": 2,
+            "sum_height": 322.0,
+            "avg_height": 161.0,
+            "min_height": 150.0,
+            "max_height": 172.0,
+            "p50_height": 161.0,
+        }
+
+    def test_no_known_values(self):
+        """Test aggregates of a group without known values."""
+        result = aggregate([1], {"height": [1.0, math.nan]}, [Aggregate("avg", "height")])
+
+        assert result == {"avg_height": None}
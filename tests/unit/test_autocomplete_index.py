@@ -0,0 +1,69 @@
+"""Tests for the autocomplete prefix index."""
+
+from src.services.autocomplete_index import AutocompleteIndex, Suggestion
+
+SUGGESTIONS = [
+    Suggestion("people", 1, "Luke Skywalker", 5),
+    Suggestion("people", 11, "Anakin Skywalker", 3),
+    Suggestion("people", 31, "Lama Su", 1),
+    Suggestion("planets", 1, "Tatooine", 5),
+    Suggestion("films", 1, "A New Hope", 18),
+]
+
+
+class TestAutocompleteIndex:
+    """Tests for AutocompleteIndex."""
+
+    def test_prefix_of_name(self):
+        """Test completing the start of a name."""
+        index = AutocompleteIndex(SUGGESTIONS)
+
+        assert [s.name for s in index.complete("lu")] == ["Luke Skywalker"]
+
+    def test_prefix_of_any_word(self):
+        """Test completing any word of a name, most popular first."""
+        index = AutocompleteIndex(SUGGESTIONS)
+
+        result = index.complete("sky")
+
+        assert [s.id for s in result] == [1, 11]
+
+    def test_multi_word_prefix(self):
+        """Test prefixes spanning several words."""
+        index = AutocompleteIndex(SUGGESTIONS)
+
+        assert [s.name for s in index.complete("luke  sky")] == ["Luke Skywalker"]
+        assert [s.name for s in index.complete("new h")] == ["A New Hope"]
+
+    def test_popularity_ordering_and_limit(self):
+        """Test suggestions are ordered by popularity and limited."""
+        index = AutocompleteIndex(SUGGESTIONS)
+
+        assert [s.name for s in index.complete("l")] == ["Luke Skywalker", "Lama Su"]
+        assert len(index.complete("l", limit=1)) == 1
+
+    def test_resource_filter(self):
+        """Test restricting suggestions to some resources."""
+        index = AutocompleteIndex(SUGGESTIONS)
+
+        assert index.complete("t", resources=["people"]) == []
+        assert index.complete("t", resources=["planets"])[0].name == "Tatooine"
+
+    def test_empty_prefix(self):
+        """Test blank prefixes return nothing."""
+        index = AutocompleteIndex(SUGGESTIONS)
+
+        assert index.complete("  ") == []
+
+    def test_add_and_remove(self):
+        """Test adding, replacing and removing suggestions."""
+        index = AutocompleteIndex(SUGGESTIONS)
+
+        index.remove("people", 1)
+        index.add(Suggestion("people", 11, "Anakin Skywalker", 9))
+        index.add(Suggestion("planets", 1, "Tatooine II", 5))
+
+        assert [s.id for s in index.complete("sky")] == [11]
+        assert index.complete("sky")[0].popularity == 9
+        assert [s.name for s in index.complete("tat")] == ["Tatooine II"]
+        assert len(index) == 4
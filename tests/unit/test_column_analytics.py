@@ -0,0 +1,116 @@
+"""Tests for column analytics."""
+
+import math
+from array import array
+
+import pytest
+
+from src.services.column_analytics import histogram, pairwise, percentile, summarize
+
+VALUES = array("d", [66.0, 150.0, 167.0, 172.0, 180.0, 202.0, 228.0])
+
+
+class TestPercentile:
+    """Tests for percentile."""
+
+    def test_interpolation(self):
+        """Test percentiles interpolate between ranks."""
+        assert percentile(VALUES, 0) == 66.0
+        assert percentile(VALUES, 50) == 172.0
+        assert percentile(VALUES, 100) == 228.0
+        assert percentile(VALUES, 25) == pytest.approx(158.5)
+
+    def test_empty(self):
+        """Test an empty column has no percentiles."""
+        assert percentile(array("d"), 50) is None
+
+
+class TestSummarize:
+    """Tests for summarize."""
+
+    def test_summary(self):
+        """Test summary statistics."""
+        summary = summarize(VALUES)
+
+        assert summary.count == 7
+        assert (summary.min, summary.max, summary.median) == (66.0, 228.0, 172.0)
+        assert summary.mean == pytest.approx(166.428, abs=1e-3)
+        assert summary.stddev == pytest.approx(47.2497, abs=1e-4)
+
+    def test_empty(self):
+        """Test summarizing an empty column."""
+        summary = summarize(array("d"))
+
+        assert summary.count == 0
+        assert summary.mean is None
+
+
+class TestHistogram:
+    """Tests for histogram."""
+
+    def test_equal_width_bins(self):
+        """Test bins span the range and the last bin includes the maximum."""
+        buckets = histogram(VALUES, bins=3)
+
+        assert [b.count for b in buckets] == [1, 3, 3]
+        assert buckets[0].start == 66.0
+        assert buckets[-1].end == 228.0
+
+    def test_explicit_range(self):
+        """Test values outside an explicit range are ignored."""
+        buckets = histogram(VALUES, bins=2, start=100, end=200)
+
+        assert [(b.start, b.end, b.count) for b in buckets] == [(100, 150, 0), (150, 200, 4)]
+
+    def test_single_value(self):
+        """Test a column with one distinct value."""
+        buckets = histogram(array("d", [5.0, 5.0]), bins=1)
+
+        assert [(b.start, b.end, b.count) for b in buckets] == [(4.5, 5.5, 2)]
+
+    def test_empty(self):
+        """Test an empty column has no bins."""
+        assert histogram(array("d")) == []
+
+    @pytest.mark.parametrize(
+        ("start", "end"), [(300, None), (None, 10), (66, 66), (200, 100), (228, None)]
+    )
+    def test_invalid_range(self, start, end):
+        """Test a bound past the other one, given or defaulted, is rejected."""
+        with pytest.raises(ValueError, match="must be lower than end"):
+            histogram(VALUES, bins=2, start=start, end=end)
+
+
+class TestPairwise:
+    """Tests for pairwise covariance and correlation."""
+
+    def test_perfect_correlation(self):
+        """Test linearly related vectors."""
+        stats = pairwise([[1.0, 2.0, 3.0], [2.0, 4.0, 6.0], [3.0, 2.0, 1.0]])
+
+        assert stats.correlation[0][0] == 1.0
+        assert stats.correlation[0][1] == pytest.approx(1.0)
+        assert stats.correlation[0][2] == pytest.approx(-1.0)
+        assert stats.covariance[0][1] == pytest.approx(2.0)
+        assert stats.counts[0][1] == 3
+
+    def test_unknown_values_are_masked(self):
+        """Test each pair only uses rows where both values are known."""
+        stats = pairwise([[1.0, 2.0, math.nan, 4.0], [1.0, math.nan, 5.0, 4.0]])
+
+        assert stats.counts == [[3, 2], [2, 3]]
+        assert stats.correlation[0][1] == pytest.approx(1.0)
+
+    def test_rows_subset_and_constant_values(self):
+        """Test restricting rows and pairs without variance."""
+        stats = pairwise([[1.0, 2.0, 3.0], [5.0, 5.0, 7.0]], rows=[0, 1])
+
+        assert stats.counts[0][1] == 2
+        assert stats.covariance[0][1] == 0.0
+        assert stats.correlation[0][1] is None
+
+    def test_too_few_rows(self):
+        """Test pairs with fewer than two rows have no statistics."""
+        stats = pairwise([[1.0], [2.0]])
+
+        assert stats.covariance == [[None, None], [None, None]]
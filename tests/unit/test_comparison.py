@@ -0,0 +1,71 @@
+"""Tests for pairwise comparisons."""
+
+import math
+
+import pytest
+
+from src.services.comparison import compare_field, pairwise
+
+NAN = math.nan
+
+
+class TestCompareField:
+    """Tests for compare_field."""
+
+    def test_higher_is_better(self):
+        """Test min, max, mean, winner and ranks with ties and unknown values."""
+        result = compare_field("height", [1, 2, 3, 4], [172.0, 202.0, NAN, 172.0])
+
+        assert result.better == "higher"
+        assert result.count == 3
+        assert (result.min_id, result.min) == (1, 172.0)
+        assert (result.max_id, result.max) == (2, 202.0)
+        assert result.mean == pytest.approx(182.0)
+        assert result.winner_id == 2
+        assert result.ranks == [2, 1, None, 2]
+
+    def test_lower_is_better(self):
+        """Test fields where the smallest value wins."""
+        result = compare_field("hyperdrive_rating", [10, 12, 13], [0.5, 1.0, 1.0])
+
+        assert result.better == "lower"
+        assert result.winner_id == 10
+        assert (result.max_id, result.max) == (12, 1.0)
+        assert result.ranks == [1, 2, 2]
+
+    def test_interval_field(self):
+        """Test signed years get min, max and mean but no winner or ranks."""
+        result = compare_field("birth_year_aby", [1, 2, 3], [-19.0, -112.0, NAN])
+
+        assert result.better is None
+        assert (result.min_id, result.max_id) == (2, 1)
+        assert result.mean == pytest.approx(-65.5)
+        assert result.winner_id is None
+        assert result.ranks == [None, None, None]
+
+    def test_all_unknown(self):
+        """Test a field without known values."""
+        result = compare_field("mass", [1, 2], [NAN, NAN])
+
+        assert result.count == 0
+        assert result.winner_id is None
+        assert result.ranks == [None, None]
+
+
+class TestPairwise:
+    """Tests for pairwise."""
+
+    def test_differences_and_ratios(self):
+        """Test one entity against every entity, skipping unknown and zero values."""
+        differences, ratios = pairwise([10.0, 5.0, NAN, 0.0], 0)
+
+        assert differences == [0.0, 5.0, None, 10.0]
+        assert ratios == [1.0, 2.0, None, None]
+
+    def test_without_ratios(self):
+        """Test interval fields only get differences."""
+        assert pairwise([-19.0, -112.0], 0, with_ratios=False) == ([0.0, 93.0], [None, None])
+
+    def test_unknown_value(self):
+        """Test an entity without a value compares to nothing."""
+        assert pairwise([NAN, 5.0], 0) == ([None, None], [None, None])
@@ -0,0 +1,314 @@
+"""Tests for the in-memory dataset store."""
+
+import logging
+
+import pytest
+
+from src.services.dataset_store import (
+    RESOURCE_MODELS,
+    CategoricalColumn,
+    DatasetStore,
+    MembershipColumn,
+    ResourceTable,
+    SortedColumn,
+    SortIndex,
+)
+from src.services.model_cache import ModelCache
+from src.services.relation_index import Adjacency
+
+
+class TestSortedColumn:
+    """Tests for SortedColumn."""
+
+    def test_counts(self):
+        """Test counting values below and above."""
+        column = SortedColumn([(75.0, 10), (100.0, 12), (50.0, 5), (75.0, 3)])
+
+        assert list(column.values) == [50.0, 75.0, 75.0, 100.0]
+        assert column.count_below(75.0) == 1
+        assert column.count_above(75.0) == 1
+        assert column.count_below(10.0) == 0
+        assert column.count_above(100.0) == 0
+
+    def test_index_of_with_ties(self):
+        """Test locating an entity among tied values."""
+        column = SortedColumn([(75.0, 10), (100.0, 12), (50.0, 5), (75.0, 3)])
+
+        assert column.index_of(3, 75.0) == 1
+        assert column.index_of(10, 75.0) == 2
+        assert column.index_of(12, 100.0) == 3
+
+    def test_insert_and_remove(self):
+        """Test keeping the column sorted while editing it."""
+        column = SortedColumn([(75.0, 10), (100.0, 12)])
+
+        column.insert(75.0, 3)
+        column.insert(50.0, 5)
+        column.remove(100.0, 12)
+        column.remove(100.0, 99)
+
+        assert list(column.values) == [50.0, 75.0, 75.0]
+        assert list(column.ids) == [5, 3, 10]
+
+    def test_index_of_missing(self):
+        """Test that missing entities are not found."""
+        column = SortedColumn([(75.0, 10)])
+
+        assert column.index_of(99, 75.0) is None
+        assert column.index_of(10, 80.0) is None
+
+
+class TestSortIndex:
+    """Tests for SortIndex."""
+
+    MODELS = {3: 75.0, 10: 75.0, 12: 100.0, 5: 50.0}
+
+    def test_order_with_ties(self):
+        """Test entries are ordered by key with ties by ascending ID."""
+        assert SortIndex(self.MODELS, lambda v: v, descending=False).ids == [5, 3, 10, 12]
+        assert SortIndex(self.MODELS, lambda v: v, descending=True).ids == [12, 3, 10, 5]
+
+    def test_after(self):
+        """Test seeking after a (key, id) that may no longer exist."""
+        index = SortIndex(self.MODELS, lambda v: v, descending=True)
+
+        assert index.after(75.0, 3) == 2
+        assert index.after(75.0, 7) == 2
+        assert index.after(80.0, 1) == 1
+        assert index.after(50.0, 5) == 4
+
+
+class TestCategoricalColumn:
+    """Tests for CategoricalColumn."""
+
+    def test_encoding(self):
+        """Test values are lowercased once into a shared vocabulary of codes."""
+        column = CategoricalColumn(["Arid", "temperate, Arid", "arid", ""], split=True)
+
+        assert list(column.codes) == [0, 1, 0, 2]
+        assert column.values == ["arid", "temperate, arid", ""]
+        assert column.labels == [("Arid",), ("temperate", "Arid"), ("unknown",)]
+        assert column.part_index() == {"arid": 0b0111, "temperate": 0b0010, "unknown": 0b1000}
+
+    def test_matching(self):
+        """Test whole-value and substring matches resolve on the vocabulary."""
+        column = CategoricalColumn(["Starfighter", "Star Destroyer", "starfighter"], split=False)
+
+        assert column.equal("starfighter") == 0b101
+        assert column.equal("star") == 0
+        assert column.containing("star") == 0b111
+        assert column.containing("destroyer") == 0b010
+
+
+class TestMembershipColumn:
+    """Tests for MembershipColumn."""
+
+    @pytest.fixture
+    def column(self):
+        """Entities 10-13 linked to films 4, 5 and 6 (domain in episode order)."""
+        links = [(10, 4), (10, 5), (10, 6), (11, 4), (11, 5), (12, 6)]
+        return MembershipColumn([10, 11, 12, 13], [4, 5, 6], Adjacency(links))
+
+    def test_masks(self, column):
+        """Test each row gets a bitmask in domain order, and its transpose."""
+        assert column.masks == [0b111, 0b011, 0b100, 0]
+        assert column.bitmaps == [0b0011, 0b0011, 0b0101]
+        assert column.targets(column.masks[1]) == [4, 5]
+        assert column.mask([6, 4]) == 0b101
+        with pytest.raises(KeyError):
+            column.mask([7])
+
+    def test_select(self, column):
+        """Test all, any, none and exactly over every row."""
+        mask = column.mask([4, 5])
+
+        assert column.select("all", mask) == 0b0011
+        assert column.select("any", column.mask([5, 6])) == 0b0111
+        assert column.select("none", mask) == 0b1100
+        assert column.select("exactly", mask) == 0b0010
+        assert column.select("exactly", 0) == 0b1000
+        assert column.select("all", 0) == 0b1111
+
+
+class TestDatasetStore:
+    """Tests for DatasetStore."""
+
+    @pytest.fixture
+    def store(self, mock_swapi_client):
+        """Create a store backed by the mock SWAPI client."""
+        return DatasetStore(swapi=mock_swapi_client)
+
+    async def test_ensure_loaded(self, store):
+        """Test loading builds tables and bumps the version."""
+        assert store.is_stale()
+
+        await store.ensure_loaded()
+
+        assert store.version == 1
+        assert len(store.table("people")) == 2
+        assert store.table("people").get(1).name == "Luke Skywalker"
+        assert store.table("starships").get(12).mglt == 100
+
+    async def test_ensure_loaded_is_cached(self, store, mock_swapi_client):
+        """Test a fresh snapshot is not reloaded."""
+        await store.ensure_loaded()
+        await store.ensure_loaded()
+
+        assert store.version == 1
+        assert mock_swapi_client.get_all_people.await_count == 1
+
+    async def test_sorted_columns(self, store):
+        """Test numeric columns are sorted and skip unknown values."""
+        await store.ensure_loaded()
+
+        heights = store.table("people").column("height")
+        assert list(heights.values) == [167.0, 172.0]
+        assert list(heights.ids) == [2, 1]
+
+    async def test_unknown_field(self, store):
+        """Test requesting a non numeric field."""
+        await store.ensure_loaded()
+
+        with pytest.raises(KeyError):
+            store.table("people").column("name")
+
+    async def test_vector_and_categories(self, store):
+        """Test row-aligned vectors and categorical values."""
+        await store.ensure_loaded()
+        table = store.table("people")
+
+        assert table.row_ids() == [1, 2]
+        assert list(table.vector("height")) == [172.0, 167.0]
+        assert table.categories("gender") == {1: ["male"], 2: ["n/a"]}
+
+    async def test_match(self, store):
+        """Test matching categorical query parameters to row bitmaps."""
+        await store.ensure_loaded()
+        table = store.table("people")
+
+        assert table.match("gender", "MALE") == 0b01
+        assert table.match("eye_color", "ell", partial=True) == 0b10
+        assert table.match("gender", None) == table.all_rows()
+
+    async def test_within(self, store):
+        """Test numeric ranges resolve on the sorted columns, unset bounds left open."""
+        await store.ensure_loaded()
+        table = store.table("people")
+
+        assert table.within("height", 170, None) == 0b01
+        assert table.within("height", 0, 170) == 0b10
+        assert table.within("height", 160, 180) == 0b11
+        assert table.within("height", None, None) == table.all_rows()
+        assert table.models_of(0b10) == [table.get(2)]
+
+    async def test_film_membership(self, store):
+        """Test film membership masks are built at ingest and reused."""
+        await store.ensure_loaded()
+        computations = store.views.computations
+        membership = store.membership("people", "films")
+
+        assert store.views.computations == computations
+        assert membership.targets(membership.masks[store.table("people").row(1)]) == [1]
+        assert membership.select("all", membership.mask([1])) == 0b11
+        with pytest.raises(KeyError):
+            store.membership("people", "people")
+
+    @pytest.mark.parametrize("cache", [None, ModelCache(RESOURCE_MODELS)])
+    def test_categorical_values_are_interned(self, cache):
+        """Test retained records and models share one copy of each categorical value."""
+        records = [{"id": i, "name": f"Clone {i}", "gender": "".join(["ma", "le"])} for i in (1, 2)]
+        raw = [record["gender"] for record in records]
+        assert raw[0] is not raw[1]
+
+        table = ResourceTable("people", records, cache)
+
+        assert table.get(1).gender is table.get(2).gender
+        assert table.records[2]["gender"] is table.get(1).gender
+        # The crawled records are copied, not rewritten
+        assert table.records[1] is not records[0]
+        assert records[0]["gender"] is raw[0] and records[1]["gender"] is raw[1]
+
+    async def test_group_labels(self, store):
+        """Test grouping by a categorical field or a related resource."""
+        await store.ensure_loaded()
+
+        assert store.group_labels("people", "eye_color") == {1: ["blue"], 2: ["yellow"]}
+        assert store.group_labels("people", "planets") == {1: ["Tatooine"], 2: ["Tatooine"]}
+        assert store.group_labels("people", "species") == {1: ["none"], 2: ["none"]}
+        with pytest.raises(KeyError):
+            store.group_labels("people", "name")
+
+    def test_unknown_resource(self, store):
+        """Test requesting an unknown resource."""
+        with pytest.raises(KeyError):
+            store.table("droids")
+
+    async def test_incremental_refresh(self, store, mock_swapi_client):
+        """Test a refresh only applies added, edited and removed records."""
+        await store.ensure_loaded()
+        luke, threepio = mock_swapi_client.get_all_people.return_value
+        mock_swapi_client.get_all_people.return_value = [
+            {**luke, "name": "Luke Skywalker", "height": "180", "edited": "2015-01-01"},
+            {**threepio, "id": 3, "name": "R2-D2", "height": "96"},
+        ]
+
+        changes = await store.refresh()
+
+        assert not changes.full
+        assert changes.changed == ["people"]
+        assert changes.resources["people"]._asdict() == {
+            "added": [3],
+            "updated": [1],
+            "removed": [2],
+        }
+        assert store.version == 2
+        assert store.last_changes is changes
+        assert changes.counts()["resources"] == {"people": {"added": 1, "updated": 1, "removed": 1}}
+        assert list(store.table("people").column("height").ids) == [3, 1]
+        assert store.related_records("films", 1, "people")[0]["name"] == "Luke Skywalker"
+        assert [hit.id for hit in store.search.search("r2")] == [3]
+        assert [s.id for s in store.autocomplete.complete("c-3")] == []
+
+    async def test_refresh_logs_counts(self, store, mock_swapi_client, caplog):
+        """Test every refresh logs the changed record counts per resource."""
+        await store.ensure_loaded()
+        mock_swapi_client.get_all_people.return_value = (
+            mock_swapi_client.get_all_people.return_value[:1]
+        )
+
+        with caplog.at_level(logging.INFO, logger="src.services.dataset_store"):
+            await store.refresh()
+            await store.refresh()
+
+        assert caplog.messages == [
+            "Dataset incremental refresh, version 2: people 0 added, 0 updated, 1 removed",
+            "Dataset incremental refresh, version 2: no changes",
+        ]
+
+    async def test_refresh_without_changes(self, store):
+        """Test an identical crawl reports no changes and keeps the version."""
+        await store.ensure_loaded()
+
+        changes = await store.refresh()
+
+        assert changes.changed == []
+        assert changes.as_dict() == {"version": 1, "full": False, "resources": {}}
+
+    async def test_full_refresh_reuses_parsed_models(self, store, mock_swapi_client):
+        """Test a full rebuild only re-parses records whose `edited` changed."""
+        luke, threepio = mock_swapi_client.get_all_people.return_value
+        threepio = {**threepio, "edited": "2014-12-20T21:17:50.309000Z"}
+        mock_swapi_client.get_all_people.return_value = [luke, threepio]
+        await store.ensure_loaded()
+        mock_swapi_client.get_all_people.return_value = [
+            {**luke, "height": "180", "edited": "2015-01-01"},
+            threepio,
+        ]
+        old = dict(store.table("people").models)
+
+        await store.refresh(full=True)
+
+        people = store.table("people")
+        assert people.get(1) is not old[1]
+        assert people.get(1).height == 180
+        assert people.get(2) is old[2]
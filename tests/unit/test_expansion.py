@@ -0,0 +1,102 @@
+"""Tests for relation expansion."""
+
+import pytest
+
+from src.services.dataset_store import DatasetStore
+from src.services.expansion import (
+    EXPANSIONS,
+    ExpansionError,
+    RelationLoader,
+    expand,
+    parse_expand,
+)
+
+
+class TestParseExpand:
+    """Tests for parse_expand."""
+
+    def test_tree(self):
+        """Test dotted paths are merged into one tree, in request order."""
+        tree = parse_expand("people", "films.planets, homeworld,films.characters,films")
+
+        assert tree == (("films", (("planets", ()), ("characters", ()))), ("homeworld", ()))
+
+    @pytest.mark.parametrize(
+        "expand", ["planets", "films.budget", "films.planets.films", ",", "films..planets"]
+    )
+    def test_invalid(self, expand):
+        """Test unknown relations, deep nesting and empty paths are rejected."""
+        with pytest.raises(ExpansionError):
+            parse_expand("people", expand)
+
+    def test_names(self):
+        """Test expansion names follow the relation fields."""
+        assert EXPANSIONS["people"] == {
+            "films": ("films", True),
+            "species": ("species", True),
+            "vehicles": ("vehicles", True),
+            "starships": ("starships", True),
+            "homeworld": ("planets", False),
+        }
+        assert EXPANSIONS["starships"]["pilots"] == ("people", True)
+        assert EXPANSIONS["films"]["characters"] == ("people", True)
+
+
+class TestExpand:
+    """Tests for expand."""
+
+    @pytest.fixture
+    async def store(self, mock_swapi_client):
+        """Create a loaded store backed by the mock SWAPI client."""
+        return await DatasetStore(swapi=mock_swapi_client).ensure_loaded()
+
+    def test_batched_lookups(self, store):
+        """Test IDs are deduplicated and loaded once per resource."""
+        loader = RelationLoader(store)
+        people = [store.table("people").get(1), store.table("people").get(2)]
+
+        luke, threepio = expand(
+            store, "people", people, parse_expand("people", "homeworld,films,species"), loader
+        )
+
+        assert luke["homeworld"]["name"] == "Tatooine"
+        assert luke["homeworld"] is threepio["homeworld"]
+        assert [film["title"] for film in threepio["films"]] == ["A New Hope"]
+        # Species 2 is linked but missing from the dataset
+        assert threepio["species"] == []
+        assert sorted(loader.batches) == [("films", 1), ("planets", 1), ("species", 1)]
+
+    def test_nested(self, store):
+        """Test nested relations are resolved from both sides of a link."""
+        (luke,) = expand(
+            store, "people", [{"id": 1}], parse_expand("people", "starships.pilots,films")
+        )
+
+        assert [ship["name"] for ship in luke["starships"]] == ["X-wing"]
+        assert [pilot["id"] for pilot in luke["starships"][0]["pilots"]] == [1]
+        assert "characters" not in luke["films"][0]
+
+    async def test_single_relation_reads_its_field(self, mock_swapi_client):
+        """Test homeworld follows homeworld_id even when another planet lists the person."""
+        luke, threepio = mock_swapi_client.get_all_people.return_value
+        mock_swapi_client.get_all_people.return_value = [
+            {**luke, "homeworld": "https://swapi.dev/api/planets/2/"},
+            threepio,
+        ]
+        (tatooine,) = mock_swapi_client.get_all_planets.return_value
+        mock_swapi_client.get_all_planets.return_value = [
+            {**tatooine, "residents": ["https://swapi.dev/api/people/1/"]},
+            {**tatooine, "id": 2, "name": "Alderaan", "url": "https://swapi.dev/api/planets/2/"},
+        ]
+        store = await DatasetStore(swapi=mock_swapi_client).ensure_loaded()
+
+        (luke,) = expand(store, "people", [{"id": 1}], parse_expand("people", "homeworld"))
+
+        assert store.relations.related_ids("people", 1, "planets") == [1, 2]
+        assert luke["homeworld"]["name"] == "Alderaan"
+
+    def test_without_expansion(self, store):
+        """Test items are returned as is without an expansion."""
+        person = store.table("people").get(1)
+
+        assert expand(store, "people", [person], ()) == [person]
@@ -0,0 +1,86 @@
+"""Tests for the character graph."""
+
+import pytest
+
+from src.services.dataset_store import ResourceTable
+from src.services.graph import CharacterGraph, GraphError, parse_via
+from src.services.relation_index import Adjacency
+
+PEOPLE = ResourceTable("people", [{"id": i, "name": f"Character {i}"} for i in range(1, 7)])
+
+# Films 1 and 3 link characters 1-3, film 2 links 3 and 4, starship 10 links 4 and 5;
+# character 6 shares nothing with anyone
+FILMS = Adjacency([(1, 1), (2, 1), (3, 1), (1, 3), (2, 3), (3, 2), (4, 2)])
+STARSHIPS = Adjacency([(4, 10), (5, 10), (6, 11)])
+
+
+def build(*via: str) -> CharacterGraph:
+    memberships = {"films": FILMS, "starships": STARSHIPS}
+    return CharacterGraph(
+        PEOPLE.models,
+        {resource: memberships[resource] for resource in via},
+        {"films": {1: "A New Hope"}, "starships": {10: "X-wing"}},
+    )
+
+
+@pytest.fixture
+def graph():
+    """Graph linking characters through films and starships."""
+    return build("films", "starships")
+
+
+class TestCharacterGraph:
+    """Tests for CharacterGraph."""
+
+    def test_csr_layout(self, graph):
+        """Test adjacency rows are sorted and weighted by shared entities."""
+        assert list(graph.indptr) == [0, 2, 4, 7, 9, 10, 10]
+        assert graph.neighbors(graph.row(3)).tolist() == [0, 1, 3]
+        assert graph.edge_count == 5
+        assert graph.coappearances(graph.row(1)) == [(1, 2), (2, 1)]
+
+    def test_shared(self, graph):
+        """Test the entities two characters share are named."""
+        assert graph.shared(graph.row(1), graph.row(2)) == {"films": [(1, "A New Hope"), (3, "3")]}
+        assert graph.shared(graph.row(4), graph.row(5)) == {"starships": [(10, "X-wing")]}
+
+    def test_shortest_path(self, graph):
+        """Test paths follow the fewest hops across link resources."""
+        path = graph.shortest_path(graph.row(1), graph.row(5))
+
+        assert [graph.ids[row] for row in path] == [1, 3, 4, 5]
+        assert graph.shortest_path(graph.row(1), graph.row(1)) == [graph.row(1)]
+        assert graph.shortest_path(graph.row(1), graph.row(6)) is None
+        assert build("films").shortest_path(0, 4) is None
+
+    def test_components(self, graph):
+        """Test components are listed largest first."""
+        assert graph.components() == [[0, 1, 2, 3, 4], [5]]
+        assert build("starships").components()[0] == [3, 4]
+
+    def test_centrality(self, graph):
+        """Test degree, strength, closeness and betweenness."""
+        assert graph.centrality("degree") == [2, 2, 3, 2, 1, 0]
+        assert graph.centrality("strength") == [3, 3, 3, 2, 1, 0]
+        assert graph.centrality("betweenness") == pytest.approx([0, 0, 0.4, 0.3, 0, 0])
+
+        closeness = graph.centrality("closeness")
+        assert closeness[2] == max(closeness)
+        assert closeness[5] == 0
+
+    def test_metrics_are_memoized(self, graph):
+        """Test each metric is computed once per graph."""
+        assert graph.centrality("betweenness") is graph.centrality("betweenness")
+        with pytest.raises(GraphError):
+            graph.centrality("pagerank")
+
+
+class TestParseVia:
+    """Tests for parse_via."""
+
+    def test_parse(self):
+        """Test defaults, comma separated values and canonical order."""
+        assert parse_via([]) == ("films", "starships", "vehicles", "planets")
+        assert parse_via(["planets,films"]) == ("films", "planets")
+        with pytest.raises(GraphError, match="droids"):
+            parse_via(["droids"])
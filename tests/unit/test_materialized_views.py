@@ -0,0 +1,96 @@
+"""Tests for materialized views."""
+
+import pytest
+
+from src.api.v1.statistics import compute_planet_statistics, compute_universe_overview
+from src.services.dataset_store import DatasetStore
+from src.services.materialized_views import MaterializedViews
+
+
+class TestMaterializedViews:
+    """Tests for MaterializedViews."""
+
+    def test_computed_once_per_version(self):
+        """Test a view is reused until one of its dependencies changes."""
+        versions = {"planets": 1, "people": 1}
+        views = MaterializedViews(versions)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        assert views.get("planets", ["planets"], compute) == 1
+        assert views.get("planets", ["planets"], compute) == 1
+
+        versions["people"] += 1
+        assert views.get("planets", ["planets"], compute) == 1
+
+        versions["planets"] += 1
+        assert views.get("planets", ["planets"], compute) == 2
+        assert views.computations == 2
+
+    def test_least_recently_used_dropped(self):
+        """Test the least recently used view is dropped when the cache is full."""
+        views = MaterializedViews({}, max_entries=2)
+        views.get("a", [], lambda: 1)
+        views.get("b", [], lambda: 2)
+        views.get("a", [], lambda: 0)
+
+        views.get("c", [], lambda: 3)
+
+        assert len(views) == 2
+        assert views.get("a", [], lambda: 0) == 1
+        assert views.get("b", [], lambda: 0) == 0
+
+    def test_clear(self):
+        """Test clearing materialized values."""
+        views = MaterializedViews({})
+        views.get("a", [], lambda: 1)
+
+        views.clear()
+
+        assert len(views) == 0
+
+
+class TestStatisticsViews:
+    """Tests for statistics materialized in the dataset store."""
+
+    @pytest.fixture
+    async def store(self, mock_swapi_client):
+        """Create a loaded store backed by the mock SWAPI client."""
+        return await DatasetStore(swapi=mock_swapi_client).ensure_loaded()
+
+    async def test_overview(self, store):
+        """Test the overview is computed from the store tables."""
+        overview = compute_universe_overview(store)
+
+        assert overview.total_characters == 2
+        assert overview.tallest_character == "Luke Skywalker"
+        assert overview.largest_starship == "X-wing"
+        assert overview.most_populated_planet == "Tatooine"
+        assert compute_universe_overview(store) is overview
+
+    async def test_unchanged_reload_keeps_views(self, store):
+        """Test reloading identical data does not recompute views."""
+        stats = compute_planet_statistics(store)
+
+        await store.refresh()
+
+        assert store.version == 1
+        assert compute_planet_statistics(store) is stats
+
+    async def test_recomputed_only_when_dependency_changes(self, store, mock_swapi_client):
+        """Test only views depending on a changed resource are recomputed."""
+        planets = compute_planet_statistics(store)
+        overview = compute_universe_overview(store)
+
+        people = mock_swapi_client.get_all_people.return_value
+        mock_swapi_client.get_all_people.return_value = people[:1]
+        await store.refresh()
+
+        assert store.resource_versions["people"] == 2
+        assert store.resource_versions["planets"] == 1
+        assert compute_planet_statistics(store) is planets
+        assert compute_universe_overview(store).total_characters == 1
+        assert compute_universe_overview(store) is not overview
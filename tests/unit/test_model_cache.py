@@ -0,0 +1,56 @@
+"""Tests for the parsed model cache."""
+
+from src.models.people import Person
+from src.services.model_cache import ModelCache
+
+LUKE = {
+    "id": 1,
+    "name": "Luke Skywalker",
+    "height": "172",
+    "films": ["https://swapi.dev/api/films/1/"],
+    "edited": "2014-12-20T21:17:56.891000Z",
+}
+
+
+class TestModelCache:
+    """Tests for ModelCache."""
+
+    def test_parses_once_per_version(self):
+        """Test a record is parsed once for the same (resource, id, edited)."""
+        cache = ModelCache({"people": Person})
+
+        model = cache.parse("people", LUKE)
+
+        assert isinstance(model, Person)
+        assert cache.parse("people", dict(LUKE)) is model
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_edited_change_evicts(self):
+        """Test a newer `edited` replaces the cached model."""
+        cache = ModelCache({"people": Person})
+        old = cache.parse("people", LUKE)
+
+        new = cache.parse("people", {**LUKE, "height": "180", "edited": "2015-01-01"})
+
+        assert new is not old
+        assert new.height == 180
+        assert len(cache) == 1
+        assert cache.evictions == 1
+
+    def test_discard(self):
+        """Test removed records are dropped."""
+        cache = ModelCache({"people": Person})
+        cache.parse("people", LUKE)
+
+        cache.discard("people", [1, 2])
+
+        assert len(cache) == 0
+        assert cache.evictions == 1
+
+    def test_records_without_edited_are_not_cached(self):
+        """Test records that cannot be versioned are parsed every time."""
+        cache = ModelCache({"people": Person})
+        record = {key: value for key, value in LUKE.items() if key != "edited"}
+
+        assert cache.parse("people", record) is not cache.parse("people", record)
+        assert len(cache) == 0
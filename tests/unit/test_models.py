@@ -4,9 +4,9 @@
 from datetime import date
 
 from src.models.films import Film
-from src.models.people import Person, PersonFilter
+from src.models.people import Person, PersonFilter, PersonSummary
 from src.models.planets import Planet, PlanetFilter
-from src.models.starships import Starship, StarshipFilter
+from src.models.starships import Starship, StarshipFilter, StarshipSummary
 
 
 class TestPersonModel:
@@ -340,3 +340,34 @@ class TestPlanetFilter:
 
         assert filter_ok.apply(planet) is True
         assert filter_too_small.apply(planet) is False
+
+
+class TestTrustedConstruction:
+    """Tests for building models from already validated data."""
+
+    PERSON = {
+        "name": "Luke Skywalker",
+        "hair_color": "blond",
+        "skin_color": "fair",
+        "eye_color": "blue",
+        "birth_year": "19BBY",
+        "gender": "male",
+        "homeworld": "https://swapi.dev/api/planets/1/",
+        "films": ["https://swapi.dev/api/films/1/", "https://swapi.dev/api/films/2/"],
+    }
+
+    def test_summary_from_model_matches_from_swapi(self):
+        """Test summaries built from stored models match summaries parsed from SWAPI data."""
+        person = Person.from_swapi(self.PERSON, 1)
+
+        assert PersonSummary.from_model(person) == PersonSummary.from_swapi(self.PERSON, 1)
+
+    def test_starship_summary_unknown_speed(self):
+        """Test unknown speeds are dropped from summaries of stored starships."""
+        data = {"name": "Death Star", "max_atmosphering_speed": "n/a", "hyperdrive_rating": "4.0"}
+        starship = Starship.from_swapi(data, 9)
+
+        summary = StarshipSummary.from_model(starship)
+
+        assert summary.max_atmosphering_speed is None
+        assert summary.hyperdrive_rating == 4.0
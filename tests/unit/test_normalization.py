@@ -0,0 +1,114 @@
+"""Tests for canonical parsing of SWAPI values."""
+
+import pytest
+
+from src.models.normalization import (
+    normalize,
+    parse_birth_year,
+    parse_days,
+    parse_int,
+    parse_number,
+    parse_range,
+)
+
+
+class TestParseNumber:
+    """Tests for parse_number and parse_int."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("1,358", 1358.0),
+            ("0.5", 0.5),
+            ("1000km", 1000.0),
+            ("10 MGLT", 10.0),
+            (77, 77.0),
+            ("0", 0.0),
+        ],
+    )
+    def test_numbers(self, value, expected):
+        """Test separators and units are handled."""
+        assert parse_number(value) == expected
+
+    @pytest.mark.parametrize("value", [None, "", "unknown", "N/A", "none", "indefinite", "30-165"])
+    def test_unknown(self, value):
+        """Test missing or non numeric values are None, never 0."""
+        assert parse_number(value) is None
+
+    def test_int_truncates(self):
+        """Test whole numbers truncate fractions."""
+        assert parse_int("78.2") == 78
+        assert parse_int("unknown") is None
+
+
+class TestParseRange:
+    """Tests for parse_range."""
+
+    def test_ranges(self):
+        """Test ranges and single counts."""
+        assert parse_range("30-165") == (30, 165)
+        assert parse_range("342,953") == (342953, 342953)
+        assert parse_range("n/a") == (None, None)
+
+
+class TestParseBirthYear:
+    """Tests for parse_birth_year."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("19BBY", -19.0), ("41.9BBY", -41.9), ("4ABY", 4.0), ("0BBY", 0.0), ("896 bby", -896.0)],
+    )
+    def test_years(self, value, expected):
+        """Test BBY years are negative and ABY years positive."""
+        assert parse_birth_year(value) == expected
+
+    @pytest.mark.parametrize("value", [None, "unknown", "19XYZ", "-19BBY"])
+    def test_unknown(self, value):
+        """Test missing or malformed years are None."""
+        assert parse_birth_year(value) is None
+
+
+class TestParseDays:
+    """Tests for parse_days."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("1 week", 7), ("2 months", 60), ("3 years", 1095), ("1 day", 1), ("none", 0)],
+    )
+    def test_durations(self, value, expected):
+        """Test durations are converted to days."""
+        assert parse_days(value) == expected
+
+    @pytest.mark.parametrize("value", ["unknown", "Live food tanks", "2 fortnights"])
+    def test_unknown(self, value):
+        """Test unparseable durations are None."""
+        assert parse_days(value) is None
+
+
+class TestNormalize:
+    """Tests for normalize."""
+
+    def test_starship(self):
+        """Test every canonical numeric field of a record."""
+        data = {
+            "cost_in_credits": "unknown",
+            "length": "1,600",
+            "hyperdrive_rating": "1.0",
+            "MGLT": "60",
+            "cargo_capacity": "3000000",
+            "crew": "30-165",
+            "passengers": "600",
+            "consumables": "1 year",
+        }
+
+        assert normalize("starships", data) == {
+            "cost_in_credits": None,
+            "length": 1600.0,
+            "hyperdrive_rating": 1.0,
+            "mglt": 60,
+            "cargo_capacity": 3000000,
+            "crew_min": 30,
+            "crew_max": 165,
+            "passenger_capacity": 600,
+            "consumables_days": 365.0,
+        }
@@ -1,6 +1,19 @@
 """Tests for pagination utilities."""
 
-from src.utils.pagination import get_pagination_params, paginate
+from datetime import date
+
+import pytest
+
+from src.models.base import SortOrder
+from src.services.dataset_store import ResourceTable
+from src.utils.pagination import (
+    CursorError,
+    decode_cursor,
+    encode_cursor,
+    get_pagination_params,
+    paginate,
+    paginate_cursor,
+)
 
 
 class TestPaginate:
@@ -84,6 +97,90 @@ class TestPaginate:
         assert len(result.results) == 100
 
 
+class TestPaginateCursor:
+    """Tests for paginate_cursor function."""
+
+    @pytest.fixture
+    def table(self):
+        """Films table with release dates out of ID order."""
+        dates = {
+            1: "1977-05-25",
+            2: "1980-05-17",
+            3: "1983-05-25",
+            4: "1999-05-19",
+            5: "2002-05-16",
+        }
+        return ResourceTable(
+            "films",
+            [
+                {"id": i, "title": f"Film {i}", "episode_id": 7 - i, "release_date": d}
+                for i, d in dates.items()
+            ],
+        )
+
+    def walk(self, table, items, **kwargs):
+        pages, cursor = [], ""
+        while cursor is not None:
+            result = paginate_cursor(table, items, cursor, lambda f: f.id, page_size=2, **kwargs)
+            pages.append(result.results)
+            cursor = result.next_cursor
+        return pages
+
+    def test_pages(self, table):
+        """Test walking every page through the cursors."""
+        films = list(table.models.values())
+
+        assert self.walk(table, films) == [[1, 2], [3, 4], [5]]
+        assert self.walk(table, films, sort_by="release_date", sort_order=SortOrder.DESC) == [
+            [5, 4],
+            [3, 2],
+            [1],
+        ]
+
+    def test_filtered_items(self, table):
+        """Test only the given items are paginated."""
+        films = [table.models[i] for i in (2, 3, 5)]
+
+        assert self.walk(table, films, sort_by="episode_id") == [[5, 3], [2]]
+
+    def test_first_page_metadata(self, table):
+        """Test page metadata of the first page."""
+        result = paginate_cursor(table, list(table.models.values()), "", lambda f: f.id, 2)
+
+        assert (result.count, result.page, result.total_pages) == (5, 1, 3)
+        assert result.has_next is True
+        assert result.has_previous is False
+
+    def test_resumes_by_key_after_changes(self, table):
+        """Test a cursor resumes after its key when the table changed."""
+        films = list(table.models.values())
+        first = paginate_cursor(table, films, "", lambda f: f.id, 2, version=1)
+
+        del table.models[1], table.models[3]
+        table._derived.clear()
+        second = paginate_cursor(
+            table, list(table.models.values()), first.next_cursor, lambda f: f.id, 2, version=2
+        )
+
+        assert second.results == [4, 5]
+        assert second.page == 2
+
+    def test_sort_mismatch(self, table):
+        """Test a cursor cannot be reused with another sort."""
+        first = paginate_cursor(table, list(table.models.values()), "", lambda f: f.id, 2)
+
+        with pytest.raises(CursorError):
+            paginate_cursor(table, [], first.next_cursor, lambda f: f.id, sort_by="title")
+
+    def test_cursor_round_trip(self):
+        """Test cursors are opaque strings decoding to their state."""
+        state = {"key": (0, date(1977, 5, 25)), "id": 1}
+
+        assert decode_cursor(encode_cursor(state)) == state
+        with pytest.raises(CursorError):
+            decode_cursor("not a cursor")
+
+
 class TestGetPaginationParams:
     """Tests for get_pagination_params function."""
 
@@ -0,0 +1,64 @@
+"""Tests for sparse fieldsets."""
+
+import json
+
+import pytest
+from fastapi import Response
+
+from src.models.films import Film
+from src.services.projection import ProjectionError, parse_fields, project, respond
+
+FILM = Film.from_swapi(
+    {
+        "title": "A New Hope",
+        "episode_id": 4,
+        "director": "George Lucas",
+        "release_date": "1977-05-25",
+        "characters": ["https://swapi.dev/api/people/1/"],
+    },
+    1,
+)
+
+
+class TestParseFields:
+    """Tests for parse_fields."""
+
+    def test_fields_in_model_order_with_id(self):
+        """Test the fieldset is ordered like the model and always has the ID."""
+        assert parse_fields("films", " release_date, title") == ("id", "title", "release_date")
+
+    @pytest.mark.parametrize("fields", ["title,budget", ",", ""])
+    def test_invalid_fields(self, fields):
+        """Test unknown or empty fieldsets are rejected."""
+        with pytest.raises(ProjectionError):
+            parse_fields("films", fields)
+
+
+class TestProject:
+    """Tests for project and respond."""
+
+    def test_project(self):
+        """Test only the selected attributes are read."""
+        projection = parse_fields("films", "title,character_ids")
+
+        assert project(FILM, projection) == {"id": 1, "title": "A New Hope", "character_ids": [1]}
+
+    def test_respond_serializes_projections(self):
+        """Test projected content is serialized directly."""
+        projection = parse_fields("films", "release_date")
+
+        response = respond({"results": [project(FILM, projection)]}, projection)
+
+        assert isinstance(response, Response)
+        assert json.loads(response.body) == {"results": [{"id": 1, "release_date": "1977-05-25"}]}
+
+    def test_respond_without_projection(self):
+        """Test content is returned as is without a projection."""
+        assert respond(FILM, None) is FILM
+
+    def test_respond_serializes_expansions(self):
+        """Test expanded content is serialized directly, even without a projection."""
+        response = respond({"id": 1, "planets": []}, None, (("planets", ()),))
+
+        assert isinstance(response, Response)
+        assert json.loads(response.body) == {"id": 1, "planets": []}
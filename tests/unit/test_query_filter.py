@@ -0,0 +1,174 @@
+"""Tests for the filter expression language."""
+
+import pytest
+
+from src.services.dataset_store import ResourceTable
+from src.services.query_filter import (
+    And,
+    FilterError,
+    compile_filter,
+    count_facets,
+    select,
+    select_rows,
+)
+
+PEOPLE = [
+    {"id": 1, "name": "Luke Skywalker", "height": "172", "mass": "77", "gender": "male",
+     "eye_color": "blue", "hair_color": "blond", "films": ["https://swapi.dev/api/films/1/"]},
+    {"id": 2, "name": "C-3PO", "height": "167", "mass": "75", "gender": "n/a",
+     "eye_color": "yellow", "hair_color": "n/a", "films": ["https://swapi.dev/api/films/1/"]},
+    {"id": 4, "name": "Darth Vader", "height": "202", "mass": "136", "gender": "male",
+     "eye_color": "yellow", "hair_color": "none", "films": []},
+    {"id": 5, "name": "Leia Organa", "height": "150", "mass": "49", "gender": "female",
+     "eye_color": "brown", "hair_color": "brown", "films": []},
+    {"id": 13, "name": "Chewbacca", "height": "228", "mass": "1,358", "gender": "male",
+     "eye_color": "blue", "hair_color": "brown, grey", "films": []},
+    {"id": 99, "name": "Mystery", "height": "unknown", "mass": "unknown", "gender": "unknown",
+     "eye_color": "unknown", "hair_color": "unknown", "films": []},
+]  # fmt: skip
+
+
+@pytest.fixture
+def table():
+    """People table built from raw records."""
+    return ResourceTable("people", PEOPLE)
+
+
+def ids(table: ResourceTable, expression: str) -> list[int]:
+    return [p.id for p in select(table, expression)]
+
+
+class TestFilterExpressions:
+    """Tests for filter evaluation."""
+
+    def test_comparisons(self, table):
+        """Test numeric comparisons use the sorted columns."""
+        assert ids(table, "height > 200") == [4, 13]
+        assert ids(table, "height >= 202") == [4, 13]
+        assert ids(table, "height <= 167") == [2, 5]
+        assert ids(table, "mass = 1358") == [13]
+        assert ids(table, "mass != 77") == [2, 4, 5, 13]
+
+    def test_categorical_values(self, table):
+        """Test equality on categorical fields, case-insensitive and split on commas."""
+        assert ids(table, "gender = MALE") == [1, 4, 13]
+        assert ids(table, "hair_color = grey") == [13]
+        assert ids(table, "eye_color IN (blue, 'yellow')") == [1, 2, 4, 13]
+        assert ids(table, "eye_color != yellow") == [1, 5, 13, 99]
+        assert ids(table, "hair_color CONTAINS 'brown, g'") == [13]
+
+    def test_boolean_operators(self, table):
+        """Test AND, OR, NOT and parentheses."""
+        assert ids(table, "gender = male AND height < 200") == [1]
+        assert ids(table, "gender = female OR height > 220") == [5, 13]
+        assert ids(table, "NOT gender = male") == [2, 5, 99]
+        assert ids(table, "gender = male and (height > 220 or name contains sky)") == [1, 13]
+
+    def test_range_and_contains(self, table):
+        """Test BETWEEN, CONTAINS on strings and on ID lists."""
+        assert ids(table, "height BETWEEN 160 AND 175") == [1, 2]
+        assert ids(table, "name CONTAINS 'darth'") == [4]
+        assert ids(table, "film_ids CONTAINS 1") == [1, 2]
+
+    def test_unknown_values_never_match(self, table):
+        """Test unknown values are excluded from comparisons."""
+        assert 99 not in ids(table, "height < 1000")
+        assert 99 not in ids(table, "mass != 1")
+
+    def test_no_expression(self, table):
+        """Test no expression returns every model."""
+        assert len(select(table, None)) == len(PEOPLE)
+
+    def test_candidate_rows(self, table):
+        """Test results are restricted to candidate rows."""
+        males = table.match("gender", "male")
+
+        assert [p.id for p in select(table, None, males)] == [1, 4, 13]
+        assert [p.id for p in select(table, "height > 200", males)] == [4, 13]
+        assert [p.id for p in select(table, "eye_color = blue", males & ~0b1)] == [13]
+
+
+class TestFilterPlans:
+    """Tests for compiled plans."""
+
+    def test_plan_is_cached(self):
+        """Test an expression is compiled once."""
+        assert compile_filter("people", "height > 1") is compile_filter("people", "height > 1")
+
+    def test_index_and_scan_predicates(self):
+        """Test which predicates are answered from indexes."""
+        plan = compile_filter("people", "gender = male AND name CONTAINS sky AND height > 1")
+
+        assert isinstance(plan.root, And)
+        assert [child.indexed for child in plan.root.children] == [True, False, True]
+        assert compile_filter("planets", "climate CONTAINS 'arid, t'").root.indexed
+        assert plan.root.cost == 1
+
+    def test_scan_only_sees_indexed_matches(self, table, monkeypatch):
+        """Test scanning predicates only run on rows left by the indexes."""
+        plan = compile_filter("people", "name CONTAINS a AND height > 200")
+        scan = plan.root.children[0]
+        seen = []
+        original = scan.matches
+        monkeypatch.setattr(scan, "matches", lambda model: seen.append(model.id) or original(model))
+
+        assert [p.id for p in plan.select(table)] == [4, 13]
+        assert seen == [4, 13]
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "",
+            "height >",
+            "height > 1 AND",
+            "(height > 1",
+            "unknown_field = 1",
+            "name < 3",
+            "height = tall",
+            "height CONTAINS 1",
+            "film_ids = 1",
+            "height ~ 1",
+        ],
+    )
+    def test_invalid_expressions(self, expression):
+        """Test invalid expressions raise FilterError."""
+        with pytest.raises(FilterError):
+            compile_filter("people", expression)
+
+
+class TestCountFacets:
+    """Tests for count_facets."""
+
+    def test_counts_over_matching_rows(self, table):
+        """Test facets count the values of the matching rows only."""
+        facets = count_facets(table, select_rows(table, "height > 160"), "gender, hair_color")
+
+        assert facets == {
+            "gender": {"male": 3, "n/a": 1},
+            "hair_color": {"blond": 1, "brown": 1, "grey": 1, "n/a": 1, "none": 1},
+        }
+
+    def test_all_models(self, table):
+        """Test facets over the whole table."""
+        facets = count_facets(table, select_rows(table, None), "eye_color")
+
+        assert facets == {"eye_color": {"blue": 2, "yellow": 2, "brown": 1, "unknown": 1}}
+
+    def test_counts_within_candidates(self, table):
+        """Test facets count the rows of the given bitmap, candidates included."""
+        tall = table.within("height", 170, None)
+        rows = select_rows(table, "eye_color = blue", tall)
+
+        assert [p.id for p in table.models_of(rows)] == [1, 13]
+        assert count_facets(table, rows, "hair_color") == {
+            "hair_color": {"blond": 1, "brown": 1, "grey": 1}
+        }
+
+    def test_not_requested(self, table):
+        """Test no facets are computed unless requested."""
+        assert count_facets(table, 0, None) is None
+
+    def test_invalid_field(self, table):
+        """Test non categorical fields are rejected."""
+        with pytest.raises(FilterError):
+            count_facets(table, 0, "height")
@@ -0,0 +1,107 @@
+"""Tests for the relationship index."""
+
+from src.models.films import Film
+from src.models.people import Person
+from src.models.planets import Planet
+from src.services.relation_index import Adjacency, RelationIndex
+from tests.conftest import SAMPLE_FILM, SAMPLE_PERSON
+
+
+class TestAdjacency:
+    """Tests for the CSR adjacency."""
+
+    def test_neighbors_sorted_and_deduplicated(self):
+        """Test targets are sorted and duplicates removed."""
+        adjacency = Adjacency([(1, 5), (1, 3), (2, 4), (1, 5)])
+
+        assert adjacency.neighbors(1).tolist() == [3, 5]
+        assert adjacency.neighbors(2).tolist() == [4]
+        assert adjacency.degree(1) == 2
+        assert len(adjacency) == 3
+
+    def test_set_row(self):
+        """Test replacing a row and compacting the garbage it leaves."""
+        adjacency = Adjacency([(1, 5), (1, 3), (2, 4)])
+
+        adjacency.set_row(1, [7, 3, 7])
+        adjacency.set_row(2, [])
+
+        assert adjacency.neighbors(1).tolist() == [3, 7]
+        assert adjacency.degree(2) == 0
+        assert len(adjacency) == 2
+        assert len(adjacency.targets) == 2
+
+    def test_missing_source(self):
+        """Test a source without links."""
+        adjacency = Adjacency([(1, 5)])
+
+        assert adjacency.neighbors(99).tolist() == []
+        assert adjacency.degree(99) == 0
+
+
+class TestRelationIndex:
+    """Tests for RelationIndex."""
+
+    def _build(self) -> RelationIndex:
+        person = Person.from_swapi(SAMPLE_PERSON, 1)
+        droid = Person.from_swapi({**SAMPLE_PERSON, "name": "R2-D2", "films": []}, 3)
+        film = Film.from_swapi(
+            {
+                **SAMPLE_FILM,
+                "characters": [
+                    "https://swapi.dev/api/people/1/",
+                    "https://swapi.dev/api/people/3/",
+                ],
+            },
+            1,
+        )
+        planet = Planet.from_swapi({"name": "Tatooine", "residents": [], "films": []}, 1)
+        return RelationIndex.build(
+            {"people": {1: person, 3: droid}, "films": {1: film}, "planets": {1: planet}}
+        )
+
+    def test_both_directions(self):
+        """Test links are indexed from both sides."""
+        index = self._build()
+
+        assert index.related_ids("films", 1, "people") == [1, 3]
+        assert index.related_ids("people", 1, "films") == [1]
+        # Only the film lists R2-D2, the reverse link is still available
+        assert index.related_ids("people", 3, "films") == [1]
+
+    def test_homeworld(self):
+        """Test single ID fields such as homeworld."""
+        index = self._build()
+
+        assert index.related_ids("people", 1, "planets") == [1]
+        assert index.related_ids("planets", 1, "people") == [1, 3]
+
+    def test_unknown_pair(self):
+        """Test pairs without links return nothing."""
+        index = self._build()
+
+        assert index.related_ids("vehicles", 1, "people") == []
+
+    def test_update(self):
+        """Test replacing the links declared by a model."""
+        index = self._build()
+        luke = Person.from_swapi({**SAMPLE_PERSON, "films": [], "homeworld": None}, 1)
+
+        touched = index.update("people", {1: Person.from_swapi(SAMPLE_PERSON, 1)}, {1: luke})
+
+        # The film still lists Luke, so only the homeworld link disappears
+        assert index.related_ids("people", 1, "films") == [1]
+        assert index.related_ids("planets", 1, "people") == [3]
+        assert touched == {("people", "planets", 1), ("planets", "people", 1)}
+
+    def test_update_removed_model(self):
+        """Test removing a model drops the links only it declared."""
+        index = self._build()
+        film = Film.from_swapi(
+            {**SAMPLE_FILM, "characters": ["https://swapi.dev/api/people/3/"]}, 1
+        )
+
+        index.update("films", {1: film}, {})
+
+        assert index.related_ids("people", 3, "films") == []
+        assert index.related_ids("films", 1, "people") == [1]
@@ -0,0 +1,107 @@
+"""Tests for the full-text search index."""
+
+from src.services.search_index import SearchIndex, tokenize, trigrams
+
+RECORDS = {
+    "people": [
+        {"id": 1, "name": "Luke Skywalker"},
+        {"id": 4, "name": "Darth Vader"},
+        {"id": 11, "name": "Anakin Skywalker"},
+    ],
+    "starships": [
+        {"id": 10, "name": "Millennium Falcon", "model": "YT-1300 light freighter"},
+        {"id": 12, "name": "X-wing", "model": "T-65 X-wing", "starship_class": "Starfighter"},
+    ],
+    "films": [{"id": 1, "title": "A New Hope", "director": "George Lucas"}],
+}
+
+
+class TestTokenize:
+    """Tests for tokenization helpers."""
+
+    def test_tokenize(self):
+        """Test tokens are lowercase and split on punctuation."""
+        assert tokenize("T-65 X-wing") == ["t", "65", "x", "wing"]
+
+    def test_trigrams(self):
+        """Test padded and unpadded trigrams."""
+        assert trigrams("sky", padded=False) == {"sky"}
+        assert trigrams("sky") == {"  s", " sk", "sky", "ky "}
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex."""
+
+    def test_exact_match(self):
+        """Test exact token matches."""
+        index = SearchIndex.build(RECORDS)
+
+        hits = index.search("vader")
+
+        assert [(h.resource, h.id) for h in hits] == [("people", 4)]
+
+    def test_prefix_and_infix(self):
+        """Test prefix and substring matches."""
+        index = SearchIndex.build(RECORDS)
+
+        assert {h.id for h in index.search("sky", resources=["people"])} == {1, 11}
+        assert {h.id for h in index.search("walker", resources=["people"])} == {1, 11}
+
+    def test_short_infix(self):
+        """Test queries too short for trigrams still match inside tokens."""
+        index = SearchIndex.build(RECORDS)
+
+        assert {h.id for h in index.search("ak", resources=["people"])} == {11}
+        assert {h.id for h in index.search("er", resources=["people"])} == {1, 4, 11}
+
+    def test_typo_tolerance(self):
+        """Test misspelled queries still match."""
+        index = SearchIndex.build(RECORDS)
+
+        hits = index.search("milenium falcon")
+
+        assert hits[0].id == 10
+        assert hits[0].name == "Millennium Falcon"
+
+    def test_ranking_prefers_all_tokens(self):
+        """Test results matching every query token rank first."""
+        index = SearchIndex.build(RECORDS)
+
+        hits = index.search("luke skywalker", resources=["people"])
+
+        assert hits[0].id == 1
+        assert hits[1].id == 11
+
+    def test_other_fields_and_resources(self):
+        """Test models, classes and titles are searchable."""
+        index = SearchIndex.build(RECORDS)
+
+        assert index.search("freighter")[0].id == 10
+        assert index.search("starfighter")[0].id == 12
+        assert index.search("hope")[0].resource == "films"
+
+    def test_resource_filter_and_limit(self):
+        """Test filtering by resource and limiting results."""
+        index = SearchIndex.build(RECORDS)
+
+        assert index.search("skywalker", resources=["starships"]) == []
+        assert len(index.search("skywalker", limit=1)) == 1
+
+    def test_no_match(self):
+        """Test queries without matches."""
+        index = SearchIndex.build(RECORDS)
+
+        assert index.search("qqqq") == []
+        assert index.search("") == []
+
+    def test_add_and_remove(self):
+        """Test indexing and removing single records."""
+        index = SearchIndex.build(RECORDS)
+
+        index.remove("people", {"id": 4, "name": "Darth Vader"})
+        index.add("people", {"id": 44, "name": "Darth Maul"})
+
+        assert index.search("vader") == []
+        assert [h.id for h in index.search("darth")] == [44]
+        assert [h.id for h in index.search("maul")] == [44]
+        assert len(index) == 6
@@ -0,0 +1,98 @@
+"""Tests for nearest neighbour search."""
+
+import math
+
+import pytest
+
+from src.services.dataset_store import ResourceTable
+from src.services.similarity import FeatureMatrix, SimilarityError, parse_features
+
+PEOPLE = [
+    {"id": 1, "name": "Luke Skywalker", "height": "172", "mass": "77", "gender": "male",
+     "eye_color": "blue", "hair_color": "blond", "skin_color": "fair"},
+    {"id": 2, "name": "C-3PO", "height": "167", "mass": "75", "gender": "n/a",
+     "eye_color": "yellow", "hair_color": "n/a", "skin_color": "gold"},
+    {"id": 4, "name": "Darth Vader", "height": "202", "mass": "136", "gender": "male",
+     "eye_color": "yellow", "hair_color": "none", "skin_color": "white"},
+    {"id": 5, "name": "Leia Organa", "height": "150", "mass": "49", "gender": "female",
+     "eye_color": "brown", "hair_color": "brown", "skin_color": "light"},
+    {"id": 99, "name": "Mystery", "height": "180", "mass": "unknown", "gender": "unknown",
+     "eye_color": "unknown", "hair_color": "unknown", "skin_color": "unknown"},
+]  # fmt: skip
+
+PLANETS = [
+    {"id": 1, "name": "Tatooine", "climate": "arid", "population": "200000"},
+    {"id": 2, "name": "Alderaan", "climate": "temperate", "population": "2000000000"},
+    {"id": 3, "name": "Yavin IV", "climate": "temperate, tropical", "population": "1000"},
+]
+
+
+@pytest.fixture
+def matrix():
+    """Feature matrix of a small people table."""
+    return FeatureMatrix(ResourceTable("people", PEOPLE))
+
+
+class TestFeatureMatrix:
+    """Tests for FeatureMatrix."""
+
+    def test_numeric_scaled_to_range(self, matrix):
+        """Test numeric features are scaled to [0, 1], unknown values kept as NaN."""
+        height = matrix.numeric["height"]
+
+        assert height[matrix.ids.index(5)] == 0.0
+        assert height[matrix.ids.index(4)] == 1.0
+        assert math.isnan(matrix.numeric["mass"][matrix.ids.index(99)])
+
+    def test_heavy_tails_use_log_scale(self):
+        """Test fields spanning many orders of magnitude are compared on a log scale."""
+        matrix = FeatureMatrix(ResourceTable("planets", PLANETS))
+        population = matrix.numeric["population"]
+
+        assert population[matrix.ids.index(1)] == pytest.approx(
+            (math.log10(200_000) - 3) / (9 + math.log10(2) - 3)
+        )
+
+    def test_nearest_order_and_contributions(self, matrix):
+        """Test neighbours are ordered by distance and contributions add up to it."""
+        neighbors = matrix.nearest(1, ["mass", "gender"], limit=3)
+
+        assert [n.id for n in neighbors] == [4, 2, 5]
+        assert [n.distance for n in neighbors] == sorted(n.distance for n in neighbors)
+        for neighbor in neighbors:
+            assert sum(neighbor.contributions.values()) == pytest.approx(neighbor.distance)
+
+    def test_unknown_values_are_skipped(self, matrix):
+        """Test unknown values do not count towards the distance."""
+        neighbors = matrix.nearest(1, ["height", "gender"], limit=10)
+        mystery = next(n for n in neighbors if n.id == 99)
+
+        assert mystery.contributions["gender"] is None
+        assert mystery.distance == pytest.approx(mystery.contributions["height"])
+        assert 99 not in [n.id for n in matrix.nearest(1, ["mass"], limit=10)]
+
+    def test_list_values_use_jaccard(self):
+        """Test multi-valued categorical fields are compared by overlap."""
+        matrix = FeatureMatrix(ResourceTable("planets", PLANETS))
+        distances = matrix.distances(matrix.ids.index(2), ["climate"])["climate"]
+
+        assert distances[matrix.ids.index(1)] == 1.0
+        assert distances[matrix.ids.index(3)] == 0.5
+
+
+class TestParseFeatures:
+    """Tests for parse_features."""
+
+    def test_defaults_to_all(self, matrix):
+        """Test that no selection means every feature but the birth year."""
+        assert "birth_year_aby" in matrix.features
+        assert parse_features(matrix, []) == [
+            feature for feature in matrix.features if feature != "birth_year_aby"
+        ]
+        assert parse_features(matrix, ["mass", " height", "mass"]) == ["mass", "height"]
+        assert parse_features(matrix, ["birth_year_aby"]) == ["birth_year_aby"]
+
+    def test_invalid(self, matrix):
+        """Test unknown features are rejected."""
+        with pytest.raises(SimilarityError, match="name"):
+            parse_features(matrix, ["height", "name"])
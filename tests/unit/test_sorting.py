@@ -1,6 +1,7 @@
 """Tests for sorting utilities."""
 
-from src.utils.sorting import SortOrder, sort_items
+from src.models.people import Person
+from src.utils.sorting import PEOPLE_SORT_KEYS, SortOrder, sort_items
 
 
 class TestSortItems:
@@ -76,3 +77,38 @@ class TestSortItems:
         """Test sorting empty list."""
         result = sort_items([], sort_by="name")
         assert result == []
+
+    def test_sort_birth_year_in_universe_order(self):
+        """Test birth years sort by in-universe year, not as strings."""
+        items = [
+            {"birth_year": "19BBY"},
+            {"birth_year": "unknown"},
+            {"birth_year": "4ABY"},
+            {"birth_year": "41.9BBY"},
+            {"birth_year": "112BBY"},
+        ]
+
+        result = sort_items(items, sort_by="birth_year", key_mapper=PEOPLE_SORT_KEYS)
+
+        assert [item["birth_year"] for item in result] == [
+            "112BBY",
+            "41.9BBY",
+            "19BBY",
+            "4ABY",
+            "unknown",
+        ]
+
+    def test_sort_birth_year_reads_parsed_year_on_models(self):
+        """Test models sort by the birth year parsed at ingest."""
+        people = [
+            Person.from_swapi({"name": name, "birth_year": year}, person_id)
+            for person_id, (name, year) in enumerate(
+                [("Luke", "19BBY"), ("Yoda", "896BBY"), ("Ben", "5ABY")], start=1
+            )
+        ]
+        # The raw string is not parsed again
+        people[0] = people[0].model_copy(update={"birth_year": "unknown"})
+
+        result = sort_items(people, sort_by="birth_year", key_mapper=PEOPLE_SORT_KEYS)
+
+        assert [person.name for person in result] == ["Yoda", "Luke", "Ben"]
@@ -0,0 +1,98 @@
+"""Tests for the timeline index."""
+
+import pytest
+
+from src.services.dataset_store import MembershipColumn, ResourceTable, SortedColumn
+from src.services.relation_index import Adjacency
+from src.services.timeline_index import (
+    TimelineIndex,
+    age_at,
+    ages_between,
+    born_between,
+    film_era,
+    format_year,
+    generations,
+)
+
+FILMS = [
+    {"id": 1, "title": "A New Hope", "episode_id": 4, "release_date": "1977-05-25"},
+    {"id": 4, "title": "The Phantom Menace", "episode_id": 1, "release_date": "1999-05-19"},
+    {"id": 6, "title": "Revenge of the Sith", "episode_id": 3, "release_date": "2005-05-19"},
+    {"id": 7, "title": "Untitled", "episode_id": 7},
+]
+PEOPLE = [
+    {"id": 1, "name": "Luke Skywalker", "birth_year": "19BBY"},
+    {"id": 10, "name": "Obi-Wan Kenobi", "birth_year": "57BBY"},
+    {"id": 99, "name": "Extra", "birth_year": "unknown"},
+]
+
+
+@pytest.fixture
+def index():
+    """Timeline of three characters over four films."""
+    people = ResourceTable("people", PEOPLE)
+    links = Adjacency([(1, 1), (1, 6), (10, 4), (10, 1), (10, 6)])
+    # Film bits in episode order, as built by the dataset store
+    membership = MembershipColumn(people.row_ids(), [4, 6, 1, 7], links)
+    return TimelineIndex(people, ResourceTable("films", FILMS), membership)
+
+
+class TestTimelineIndex:
+    """Tests for TimelineIndex."""
+
+    def test_film_orders(self, index):
+        """Test release and chronological order tables."""
+        assert [f["id"] for f in index.release_order] == [1, 4, 6, 7]
+        assert [f["id"] for f in index.chronological] == [4, 6, 1, 7]
+        assert index.chronological[0]["era"] == "Prequel Era"
+
+    def test_journeys(self, index):
+        """Test journeys are in episode order and bucketed by era."""
+        journey = index.journeys[10]
+
+        assert journey["character"]["name"] == "Obi-Wan Kenobi"
+        assert [step["episode_id"] for step in journey["journey"]] == [1, 3, 4]
+        assert journey["eras"] == {"Prequel Era": [1, 3], "Original Trilogy": [4]}
+        assert index.journeys[99]["total_films"] == 0
+
+    def test_film_era(self):
+        """Test eras by episode."""
+        assert film_era(2) == "Prequel Era"
+        assert film_era(6) == "Original Trilogy"
+        assert film_era(0) == "Unknown"
+
+
+class TestBirthYears:
+    """Tests for the birth-year queries."""
+
+    # Yoda, Obi-Wan, Luke, Leia, Ben
+    COLUMN = SortedColumn([(-896.0, 20), (-57.0, 10), (-19.0, 1), (-19.0, 5), (5.0, 30)])
+
+    def test_born_between(self):
+        """Test inclusive ranges with open ends."""
+        assert born_between(self.COLUMN, -60, -19) == [10, 1, 5]
+        assert born_between(self.COLUMN, None, -57) == [20, 10]
+        assert born_between(self.COLUMN, 0, None) == [30]
+
+    def test_generations(self):
+        """Test buckets are aligned on multiples of the width and cover every year."""
+        buckets = generations(self.COLUMN, 25)
+
+        assert (buckets[0].start, buckets[0].end, buckets[0].count) == (-900, -875, 1)
+        assert [(b.start, b.count) for b in buckets[-3:]] == [(-50, 0), (-25, 2), (0, 1)]
+        assert sum(b.count for b in buckets) == len(self.COLUMN)
+        assert generations(SortedColumn([]), 25) == []
+
+    def test_ages(self):
+        """Test ages at a year, by character and by range."""
+        assert age_at(-19.0, 0) == 19
+        assert age_at(5.0, 0) is None
+        assert age_at(None, 0) is None
+        assert ages_between(self.COLUMN, 0, 18, 60) == [10, 1, 5]
+        assert ages_between(self.COLUMN, 0, None, None) == [20, 10, 1, 5]
+
+    def test_format_year(self):
+        """Test BBY/ABY notation."""
+        assert format_year(-41.9) == "41.9BBY"
+        assert format_year(0) == "0BBY"
+        assert format_year(4) == "4ABY"